@@ -1,3 +1,26 @@
+"""
+app.py
+------
+Streamlit dashboard for GreenScore.
+
+NOTE:
+- Streamlit re-executes this script on every interaction, so only light
+  modules are imported at the top. The pipeline (CodeCarbon) and Plotly
+  are imported on first use through load_module, which is cached per
+  server process and records how long each import took
+- The sidebar lists models by name and cost class only; scikit-learn
+  is imported when a run resolves its models (models/registry.py),
+  before anything is measured
+- The import-time profile is shown in the "Debug" panel at the bottom
+"""
+
+import importlib
+import json
+import time
+
+_started = time.perf_counter()
+
+import pandas as pd
 import streamlit as st
 
 from dashboard.ui_components import (
@@ -8,13 +31,18 @@ from dashboard.ui_components import (
     render_recommendation,
 )
 
-from dashboard.plots import (
-    plot_accuracy_vs_carbon,
-    plot_greenscore_bar,
+from utils.metrics import (
+    DEFAULT_HISTORY_DB,
+    GREENSCORE_WEIGHT_KEYS,
+    compute_greenscore,
+    list_history_datasets,
+    load_history_page,
+    mark_pareto,
+    summarize_history,
+    winner_map,
 )
 
-from utils.metrics import load_results_csv
-from pipeline.run_pipeline import run_pipeline
+_startup_seconds = time.perf_counter() - _started
 
 
 st.set_page_config(
@@ -23,6 +51,33 @@ st.set_page_config(
     layout="wide",
 )
 
+
+# -------------------------------------------------
+# Lazy Imports
+# -------------------------------------------------
+@st.cache_resource
+def import_profile() -> dict:
+    # {module: seconds}, shared by every session of this server process
+    return {"app (top-level imports)": _startup_seconds}
+
+
+@st.cache_resource
+def load_module(name: str):
+    """
+    Imports a module once per server process and records its import time.
+    """
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    import_profile()[name] = time.perf_counter() - started
+    return module
+
+
+@st.cache_resource
+def get_job_queue():
+    # One queue per server process, shared by every session
+    return load_module("pipeline.jobs").JobQueue()
+
+
 inject_custom_css()
 render_intro()
 
@@ -31,56 +86,263 @@ render_intro()
     selected_models,
     weights,
     run_clicked,
-    custom_df,
+    uploaded_file,
     target_column,
+    feature_columns,
+    run_options,
 ) = render_sidebar()
 
 
+total = sum(weights.values())
+if total > 0:
+    weights = {k: v / total for k, v in weights.items()}
+
 if run_clicked:
 
-    total = sum(weights.values())
-    if total > 0:
-        weights = {k: v / total for k, v in weights.items()}
+    job_queue = get_job_queue()
+    waiting = job_queue.waiting()
+    if waiting:
+        st.info(f"⏳ {waiting} evaluation(s) queued ahead of yours.")
 
     try:
         with st.spinner("Evaluating models using GreenScore..."):
-            run_pipeline(
+            result = job_queue.submit(
                 dataset_mode=dataset_mode,
                 selected_models=selected_models,
                 weights=weights,
-                uploaded_file=custom_df,
+                uploaded_file=uploaded_file,
                 target_column=target_column,
-            )
+                feature_columns=feature_columns,
+                history_db=DEFAULT_HISTORY_DB,
+                **run_options,
+            ).result()
 
+        # Keep raw measurements so slider changes only re-score
+        st.session_state["raw_results"] = result.raw
+        st.session_state["run_metadata"] = result.metadata
+        st.session_state["repetitions"] = result.repetitions
+        st.session_state["inference"] = result.inference
+        st.session_state["learning_curve"] = result.learning_curve
+        st.session_state["projection"] = result.projection
+        st.session_state["search"] = result.search
+        st.session_state["baseline"] = result.baseline
+        st.session_state["profile"] = result.profile
+        # The new run goes on top of the history pages
+        st.session_state.pop("history_pages", None)
         st.success("Green evaluation completed successfully 🌱")
 
     except Exception as e:
         st.error(f"❌ Error during evaluation: {e}")
         st.stop()
 
-    results_df = load_results_csv()
+raw_results = st.session_state.get("raw_results")
+
+if raw_results is not None:
+
+    baseline = st.session_state.get("baseline")
+    results_df = mark_pareto(compute_greenscore(raw_results, weights, baseline))
     results_df = results_df.sort_values("GreenScore", ascending=False)
+    plots = load_module("dashboard.plots")
 
     st.markdown("## 📊 Model Comparison")
     st.dataframe(results_df, use_container_width=True)
 
+    st.caption(
+        "⭐ Pareto Optimal models are not beaten on accuracy, energy, CO₂ "
+        "and time at once by any other model; this does not depend on "
+        "the weights."
+    )
+
+    if baseline is not None:
+        st.caption(
+            f"📏 Scored against this dataset's {baseline.mode} baseline "
+            f"({len(baseline.runs)} runs), so GreenScores are comparable "
+            "across runs."
+        )
+
+    if (results_df.get("Source") == "cached").any():
+        st.caption(
+            "♻️ Rows with Source = cached were replayed from an earlier "
+            "identical run; their energy and CO₂ were not measured now."
+        )
+
+    if results_df.get("Budget Limited", pd.Series(dtype=bool)).any():
+        st.caption(
+            "⏱️ Rows with Budget Limited = True hit a training budget; "
+            "they are scored as trained so far."
+        )
+
+    preprocess_info = st.session_state.get("run_metadata", {}).get("preprocess")
+    if preprocess_info:
+        st.caption(
+            f"🧮 Preprocessing peak memory: "
+            f"{preprocess_info['peak_bytes'] / 1024 ** 2:.2f} MB "
+            f"({preprocess_info['dtype']})"
+        )
+
+    streaming_info = st.session_state.get("run_metadata", {}).get("streaming")
+    if streaming_info:
+        st.caption(
+            f"🌊 Trained out of core on {streaming_info['train_rows']:,} rows "
+            f"(tested on {streaming_info['test_rows']:,}) in chunks of "
+            f"{streaming_info['chunksize']:,}; Logistic Regression runs as "
+            "SGD with the logistic loss."
+            + (
+                f" Skipped (no partial_fit): {', '.join(streaming_info['skipped'])}."
+                if streaming_info["skipped"] else ""
+            )
+        )
+
+    repetitions_df = st.session_state.get("repetitions")
+    if repetitions_df is not None:
+        st.markdown("## 🔬 Repeated Measurements")
+        st.caption(
+            "Medians with IQR and 95% bootstrap confidence intervals. "
+            "Models tied with the best cannot be told apart at this "
+            "number of repetitions."
+        )
+        benchmark = load_module("pipeline.benchmark")
+        st.dataframe(
+            benchmark.rank_with_significance(repetitions_df, weights),
+            use_container_width=True
+        )
+        st.dataframe(
+            benchmark.summarize_repetitions(repetitions_df),
+            use_container_width=True
+        )
+
+    search_df = st.session_state.get("search")
+    if search_df is not None:
+        st.markdown("## 🔎 Hyperparameter Search")
+        st.caption(
+            f"{len(search_df)} trials, "
+            f"{search_df['Energy (kWh)'].sum():.6f} kWh in total. "
+            "Promoted trials advanced to the next rung; the best final "
+            "configuration of each model was used above."
+        )
+        st.dataframe(
+            search_df.astype({"Params": str}),
+            use_container_width=True
+        )
+
+    curve_df = st.session_state.get("learning_curve")
+    if curve_df is not None:
+        st.markdown("## 📉 Learning Curves")
+        st.caption(
+            "Rows with Source = projected were pruned: their projected "
+            "full-size result is dominated by another model, so they were "
+            "never trained on the full data."
+        )
+        st.dataframe(st.session_state.get("projection"), use_container_width=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(
+                plots.plot_learning_curve(curve_df, "Energy (kWh)"),
+                use_container_width=True
+            )
+        with col2:
+            st.plotly_chart(
+                plots.plot_learning_curve(curve_df, "Accuracy"),
+                use_container_width=True
+            )
+
+    inference_df = st.session_state.get("inference")
+    if inference_df is not None and not inference_df.empty:
+        st.markdown("## ⚡ Inference Cost")
+        st.caption(
+            "Per-request latency, throughput and energy per 1k predictions "
+            "for each batch size."
+        )
+        st.dataframe(inference_df, use_container_width=True)
+
     st.markdown("## 📈 Sustainability Trade-offs")
     col1, col2 = st.columns(2)
 
     with col1:
         st.plotly_chart(
-            plot_accuracy_vs_carbon(results_df),
+            plots.plot_accuracy_vs_carbon(results_df),
             use_container_width=True
         )
 
     with col2:
         st.plotly_chart(
-            plot_greenscore_bar(results_df),
+            plots.plot_greenscore_bar(results_df),
             use_container_width=True
         )
 
+    st.markdown("## 🧭 Weight Sensitivity")
+    st.caption(
+        "Best model for every mix of three priorities (the others set to "
+        "0). The cross marks your current sliders."
+    )
+    sensitivity_keys = st.multiselect(
+        "Priorities",
+        GREENSCORE_WEIGHT_KEYS,
+        default=["accuracy", "energy", "carbon"],
+        max_selections=3,
+    )
+    if len(sensitivity_keys) == 3:
+        map_df = winner_map(raw_results, sensitivity_keys, baseline=baseline)
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            st.plotly_chart(
+                plots.plot_winner_map(map_df, sensitivity_keys, weights),
+                use_container_width=True
+            )
+        with col2:
+            st.dataframe(
+                map_df["Winner"].value_counts(normalize=True)
+                .rename("Share of weight space"),
+                use_container_width=True
+            )
+    else:
+        st.info("Select three priorities to draw the weight map.")
+
+    profile_df = st.session_state.get("profile")
+    if profile_df is not None and not profile_df.empty:
+        profiling = load_module("pipeline.profiling")
+        st.markdown("## ⏱️ Stage Breakdown")
+        st.caption(
+            "Wall time, CPU time, peak RSS and energy of every pipeline "
+            "stage. Stage energy comes from the "
+            f"{st.session_state['run_metadata'].get('profile_energy_backend')} "
+            "meter; stages inside process pool workers are not broken down."
+        )
+        st.plotly_chart(
+            plots.plot_stage_waterfall(profile_df),
+            use_container_width=True
+        )
+        with st.expander("Stage table"):
+            st.dataframe(
+                profile_df.astype({"Attributes": str}),
+                use_container_width=True
+            )
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Download spans (JSON)",
+                profiling.profile_to_json(profile_df),
+                file_name="profile.json",
+                mime="application/json",
+            )
+        with col2:
+            st.download_button(
+                "Download Chrome trace",
+                json.dumps(profiling.profile_to_chrome_trace(profile_df)),
+                file_name="trace.json",
+                mime="application/json",
+                help="Open in chrome://tracing or ui.perfetto.dev",
+            )
+
     st.markdown("## 🧠 Model Insights")
     for _, row in results_df.iterrows():
+        footprint = row.get("Memory Footprint (MB)")
+        memory_line = (
+            f"- Memory: {footprint:.3f} MB footprint "
+            f"({row['Model Size (MB)']:.3f} MB model), "
+            f"{row['Train Memory (MB)']:.1f} MB training peak\n            "
+            if pd.notna(footprint) else ""
+        )
         st.markdown(
             f"""
             **{row['Model']}**
@@ -89,7 +351,9 @@ if run_clicked:
             - Energy: {row['Energy (kWh)']:.6f} kWh
             - CO₂: {row['CO2 (tons)']:.8f} tons
             - Time: {row['Time (s)']:.2f} s
-            - GreenScore: {row['GreenScore']:.2f}
+            {memory_line}- GreenScore: {row['GreenScore']:.2f}
+            - Pareto Optimal: {'yes' if row['Pareto Optimal'] else 'no'}
+            - Source: {row.get('Source', 'measured')}
             """
         )
 
@@ -104,3 +368,72 @@ else:
         "👈 Choose a dataset, adjust sustainability priorities, "
         "and click **Run Green Evaluation** to begin."
     )
+
+
+# -------------------------------------------------
+# Run History
+# -------------------------------------------------
+HISTORY_PAGE_SIZE = 50
+
+
+def load_older_history():
+    page, cursor = load_history_page(
+        DEFAULT_HISTORY_DB,
+        dataset=st.session_state["history_dataset"],
+        page_size=HISTORY_PAGE_SIZE,
+        cursor=st.session_state["history_cursor"],
+    )
+    st.session_state["history_pages"].append(page)
+    st.session_state["history_cursor"] = cursor
+
+
+history_datasets = list_history_datasets(DEFAULT_HISTORY_DB)
+if not history_datasets.empty:
+    st.markdown("## 📜 Run History")
+
+    dataset_choices = {"All datasets": None}
+    for _, row in history_datasets.iterrows():
+        label = f"{row['Dataset Mode']} · {row['Dataset'][:10]} ({row['Runs']} runs)"
+        dataset_choices[label] = row["Dataset"]
+    history_dataset = dataset_choices[st.selectbox("Dataset", list(dataset_choices))]
+
+    st.dataframe(
+        summarize_history(DEFAULT_HISTORY_DB, dataset=history_dataset),
+        use_container_width=True
+    )
+
+    # Pages are loaded on demand and kept per session; another dataset
+    # starts over from the newest page
+    if (
+        "history_pages" not in st.session_state
+        or st.session_state.get("history_dataset") != history_dataset
+    ):
+        page, cursor = load_history_page(
+            DEFAULT_HISTORY_DB, dataset=history_dataset,
+            page_size=HISTORY_PAGE_SIZE
+        )
+        st.session_state["history_pages"] = [page]
+        st.session_state["history_cursor"] = cursor
+        st.session_state["history_dataset"] = history_dataset
+
+    history_df = pd.concat(st.session_state["history_pages"], ignore_index=True)
+    st.caption(f"{len(history_df)} most recent measurements")
+    st.dataframe(history_df, use_container_width=True)
+
+    if st.session_state["history_cursor"] is not None:
+        # Runs before the next rerun, so the new page is shown right away
+        st.button("Load older runs", on_click=load_older_history)
+
+
+with st.expander("🐞 Debug: import times"):
+    st.caption(
+        "Seconds spent importing each module in this server process. "
+        "Modules load on first use and are reused by later reruns."
+    )
+    st.dataframe(
+        pd.DataFrame(
+            sorted(import_profile().items(), key=lambda item: -item[1]),
+            columns=["Module", "Import time (s)"],
+        ),
+        use_container_width=True,
+    )
@@ -0,0 +1,78 @@
+"""
+cli.py
+------
+Command-line entry point for headless GreenScore benchmarks.
+
+Usage:
+    python cli.py matrix.yaml --out evaluation/batch --workers 2
+
+Responsibilities:
+1. Parse the command line
+2. Run a benchmark matrix through pipeline/batch.py
+3. Exit non-zero if any job failed
+
+NOTE:
+- Does not import Streamlit or Plotly (see app.py for the dashboard)
+- Re-running the same command resumes an interrupted batch
+"""
+
+import argparse
+import sys
+
+from pipeline.batch import DEFAULT_BATCH_DIR, load_matrix, run_matrix
+from utils.metrics import DEFAULT_HISTORY_DB
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Run a GreenScore benchmark matrix without the dashboard."
+    )
+    parser.add_argument(
+        "matrix",
+        help="YAML or JSON file: datasets x models x weight profiles"
+    )
+    parser.add_argument(
+        "--out", default=DEFAULT_BATCH_DIR,
+        help=f"Batch output directory (default: {DEFAULT_BATCH_DIR})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Concurrent pipeline runs (default: 1)"
+    )
+    parser.add_argument(
+        "--no-resume", action="store_true",
+        help="Re-run jobs that already have results"
+    )
+    parser.add_argument(
+        "--history", default=DEFAULT_HISTORY_DB,
+        help=f"Run-history database (default: {DEFAULT_HISTORY_DB})"
+    )
+    parser.add_argument(
+        "--no-history", action="store_true",
+        help="Do not record the runs in the run-history database"
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+
+    summary = run_matrix(
+        load_matrix(args.matrix),
+        out_dir=args.out,
+        workers=args.workers,
+        resume=not args.no_resume,
+        history_db=None if args.no_history else args.history,
+    )
+
+    print(
+        f"{len(summary['done'])} done, {len(summary['skipped'])} skipped, "
+        f"{len(summary['failed'])} failed -> {args.out}/results.csv"
+    )
+    if "co2_saved_g" in summary:
+        print(f"Carbon-aware schedule -> {args.out}/schedule.csv")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
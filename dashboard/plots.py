@@ -2,6 +2,9 @@
 Responsibilities:
 1. Accuracy vs Carbon Emissions scatter plot
 2. GreenScore leaderboard bar chart
+3. Learning curves of progressive runs
+4. Winning model across the weight simplex
+5. Per-stage waterfall of a profiled run
 
 NOTE:
 - Uses Plotly for interactive visuals
@@ -23,6 +26,7 @@ def plot_accuracy_vs_carbon(df):
     Y-axis  : CO2 emissions (kg)
     Bubble  : GreenScore
     Color   : Model name
+    Symbol  : Pareto front membership (if "Pareto Optimal" is present)
 
     Parameters
     ----------
@@ -40,6 +44,8 @@ def plot_accuracy_vs_carbon(df):
         y="CO2 (kg)",
         color="Model",
         size="GreenScore",
+        symbol="Pareto Optimal" if "Pareto Optimal" in df.columns else None,
+        symbol_map={True: "star", False: "circle"},
         hover_data=["Energy (kWh)", "Time (s)"],
         template="plotly_dark",
         title="Accuracy vs Carbon Emissions"
@@ -96,3 +102,150 @@ def plot_greenscore_bar(df):
     )
 
     return fig
+
+
+# -------------------------------------------------
+# Learning Curves (progressive mode)
+# -------------------------------------------------
+def plot_learning_curve(curve_df, metric="Energy (kWh)"):
+    """
+    Plots a metric against the number of training rows per model
+    (log-log, as fitted in pipeline/progressive.py).
+
+    Parameters
+    ----------
+    curve_df : pd.DataFrame
+        PipelineResult.learning_curve
+    metric : str, optional
+        Column to plot
+
+    Returns
+    -------
+    plotly.graph_objects.Figure
+    """
+
+    fig = px.line(
+        curve_df,
+        x="Rows",
+        y=metric,
+        color="Model",
+        markers=True,
+        log_x=True,
+        log_y=metric != "Accuracy",
+        template="plotly_dark",
+        title=f"Learning Curve: {metric}"
+    )
+
+    fig.update_layout(
+        title_x=0.5,
+        xaxis_title="Training rows",
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+
+    return fig
+
+
+# -------------------------------------------------
+# Weight Sensitivity (winner map)
+# -------------------------------------------------
+def plot_winner_map(map_df, keys, current=None):
+    """
+    Ternary map of the best model at every weight profile over three
+    weight keys (see utils.metrics.winner_map).
+
+    Parameters
+    ----------
+    map_df : pd.DataFrame
+        Output of winner_map
+    keys : sequence of str
+        The three weight keys of the simplex
+    current : dict, optional
+        Current weights; marked on the map after rescaling the three
+        keys to sum to 1
+
+    Returns
+    -------
+    plotly.graph_objects.Figure
+    """
+
+    a, b, c = keys
+
+    fig = px.scatter_ternary(
+        map_df,
+        a=a,
+        b=b,
+        c=c,
+        color="Winner",
+        hover_data=["Margin"],
+        template="plotly_dark",
+        title="Winning Model Across Weights"
+    )
+
+    total = sum(current.get(key, 0) for key in keys) if current else 0
+    if total > 0:
+        fig.add_scatterternary(
+            a=[current.get(a, 0) / total],
+            b=[current.get(b, 0) / total],
+            c=[current.get(c, 0) / total],
+            mode="markers",
+            marker=dict(symbol="x", size=14, color="white"),
+            name="Current weights"
+        )
+
+    fig.update_layout(
+        title_x=0.5,
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+
+    return fig
+
+
+# -------------------------------------------------
+# Stage Waterfall (run profile)
+# -------------------------------------------------
+def plot_stage_waterfall(profile_df):
+    """
+    Draws every span of a run as a bar from its start to its end, in
+    start order, indented by nesting depth and colored by energy.
+
+    Parameters
+    ----------
+    profile_df : pd.DataFrame
+        PipelineResult.profile
+
+    Returns
+    -------
+    plotly.graph_objects.Figure
+    """
+
+    df = profile_df.drop(columns="Attributes", errors="ignore").copy()
+    # Unique labels keep repeated stages (fit, predict, ...) on their own rows
+    df["Span"] = [
+        f"{'· ' * depth}{stage} #{i}"
+        for i, (depth, stage) in enumerate(zip(df["Depth"], df["Stage"]))
+    ]
+
+    fig = px.bar(
+        df,
+        x="Wall (s)",
+        y="Span",
+        base="Start (s)",
+        orientation="h",
+        color="Energy (kWh)",
+        hover_data=["Parent", "CPU (s)", "Peak RSS (MB)", "Energy (kWh)"],
+        color_continuous_scale="Greens",
+        template="plotly_dark",
+        title="Where the Run's Time and Energy Went"
+    )
+
+    fig.update_layout(
+        title_x=0.5,
+        xaxis_title="Seconds since run start",
+        yaxis_title="",
+        yaxis=dict(categoryorder="array", categoryarray=df["Span"], autorange="reversed"),
+        height=max(300, 22 * len(df) + 120),
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+
+    return fig
+
@@ -1,5 +1,9 @@
 import streamlit as st
-import pandas as pd
+
+from data.custom_dataset import SUPPORTED_FORMATS, read_columns
+from models.registry import available_models, model_cost_class
+from pipeline.energy import ENERGY_BACKENDS
+from pipeline.memory import MEMORY_BACKENDS
 
 # -------------------------------------------------
 # Custom CSS (Green + Blue Sustainability Theme)
@@ -94,18 +98,29 @@ def render_sidebar():
         ["Controlled Mode (Built-in)", "Custom Dataset"]
     )
 
-    custom_df = None
+    uploaded_file = None
     target_column = None
+    feature_columns = None
 
     if dataset_mode == "Custom Dataset":
         st.sidebar.subheader("📂 Upload Dataset")
-        uploaded_file = st.sidebar.file_uploader("Upload CSV file", type=["csv"])
+        uploaded_file = st.sidebar.file_uploader(
+            "Upload dataset (CSV, Parquet, Feather, NPY, NPZ)",
+            type=[ext.lstrip(".") for ext in SUPPORTED_FORMATS]
+        )
 
         if uploaded_file is not None:
-            custom_df = pd.read_csv(uploaded_file)
+            # Only the schema is read here, rows are loaded by the pipeline
+            columns = read_columns(uploaded_file)
             target_column = st.sidebar.selectbox(
                 "Select Target Column",
-                custom_df.columns
+                columns
+            )
+            candidates = [c for c in columns if c != target_column]
+            feature_columns = st.sidebar.multiselect(
+                "Feature Columns",
+                candidates,
+                default=candidates
             )
 
     st.sidebar.markdown("---")
@@ -113,9 +128,11 @@ def render_sidebar():
     # Model selection
     st.sidebar.subheader("🤖 Select Models")
     selected_models = {
-        "Logistic Regression": st.sidebar.checkbox("Logistic Regression", True),
-        "Random Forest": st.sidebar.checkbox("Random Forest", True),
-        "Neural Network": st.sidebar.checkbox("Neural Network", True),
+        name: st.sidebar.checkbox(
+            name, True,
+            help=f"Training cost: {model_cost_class(name)}"
+        )
+        for name in available_models()
     }
 
     if sum(selected_models.values()) < 2:
@@ -146,15 +163,115 @@ def render_sidebar():
         "Training Time Priority",
         0, 100, 0, step=25
     )
+    latency_p = st.sidebar.slider(
+        "Inference Latency Priority",
+        0, 100, 0, step=25,
+        help="Needs 'Measure inference cost' in the benchmark settings"
+    )
+    inference_energy_p = st.sidebar.slider(
+        "Inference Energy Priority",
+        0, 100, 0, step=25,
+        help="Needs 'Measure inference cost' in the benchmark settings"
+    )
+    memory_p = st.sidebar.slider(
+        "Memory Footprint Priority",
+        0, 100, 0, step=25,
+        help="Model size plus inference working set"
+    )
 
     weights = {
         "accuracy": acc_p / 100,
         "energy": energy_p / 100,
         "carbon": carbon_p / 100,
-        "time": time_p / 100
+        "time": time_p / 100,
+        "latency": latency_p / 100,
+        "inference_energy": inference_energy_p / 100,
+        "memory": memory_p / 100
     }
 
     st.sidebar.markdown("---")
+
+    # Benchmark settings
+    with st.sidebar.expander("🔬 Benchmark Settings"):
+        repetitions = st.number_input(
+            "Repetitions per model", 1, 20, 1,
+            help="More than 1 reports medians and confidence intervals"
+        )
+        warmup = st.number_input("Warm-up runs (discarded)", 0, 5, 0)
+        vary_seeds = st.checkbox("Use a different seed per repetition", False)
+        energy_backend = st.selectbox(
+            "Energy meter", ENERGY_BACKENDS,
+            help="codecarbon: tracker per model; rapl: direct RAPL "
+                 "counters; cputime: CPU time x TDP estimate; "
+                 "auto: RAPL if readable, else cputime"
+        )
+        memory_backend = st.selectbox(
+            "Memory meter", MEMORY_BACKENDS,
+            help="rss: peak resident memory, no overhead on Linux; "
+                 "tracemalloc: exact Python / NumPy allocations, but "
+                 "slows training down"
+        )
+        progressive = st.checkbox(
+            "Progressive mode (prune on subsamples)", False,
+            help="Train on 1%, 5% and 20% of the data first and skip "
+                 "models whose projected full-size result is dominated"
+        )
+        search = st.selectbox(
+            "Hyperparameter search", ["off", "halving", "hyperband"],
+            help="Tune each model's grid by partial GreenScore "
+                 "(successive halving / Hyperband) before the final run"
+        )
+        measure_inference = st.checkbox(
+            "Measure inference cost", False,
+            help="Batch-size sweep with latency, throughput and energy "
+                 "per 1k predictions"
+        )
+        normalization = st.selectbox(
+            "Score normalization", ["within run", "rolling", "log"],
+            help="within run: min-max over this run's models; rolling / "
+                 "log: against this dataset's stored baseline of recent "
+                 "runs, so scores are comparable across runs (log "
+                 "compares costs on a log scale)"
+        )
+        streaming = st.checkbox(
+            "Streaming (out-of-core) training", False,
+            help="Read the data in chunks and train with partial_fit, for "
+                 "datasets larger than memory. Only SGD logistic "
+                 "regression and the MLP support it"
+        )
+
+    # Training budgets (0 = unlimited)
+    with st.sidebar.expander("⏱️ Training Budgets"):
+        max_energy_wh = st.number_input(
+            "Max energy per model (Wh)", 0.0, value=0.0, step=0.1
+        )
+        max_co2_g = st.number_input(
+            "Max CO₂ per model (g)", 0.0, value=0.0, step=0.1
+        )
+        max_seconds = st.number_input(
+            "Max training time per model (s)", 0.0, value=0.0, step=10.0
+        )
+
+    budget = {
+        "energy_kwh": max_energy_wh / 1000 or None,
+        "co2_g": max_co2_g or None,
+        "seconds": max_seconds or None,
+    }
+
+    run_options = {
+        "repetitions": int(repetitions),
+        "warmup": int(warmup),
+        "seeds": list(range(int(repetitions))) if vary_seeds else None,
+        "measure_inference": measure_inference,
+        "progressive": progressive,
+        "search": None if search == "off" else search,
+        "energy_backend": energy_backend,
+        "memory_backend": memory_backend,
+        "budget": budget if any(budget.values()) else None,
+        "normalization": None if normalization == "within run" else normalization,
+        "streaming": streaming,
+    }
+
     run_clicked = st.sidebar.button("🚀 Run Green Evaluation")
 
     return (
@@ -162,8 +279,10 @@ def render_sidebar():
         selected_models,
         weights,
         run_clicked,
-        custom_df,
+        uploaded_file,
         target_column,
+        feature_columns,
+        run_options,
     )
 
 
@@ -1,3 +1,54 @@
+"""
+custom_dataset.py
+-----------------
+Custom dataset loaders for the GreenScore project.
+
+Responsibilities:
+1. Validate a user dataset for classification
+2. Stream large CSV uploads in chunks instead of loading them whole
+3. Load columnar / binary formats (Parquet, Feather/Arrow IPC, .npy, .npz)
+4. Materialize the features as one compact array (optionally memory-mapped)
+5. Iterate over a CSV / .npy file (or DataFrame) chunk by chunk without
+   materializing it, for out-of-core training
+
+NOTE:
+- load_custom_dataset works on an already loaded DataFrame
+- load_custom_csv_chunked never holds more than one chunk of the raw CSV
+  in memory; features end up in a single float32/float64 array
+- Only the selected feature and target columns are read (projection)
+- Parquet / Feather need pyarrow, which is imported only when used
+- iter_custom_chunks validates each chunk as it is read, so a bad row
+  deep in a large file is only reported when the iteration reaches it
+"""
+
+import os
+import tempfile
+import weakref
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNKSIZE = 100_000
+
+# File extension -> loader format
+SUPPORTED_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".arrows": "feather",
+    ".npy": "npy",
+    ".npz": "npz",
+}
+
+# Rows validated at once when scanning arrays for NaNs
+VALIDATION_BLOCK_ROWS = 65_536
+
+
 def load_custom_dataset(df, target_column):
     """
     Validates and splits a custom dataset for classification.
@@ -19,3 +70,679 @@ def load_custom_dataset(df, target_column):
         raise ValueError("Target column must have at least 2 classes.")
 
     return X, y
+
+
+# -------------------------------------------------
+# CSV Header
+# -------------------------------------------------
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def read_csv_header(source) -> list:
+    """
+    Returns the column names of a CSV file without reading its rows.
+
+    Parameters
+    ----------
+    source : str or file-like
+        Path or uploaded file
+    """
+    _rewind(source)
+    columns = list(pd.read_csv(source, nrows=0).columns)
+    _rewind(source)
+    return columns
+
+
+# -------------------------------------------------
+# Chunked CSV Loading
+# -------------------------------------------------
+def _select_features(columns, target_column, feature_columns):
+    """
+    Validates the target / feature selection against the file's columns.
+    """
+    if target_column not in columns:
+        raise ValueError("Selected target column does not exist.")
+
+    if feature_columns is None:
+        feature_columns = [c for c in columns if c != target_column]
+    else:
+        missing = [c for c in feature_columns if c not in columns]
+        if missing:
+            raise ValueError(f"Feature columns not found: {missing}")
+        if target_column in feature_columns:
+            raise ValueError("Target column cannot also be a feature.")
+
+    # Also when the file holds nothing but the target
+    if not feature_columns:
+        raise ValueError("Select at least one feature column.")
+
+    return list(feature_columns)
+
+
+def _scan_csv(source, target_column, feature_columns, chunksize):
+    """
+    First pass: validates every chunk and collects what is needed
+    to allocate the feature array (row count, value ranges, labels).
+    """
+    n_rows = 0
+    exact = True
+    labels = []
+
+    feature_columns = _select_features(
+        read_csv_header(source), target_column, feature_columns
+    )
+    usecols = feature_columns + [target_column]
+
+    _rewind(source)
+    for chunk in pd.read_csv(source, chunksize=chunksize, usecols=usecols):
+
+        features = chunk[feature_columns]
+        target = chunk[target_column]
+
+        if features.isnull().values.any() or target.isnull().any():
+            raise ValueError(
+                f"Dataset contains missing values (rows {n_rows}-"
+                f"{n_rows + len(chunk) - 1})."
+            )
+
+        if not all(dtype.kind in "iufb" for dtype in features.dtypes):
+            raise ValueError("All feature columns must be numeric.")
+
+        exact = exact and _float32_exact(features.to_numpy())
+
+        labels.append(target)
+        n_rows += len(chunk)
+
+    if n_rows == 0:
+        raise ValueError("Dataset is empty.")
+
+    return n_rows, feature_columns, exact, labels
+
+
+def _float32_exact(values) -> bool:
+    """
+    True if every value survives a round trip through float32.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(over="ignore"):
+        return bool(np.array_equal(values.astype(np.float32).astype(np.float64), values))
+
+
+def _compact_dtype(exact, downcast):
+    """
+    float32 only when no value changes (see _float32_exact), so
+    large-magnitude columns such as timestamps keep their precision.
+    """
+    return np.float32 if downcast and exact else np.float64
+
+
+def load_custom_csv_chunked(
+    source,
+    target_column,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    downcast: bool = True,
+    memmap_dir: str = None,
+    feature_columns=None
+):
+    """
+    Streams a CSV file in chunks, validates it incrementally and
+    materializes the features as a single compact array.
+
+    The file is read twice: once to validate and size the array,
+    once to fill it. Only one chunk of the raw CSV is in memory at a time.
+
+    Parameters
+    ----------
+    source : str or file-like
+        Path or (seekable) uploaded file
+    target_column : str
+        Name of the label column
+    chunksize : int, optional
+        Rows per chunk
+    downcast : bool, optional
+        Store features as float32 if every value is exactly
+        representable in float32 (default = True)
+    memmap_dir : str, optional
+        If given, features are written to a memory-mapped .npy file
+        in this directory instead of RAM
+    feature_columns : list of str, optional
+        Columns to use as features (default = all but the target)
+
+    Returns
+    -------
+    X : np.ndarray
+        C-contiguous feature matrix (np.memmap if memmap_dir is set)
+    y : pd.Series
+        Target labels
+    """
+
+    n_rows, feature_columns, exact, labels = _scan_csv(
+        source, target_column, feature_columns, chunksize
+    )
+
+    y = pd.concat(labels, ignore_index=True)
+    y.name = target_column
+
+    if y.nunique() < 2:
+        raise ValueError("Target column must have at least 2 classes.")
+
+    dtype = _compact_dtype(exact, downcast)
+    X = _allocate((n_rows, len(feature_columns)), dtype, memmap_dir)
+
+    # Second pass: fill the preallocated array chunk by chunk
+    _rewind(source)
+    start = 0
+    for chunk in pd.read_csv(
+        source, chunksize=chunksize, usecols=feature_columns
+    ):
+        stop = start + len(chunk)
+        X[start:stop] = chunk[feature_columns].to_numpy(dtype=dtype)
+        start = stop
+
+    if memmap_dir is not None:
+        X.flush()
+
+    return X, y
+
+
+def _allocate(shape, dtype, memmap_dir=None):
+    """
+    Allocates the feature array in RAM or as a memory-mapped .npy file.
+
+    The file is unlinked as soon as it is mapped: the mapping stays
+    valid and the disk space is freed with the array. Where an open
+    file cannot be removed (Windows), it is removed once the array is
+    garbage collected instead.
+    """
+    if memmap_dir is None:
+        return np.empty(shape, dtype=dtype)
+
+    os.makedirs(memmap_dir, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=memmap_dir, suffix=".npy")
+    os.close(fd)
+    X = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+    try:
+        os.remove(path)
+    except OSError:
+        weakref.finalize(X, _remove_quietly, path)
+    return X
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# -------------------------------------------------
+# Format Detection
+# -------------------------------------------------
+def detect_format(source, file_format: str = None) -> str:
+    """
+    Determines the loader format from an explicit format,
+    a file path or an uploaded file's name.
+    """
+    if file_format is not None:
+        if file_format not in SUPPORTED_FORMATS.values():
+            raise ValueError(f"Unsupported file format '{file_format}'.")
+        return file_format
+
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    extension = os.path.splitext(str(name))[1].lower()
+
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(
+            "Unsupported file type. Use one of: "
+            + ", ".join(sorted(SUPPORTED_FORMATS))
+        )
+    return SUPPORTED_FORMATS[extension]
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            "Parquet / Feather support requires pyarrow (pip install pyarrow)."
+        ) from None
+    return pyarrow
+
+
+def _is_path(source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+# -------------------------------------------------
+# Column Listing
+# -------------------------------------------------
+def _data_columns(schema) -> list:
+    """
+    Column names of an Arrow schema without the index columns pandas
+    stores alongside the data (e.g. "__index_level_0__").
+    """
+    metadata = schema.pandas_metadata or {}
+    index_columns = {
+        name for name in metadata.get("index_columns", [])
+        if isinstance(name, str)
+    }
+    return [name for name in schema.names if name not in index_columns]
+
+
+def _feather_source(source):
+    # Memory-mapped for paths, so readers never copy the file
+    pa = _import_pyarrow()
+    _rewind(source)
+    return pa.memory_map(str(source)) if _is_path(source) else source
+
+
+def _feather_schema(source):
+    """
+    Schema of a Feather file in any layout pandas / pyarrow accept:
+    Arrow IPC file (Feather v2), Arrow IPC stream or Feather v1.
+    """
+    pa = _import_pyarrow()
+
+    try:
+        return pa.ipc.open_file(_feather_source(source)).schema
+    except pa.ArrowInvalid:
+        pass
+    try:
+        return pa.ipc.open_stream(_feather_source(source)).schema
+    except pa.ArrowInvalid:
+        pass
+    # Feather v1 has no schema reader; the mapped columns are not copied
+    return pa.feather.read_table(_feather_source(source)).schema
+
+
+def _read_feather_table(source, columns):
+    """
+    Selected columns of a Feather file (IPC file, IPC stream or v1).
+    """
+    pa = _import_pyarrow()
+
+    try:
+        return pa.feather.read_table(
+            source, columns=columns, memory_map=_is_path(source)
+        )
+    except pa.ArrowInvalid:
+        # Streams have no footer; read their batches and project
+        return pa.ipc.open_stream(_feather_source(source)).read_all().select(columns)
+
+
+def read_columns(source, file_format: str = None) -> list:
+    """
+    Returns the column names of a dataset file without reading its data.
+
+    .npy files and 2-D .npz arrays have positional columns "0", "1", ...;
+    .npz files with "X" and "y" arrays expose the target column "y".
+    Index columns written by pandas to Parquet / Feather are left out.
+    """
+    file_format = detect_format(source, file_format)
+
+    if file_format == "csv":
+        return read_csv_header(source)
+
+    if file_format == "parquet":
+        pa = _import_pyarrow()
+        _rewind(source)
+        columns = _data_columns(pa.parquet.read_schema(source))
+        _rewind(source)
+        return columns
+
+    if file_format == "feather":
+        columns = _data_columns(_feather_schema(source))
+        _rewind(source)
+        return columns
+
+    shapes = _array_shapes(source, file_format)
+
+    if file_format == "npy":
+        if len(shapes["data"]) != 2:
+            raise ValueError(".npy datasets must be 2-D (rows x columns).")
+        return [str(i) for i in range(shapes["data"][1])]
+
+    if "X" in shapes and "y" in shapes:
+        return [str(i) for i in range(shapes["X"][1])] + ["y"]
+    if len(shapes) == 1:
+        (shape,) = shapes.values()
+        if len(shape) == 2:
+            return [str(i) for i in range(shape[1])]
+    raise ValueError(".npz datasets must hold one 2-D array or X and y.")
+
+
+def _read_npy_shape(f) -> tuple:
+    """
+    Array shape from a .npy header, without reading the data.
+    """
+    version = np.lib.format.read_magic(f)
+    if version == (1, 0):
+        return np.lib.format.read_array_header_1_0(f)[0]
+    return np.lib.format.read_array_header_2_0(f)[0]
+
+
+def _array_shapes(source, file_format) -> dict:
+    """
+    Shapes of the arrays of a .npy file ({"data": shape}) or .npz file
+    (by array name), read from their headers only so uploaded files
+    are not loaded just to list their columns.
+    """
+    _rewind(source)
+    if file_format == "npy":
+        if _is_path(source):
+            with open(source, "rb") as f:
+                shapes = {"data": _read_npy_shape(f)}
+        else:
+            shapes = {"data": _read_npy_shape(source)}
+    else:
+        shapes = {}
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                with archive.open(name) as member:
+                    shapes[name.removesuffix(".npy")] = _read_npy_shape(member)
+    _rewind(source)
+    return shapes
+
+
+# -------------------------------------------------
+# Binary / Columnar Loading
+# -------------------------------------------------
+def _load_npy(source):
+    """
+    Memory-maps a .npy file (paths) or loads it (uploaded files).
+    """
+    _rewind(source)
+    array = np.load(source, mmap_mode="r" if _is_path(source) else None)
+    if array.ndim != 2:
+        raise ValueError(".npy datasets must be 2-D (rows x columns).")
+    return array
+
+
+def _load_npz(source):
+    """
+    Returns the arrays of a .npz file as {"X", "y"} or {"data"}.
+    """
+    _rewind(source)
+    with np.load(source) as archive:
+        if "X" in archive and "y" in archive:
+            return {"X": archive["X"], "y": archive["y"]}
+        if len(archive.files) == 1:
+            data = archive[archive.files[0]]
+            if data.ndim != 2:
+                raise ValueError(".npz datasets must hold one 2-D array or X and y.")
+            return {"data": data}
+    raise ValueError(".npz datasets must hold one 2-D array or X and y.")
+
+
+def _column_projection(array, positions):
+    """
+    Selects feature columns, as a view when they form a contiguous range.
+    """
+    if positions == list(range(positions[0], positions[-1] + 1)):
+        return array[:, positions[0]:positions[-1] + 1]
+    return array[:, positions]
+
+
+def _validate_arrays(X, y):
+    """
+    Checks numeric features, missing values and class count,
+    scanning large (possibly memory-mapped) arrays block by block.
+    """
+    if X.dtype.kind not in "iufb":
+        raise ValueError("All feature columns must be numeric.")
+
+    if X.dtype.kind == "f":
+        for start in range(0, X.shape[0], VALIDATION_BLOCK_ROWS):
+            if np.isnan(X[start:start + VALIDATION_BLOCK_ROWS]).any():
+                raise ValueError("Dataset contains missing values.")
+
+    if pd.isnull(y).any():
+        raise ValueError("Dataset contains missing values.")
+
+    if y.nunique() < 2:
+        raise ValueError("Target column must have at least 2 classes.")
+
+
+def _table_to_arrays(table, feature_columns, target_column, downcast, memmap_dir):
+    """
+    Converts an Arrow table into one compact feature array and the labels.
+    Columns are copied straight into the preallocated array.
+    """
+    pa = _import_pyarrow()
+
+    for name in feature_columns + [target_column]:
+        if table.column(name).null_count:
+            raise ValueError("Dataset contains missing values.")
+
+    exact = True
+    for name in feature_columns:
+        column_type = table.schema.field(name).type
+        if not (
+            pa.types.is_integer(column_type)
+            or pa.types.is_boolean(column_type)
+            or pa.types.is_floating(column_type)
+        ):
+            raise ValueError("All feature columns must be numeric.")
+
+        exact = exact and _float32_exact(table.column(name).to_numpy())
+
+    dtype = _compact_dtype(exact, downcast)
+    X = _allocate((table.num_rows, len(feature_columns)), dtype, memmap_dir)
+
+    for i, name in enumerate(feature_columns):
+        X[:, i] = table.column(name).to_numpy()
+
+    y = table.column(target_column).to_pandas()
+    y.name = target_column
+
+    return X, y
+
+
+def load_custom_file(
+    source,
+    target_column,
+    file_format: str = None,
+    feature_columns=None,
+    downcast: bool = True,
+    memmap_dir: str = None,
+    chunksize: int = DEFAULT_CHUNKSIZE
+):
+    """
+    Loads a custom dataset from CSV, Parquet, Feather/Arrow IPC,
+    .npy or .npz, reading only the feature and target columns.
+
+    Parameters
+    ----------
+    source : str or file-like
+        Path or uploaded file (format is taken from the extension)
+    target_column : str
+        Name of the label column (positional "0", "1", ... for .npy)
+    file_format : str, optional
+        Overrides extension detection ("csv", "parquet", "feather",
+        "npy", "npz")
+    feature_columns : list of str, optional
+        Columns to use as features (default = all but the target)
+    downcast : bool, optional
+        Store features as float32 if every value is exactly
+        representable in float32 (CSV / Arrow formats)
+    memmap_dir : str, optional
+        Write features to a memory-mapped .npy file (CSV / Arrow formats)
+    chunksize : int, optional
+        Rows per chunk for CSV streaming
+
+    Returns
+    -------
+    X : np.ndarray
+        Feature matrix (a memory-mapped view for .npy paths)
+    y : pd.Series
+        Target labels
+    """
+    file_format = detect_format(source, file_format)
+
+    if file_format == "csv":
+        return load_custom_csv_chunked(
+            source, target_column,
+            chunksize=chunksize,
+            downcast=downcast,
+            memmap_dir=memmap_dir,
+            feature_columns=feature_columns,
+        )
+
+    columns = read_columns(source, file_format)
+    feature_columns = _select_features(columns, target_column, feature_columns)
+
+    if file_format in ("parquet", "feather"):
+        pa = _import_pyarrow()
+        projection = feature_columns + [target_column]
+        _rewind(source)
+        if file_format == "parquet":
+            table = pa.parquet.read_table(
+                source, columns=projection, memory_map=_is_path(source)
+            )
+        else:
+            table = _read_feather_table(source, projection)
+        X, y = _table_to_arrays(
+            table, feature_columns, target_column, downcast, memmap_dir
+        )
+
+    elif file_format == "npz" and target_column == "y" and "y" in columns:
+        arrays = _load_npz(source)
+        positions = [int(c) for c in feature_columns]
+        X = _column_projection(arrays["X"], positions)
+        y = pd.Series(arrays["y"], name="y")
+
+    else:
+        data = _load_npy(source) if file_format == "npy" else _load_npz(source)["data"]
+        positions = [int(c) for c in feature_columns]
+        X = _column_projection(data, positions)
+        y = pd.Series(np.asarray(data[:, int(target_column)]), name=target_column)
+
+    _validate_arrays(X, y)
+
+    return X, y
+
+
+# -------------------------------------------------
+# Chunk Iteration (Out-of-Core)
+# -------------------------------------------------
+STREAMING_FORMATS = ("csv", "npy")
+
+
+def _validate_chunk(X, y, start):
+    if X.dtype.kind not in "iufb":
+        raise ValueError("All feature columns must be numeric.")
+    if (X.dtype.kind == "f" and np.isnan(X).any()) or pd.isnull(y).any():
+        raise ValueError(
+            f"Dataset contains missing values (rows {start}-{start + len(y) - 1})."
+        )
+
+
+def iter_custom_chunks(
+    source,
+    target_column,
+    feature_columns=None,
+    file_format: str = None,
+    chunksize: int = DEFAULT_CHUNKSIZE
+):
+    """
+    Yields a dataset chunk by chunk, holding one chunk in memory at a time.
+
+    Every call starts a new pass over the data, so the iteration can be
+    repeated (e.g. once per training epoch).
+
+    Parameters
+    ----------
+    source : str, file-like or pd.DataFrame
+        CSV path / uploaded file, .npy path (memory-mapped) or a
+        DataFrame holding the features and the target
+    target_column : str
+        Name of the label column (positional "0", "1", ... for .npy)
+    feature_columns : list of str, optional
+        Columns to use as features (default = all but the target)
+    file_format : str, optional
+        "csv" or "npy" (default = from the extension)
+    chunksize : int, optional
+        Rows per chunk
+
+    Yields
+    ------
+    start : int
+        Index of the chunk's first row in the dataset
+    X : np.ndarray
+        Features of the chunk (float64)
+    y : np.ndarray
+        Labels of the chunk
+    """
+    if isinstance(source, pd.DataFrame):
+        feature_columns = _select_features(
+            list(source.columns), target_column, feature_columns
+        )
+        chunks = (
+            source.iloc[start:start + chunksize]
+            for start in range(0, len(source), chunksize)
+        )
+    else:
+        file_format = detect_format(source, file_format)
+        if file_format not in STREAMING_FORMATS:
+            raise ValueError(
+                f"Streaming supports {STREAMING_FORMATS} files, not '{file_format}'."
+            )
+
+        if file_format == "npy":
+            yield from _iter_npy_chunks(
+                source, target_column, feature_columns, chunksize
+            )
+            return
+
+        feature_columns = _select_features(
+            read_columns(source, file_format), target_column, feature_columns
+        )
+        _rewind(source)
+        chunks = pd.read_csv(
+            source, chunksize=chunksize,
+            usecols=feature_columns + [target_column]
+        )
+
+    start = 0
+    for chunk in chunks:
+        features = chunk[feature_columns]
+        if not all(dtype.kind in "iufb" for dtype in features.dtypes):
+            raise ValueError("All feature columns must be numeric.")
+
+        X = features.to_numpy(dtype=np.float64)
+        y = chunk[target_column].to_numpy()
+        _validate_chunk(X, y, start)
+
+        yield start, X, y
+        start += len(chunk)
+
+
+def _iter_npy_chunks(source, target_column, feature_columns, chunksize):
+    """
+    Row blocks of a memory-mapped .npy file; only the selected
+    columns of one block are copied into memory.
+    """
+    data = _load_npy(source)
+    feature_columns = _select_features(
+        [str(i) for i in range(data.shape[1])], target_column, feature_columns
+    )
+    positions = [int(c) for c in feature_columns]
+    features = _column_projection(data, positions)
+    target = int(target_column)
+
+    if data.dtype.kind not in "iufb":
+        raise ValueError("All feature columns must be numeric.")
+
+    for start in range(0, data.shape[0], chunksize):
+        X = np.asarray(features[start:start + chunksize], dtype=np.float64)
+        y = np.asarray(data[start:start + chunksize, target])
+        _validate_chunk(X, y, start)
+
+        yield start, X, y
+
@@ -0,0 +1,218 @@
+"""
+budget.py
+---------
+Budget-aware training for GreenScore.
+
+Responsibilities:
+1. Describe per-model budgets (energy kWh, CO2 grams, wall seconds)
+2. Fit estimators in small steps and stop once a budget is exceeded
+3. Report whether (and why) training was cut short
+
+NOTE:
+- Step-wise fitting depends on what the estimator supports:
+  * partial_fit + max_iter (e.g. MLP with adam/sgd): one epoch per step,
+    stopping early on the usual tol / n_iter_no_change rule
+  * warm_start + n_estimators (e.g. Random Forest): grow the ensemble
+    in steps of ~10% of the trees
+  * warm_start + max_iter (e.g. Logistic Regression): continue the
+    solver in chunks of ~10% of the iterations
+  * anything else: a single fit, checked before and after (sklearn's
+    fit cannot be interrupted)
+- Energy is read from the budget's own meter while training runs
+  (RAPL if readable, otherwise the CPU-time x TDP estimate), so it also
+  works inside process pool workers
+- Step-wise fits may differ slightly from a single fit even when the
+  budget is not reached
+- Fitted models get their original warm_start / max_iter back; an
+  ensemble cut short keeps n_estimators = the trees it actually grew
+"""
+
+import time
+import warnings
+from dataclasses import dataclass
+
+import numpy as np
+from sklearn.exceptions import ConvergenceWarning
+
+from pipeline.energy import create_energy_backend
+
+
+# Column flagging models whose training was cut short
+BUDGET_COLUMN = "Budget Limited"
+
+# Fraction of n_estimators / max_iter added per warm-start step
+WARM_START_STEP = 0.1
+
+
+@dataclass
+class TrainingBudget:
+    """
+    Per-model training limits (None = unlimited).
+
+    energy_backend selects the meter used while training:
+    "auto", "rapl" or "cputime" ("codecarbon" has no live reading and
+    falls back to "cputime").
+    """
+    energy_kwh: float = None
+    co2_g: float = None
+    seconds: float = None
+    energy_backend: str = "auto"
+
+    def start(self) -> "BudgetMonitor":
+        """
+        Starts measuring one model's training against this budget.
+        """
+        return BudgetMonitor(self)
+
+
+class BudgetMonitor:
+    """
+    Running measurement of one training job.
+    """
+
+    def __init__(self, budget: TrainingBudget):
+        backend = budget.energy_backend
+        if backend == "codecarbon":
+            backend = "cputime"
+
+        self.budget = budget
+        self.started = time.perf_counter()
+        self._region = create_energy_backend(backend, interval=0).start_region("budget")
+
+    def exceeded(self):
+        """
+        Returns the name of the first exceeded limit
+        ("energy", "co2" or "time") or None.
+        """
+        budget = self.budget
+
+        if budget.seconds is not None and time.perf_counter() - self.started > budget.seconds:
+            return "time"
+
+        if budget.energy_kwh is None and budget.co2_g is None:
+            return None
+
+        emissions_kg, energy_kwh = self._region.peek()
+        if budget.energy_kwh is not None and energy_kwh > budget.energy_kwh:
+            return "energy"
+        if budget.co2_g is not None and emissions_kg * 1000 > budget.co2_g:
+            return "co2"
+
+        return None
+
+
+def as_budget(budget):
+    """
+    Accepts a TrainingBudget, a dict of its fields or None.
+    """
+    if budget is None or isinstance(budget, TrainingBudget):
+        return budget
+    return TrainingBudget(**budget)
+
+
+# -------------------------------------------------
+# Step-wise Fitting
+# -------------------------------------------------
+def fit_within_budget(model, X_train, y_train, budget: TrainingBudget):
+    """
+    Fits model in place, stopping once the budget is exceeded.
+
+    Returns
+    -------
+    str or None
+        Exceeded limit ("energy", "co2", "time") or None if training
+        finished within budget
+    """
+    monitor = budget.start()
+    params = model.get_params()
+
+    if hasattr(model, "partial_fit") and "max_iter" in params:
+        return _fit_epochs(model, X_train, y_train, monitor)
+
+    if params.get("warm_start") is not None and "n_estimators" in params:
+        return _grow_ensemble(model, X_train, y_train, monitor)
+
+    if params.get("warm_start") is not None and "max_iter" in params:
+        return _continue_solver(model, X_train, y_train, monitor)
+
+    # Cooperative check only: the fit itself runs to completion
+    reason = monitor.exceeded()
+    if reason is None:
+        model.fit(X_train, y_train)
+        reason = monitor.exceeded()
+    return reason
+
+
+def _fit_epochs(model, X_train, y_train, monitor):
+    params = model.get_params()
+    classes = np.unique(y_train)
+    tol = params.get("tol", 1e-4)
+    patience = params.get("n_iter_no_change", 10)
+
+    best_loss = np.inf
+    no_improvement = 0
+
+    for _ in range(params["max_iter"]):
+        model.partial_fit(X_train, y_train, classes=classes)
+
+        loss = getattr(model, "loss_", None)
+        if loss is not None:
+            no_improvement = no_improvement + 1 if loss > best_loss - tol else 0
+            best_loss = min(best_loss, loss)
+            if no_improvement >= patience:
+                return None
+
+        reason = monitor.exceeded()
+        if reason is not None:
+            return reason
+
+    return None
+
+
+def _grow_ensemble(model, X_train, y_train, monitor):
+    target = model.get_params()["n_estimators"]
+    step = max(1, int(target * WARM_START_STEP))
+
+    warm_start = model.get_params()["warm_start"]
+    model.set_params(warm_start=True)
+    try:
+        for n_estimators in range(step, target + step, step):
+            model.set_params(n_estimators=min(n_estimators, target))
+            model.fit(X_train, y_train)
+
+            reason = monitor.exceeded()
+            if reason is not None and n_estimators < target:
+                return reason
+
+        return None
+    finally:
+        model.set_params(warm_start=warm_start)
+
+
+def _continue_solver(model, X_train, y_train, monitor):
+    original = model.get_params()
+    max_iter = original["max_iter"]
+    step = max(1, int(max_iter * WARM_START_STEP))
+
+    model.set_params(warm_start=True, max_iter=step)
+    done = 0
+
+    try:
+        while done < max_iter:
+            with warnings.catch_warnings():
+                # Every chunk but the last is expected to stop unconverged
+                warnings.simplefilter("ignore", ConvergenceWarning)
+                model.fit(X_train, y_train)
+
+            n_iter = int(np.max(model.n_iter_))
+            done += n_iter
+            if n_iter < step:
+                return None
+
+            reason = monitor.exceeded()
+            if reason is not None:
+                return reason
+
+        return None
+    finally:
+        model.set_params(max_iter=max_iter, warm_start=original["warm_start"])
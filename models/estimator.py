@@ -0,0 +1,130 @@
+"""
+estimator.py
+------------
+Generic scikit-learn estimator trainer for GreenScore.
+
+Responsibilities:
+1. Initialize any scikit-learn classifier from its hyperparameters
+2. Train it and measure training time
+3. Predict on test data and compute performance metrics
+
+NOTE:
+- Used by the built-in model files and by estimators
+  registered at runtime through models/registry.py
+- Energy & carbon tracking stays at pipeline level
+- The fitted estimator and test predictions are returned under
+  ARTIFACTS_KEY so the pipeline can cache them; the pipeline pops
+  this entry before building the results table
+- With a budget the estimator is fitted step by step (see
+  models/budget.py) and the result gets a "Budget Limited" flag
+- fit, predict and metrics are profiling spans (see
+  pipeline/profiling.py); outside a profiled run they cost nothing
+- Peak memory of fit and predict and the pickled model size are
+  reported in the memory columns (see pipeline/memory.py); they are
+  measured outside the timed section
+"""
+
+import time
+
+from models.budget import BUDGET_COLUMN, as_budget, fit_within_budget
+from pipeline.memory import PeakMemory, memory_columns, model_size_bytes
+from pipeline.profiling import span
+from utils.metrics import compute_classification_metrics
+
+
+ARTIFACTS_KEY = "artifacts"
+
+
+# -------------------------------------------------
+# Train Any Estimator
+# -------------------------------------------------
+def train_estimator(
+    estimator_cls,
+    model_name,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    budget=None,
+    memory_backend="rss",
+    **params
+):
+    """
+    Trains a scikit-learn classifier and evaluates it.
+
+    Parameters
+    ----------
+    estimator_cls : type
+        scikit-learn classifier class (e.g. LogisticRegression)
+    model_name : str
+        Name reported in the results
+    X_train, y_train, X_test, y_test : array-like
+        Scaled features and labels
+    budget : TrainingBudget or dict, optional
+        Energy / CO2 / time limits; the partially trained model is
+        evaluated when a limit is hit
+    memory_backend : str, optional
+        "rss" (default, no sampling on Linux) or "tracemalloc"
+        (exact, slower); see pipeline/memory.py
+    **params
+        Hyperparameters passed to the estimator constructor
+
+    Returns
+    -------
+    dict
+        Dictionary containing model name, accuracy, f1-score, training time,
+        memory columns and the fitted estimator / predictions under
+        ARTIFACTS_KEY
+    """
+
+    # -------------------------------
+    # Initialize Model
+    # -------------------------------
+    model = estimator_cls(**params)
+
+    # -------------------------------
+    # Train Model (Time Tracking)
+    # -------------------------------
+    budget = as_budget(budget)
+    limited_by = None
+
+    with span("fit", rows=len(y_train)), PeakMemory(memory_backend) as train_memory:
+        start_time = time.perf_counter()
+        if budget is None:
+            model.fit(X_train, y_train)
+        else:
+            limited_by = fit_within_budget(model, X_train, y_train, budget)
+        training_time = time.perf_counter() - start_time
+
+    # -------------------------------
+    # Predictions
+    # -------------------------------
+    with span("predict", rows=len(y_test)), PeakMemory(memory_backend) as inference_memory:
+        y_pred = model.predict(X_test)
+
+    with span("model size"):
+        model_bytes = model_size_bytes(model)
+
+    # -------------------------------
+    # Compute Metrics
+    # -------------------------------
+    with span("metrics"):
+        metrics = compute_classification_metrics(y_test, y_pred)
+
+    # -------------------------------
+    # Collect Results
+    # -------------------------------
+    results = {
+        "Model": model_name,
+        "Accuracy": metrics["accuracy"],
+        "F1-score": metrics["f1_score"],
+        "Time (s)": training_time,
+        **memory_columns(train_memory, model_bytes, inference_memory),
+        ARTIFACTS_KEY: {"estimator": model, "y_pred": y_pred},
+    }
+
+    if budget is not None:
+        results[BUDGET_COLUMN] = limited_by is not None
+        results[ARTIFACTS_KEY]["limited_by"] = limited_by
+
+    return results
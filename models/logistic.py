@@ -12,11 +12,33 @@ Responsibilities:
 NOTE:
 - Energy & carbon tracking will be added at pipeline level
 - This file should remain model-specific only
+- LogisticRegression has no partial_fit, so out-of-core runs train an
+  SGD classifier with the logistic loss instead
 """
 
-import time
-from sklearn.linear_model import LogisticRegression
-from utils.metrics import compute_classification_metrics
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from models.estimator import train_estimator
+
+
+# Default hyperparameters (registered in models/registry.py)
+DEFAULT_PARAMS = {
+    "max_iter": 1000,
+    "solver": "lbfgs",
+    "n_jobs": -1,
+    "random_state": 42,
+}
+
+# Hyperparameter grid explored by pipeline/search.py
+SEARCH_SPACE = {
+    "C": [0.01, 0.1, 1.0, 10.0],
+}
+
+# Out-of-core variant (pipeline/streaming.py): logistic loss fitted by SGD
+STREAMING_PARAMS = {
+    "loss": "log_loss",
+    "alpha": 1e-4,
+    "random_state": 42,
+}
 
 
 # -------------------------------------------------
@@ -26,7 +48,8 @@ def train_logistic_regression(
     X_train,
     y_train,
     X_test,
-    y_test
+    y_test,
+    **params
 ):
     """
     Trains a Logistic Regression classifier and evaluates it.
@@ -41,6 +64,8 @@ def train_logistic_regression(
         Scaled test features
     y_test : array-like
         Test labels
+    **params
+        Hyperparameters overriding DEFAULT_PARAMS
 
     Returns
     -------
@@ -48,41 +73,27 @@ def train_logistic_regression(
         Dictionary containing model name, accuracy, f1-score, and training time
     """
 
-    # -------------------------------
-    # Initialize Model
-    # -------------------------------
-    model = LogisticRegression(
-        max_iter=1000,
-        solver="lbfgs",
-        n_jobs=-1,
-        random_state=42
+    return train_estimator(
+        LogisticRegression,
+        "Logistic Regression",
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        **{**DEFAULT_PARAMS, **params}
     )
 
-    # -------------------------------
-    # Train Model (Time Tracking)
-    # -------------------------------
-    start_time = time.time()
-    model.fit(X_train, y_train)
-    training_time = time.time() - start_time
-
-    # -------------------------------
-    # Predictions
-    # -------------------------------
-    y_pred = model.predict(X_test)
-
-    # -------------------------------
-    # Compute Metrics
-    # -------------------------------
-    metrics = compute_classification_metrics(y_test, y_pred)
-
-    # -------------------------------
-    # Collect Results
-    # -------------------------------
-    results = {
-        "Model": "Logistic Regression",
-        "Accuracy": metrics["accuracy"],
-        "F1-score": metrics["f1_score"],
-        "Time (s)": training_time
-    }
-
-    return results
+
+# -------------------------------------------------
+# Streaming Variant
+# -------------------------------------------------
+def build_streaming_estimator(**params):
+    """
+    Returns an unfitted SGD logistic regression for partial_fit training.
+
+    The lbfgs hyperparameters have no SGD counterpart; only random_state
+    carries over.
+    """
+    overrides = {k: v for k, v in params.items() if k == "random_state"}
+    return SGDClassifier(**{**STREAMING_PARAMS, **overrides})
+
@@ -13,11 +13,28 @@ Responsibilities:
 NOTE:
 - MLP represents deep learning in this project
 - Typically more computationally expensive
+- The adam / sgd solvers support partial_fit, so the same network can
+  be trained out of core
 """
 
-import time
 from sklearn.neural_network import MLPClassifier
-from utils.metrics import compute_classification_metrics
+from models.estimator import train_estimator
+
+
+# Default hyperparameters (registered in models/registry.py)
+DEFAULT_PARAMS = {
+    "hidden_layer_sizes": (64, 32),
+    "activation": "relu",
+    "solver": "adam",
+    "max_iter": 500,
+    "random_state": 42,
+}
+
+# Hyperparameter grid explored by pipeline/search.py
+SEARCH_SPACE = {
+    "hidden_layer_sizes": [(32,), (64, 32), (128, 64)],
+    "alpha": [1e-4, 1e-2],
+}
 
 
 # -------------------------------------------------
@@ -27,7 +44,8 @@ def train_mlp(
     X_train,
     y_train,
     X_test,
-    y_test
+    y_test,
+    **params
 ):
     """
     Trains an MLP classifier and evaluates it.
@@ -42,6 +60,8 @@ def train_mlp(
         Scaled test features
     y_test : array-like
         Test labels
+    **params
+        Hyperparameters overriding DEFAULT_PARAMS
 
     Returns
     -------
@@ -49,42 +69,24 @@ def train_mlp(
         Dictionary containing model name, accuracy, f1-score, and training time
     """
 
-    # -------------------------------
-    # Initialize Model
-    # -------------------------------
-    model = MLPClassifier(
-        hidden_layer_sizes=(64, 32),
-        activation="relu",
-        solver="adam",
-        max_iter=500,
-        random_state=42
+    return train_estimator(
+        MLPClassifier,
+        "Neural Network (MLP)",
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        **{**DEFAULT_PARAMS, **params}
     )
 
-    # -------------------------------
-    # Train Model (Time Tracking)
-    # -------------------------------
-    start_time = time.time()
-    model.fit(X_train, y_train)
-    training_time = time.time() - start_time
-
-    # -------------------------------
-    # Predictions
-    # -------------------------------
-    y_pred = model.predict(X_test)
-
-    # -------------------------------
-    # Compute Metrics
-    # -------------------------------
-    metrics = compute_classification_metrics(y_test, y_pred)
 
-    # -------------------------------
-    # Collect Results
-    # -------------------------------
-    results = {
-        "Model": "Neural Network (MLP)",
-        "Accuracy": metrics["accuracy"],
-        "F1-score": metrics["f1_score"],
-        "Time (s)": training_time
-    }
+# -------------------------------------------------
+# Streaming Variant
+# -------------------------------------------------
+def build_streaming_estimator(**params):
+    """
+    Returns an unfitted MLP for partial_fit training (one pass over each
+    chunk per call; max_iter does not apply).
+    """
+    return MLPClassifier(**{**DEFAULT_PARAMS, **params})
 
-    return results
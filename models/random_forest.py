@@ -14,9 +14,23 @@ NOTE:
 - This makes it ideal for GreenScore comparison
 """
 
-import time
 from sklearn.ensemble import RandomForestClassifier
-from utils.metrics import compute_classification_metrics
+from models.estimator import train_estimator
+
+
+# Default hyperparameters (registered in models/registry.py)
+DEFAULT_PARAMS = {
+    "n_estimators": 150,
+    "max_depth": None,
+    "random_state": 42,
+    "n_jobs": -1,
+}
+
+# Hyperparameter grid explored by pipeline/search.py
+SEARCH_SPACE = {
+    "n_estimators": [25, 50, 150, 300],
+    "max_depth": [None, 8, 16],
+}
 
 
 # -------------------------------------------------
@@ -26,7 +40,8 @@ def train_random_forest(
     X_train,
     y_train,
     X_test,
-    y_test
+    y_test,
+    **params
 ):
     """
     Trains a Random Forest classifier and evaluates it.
@@ -41,6 +56,8 @@ def train_random_forest(
         Scaled test features
     y_test : array-like
         Test labels
+    **params
+        Hyperparameters overriding DEFAULT_PARAMS
 
     Returns
     -------
@@ -48,41 +65,12 @@ def train_random_forest(
         Dictionary containing model name, accuracy, f1-score, and training time
     """
 
-    # -------------------------------
-    # Initialize Model
-    # -------------------------------
-    model = RandomForestClassifier(
-        n_estimators=150,
-        max_depth=None,
-        random_state=42,
-        n_jobs=-1
+    return train_estimator(
+        RandomForestClassifier,
+        "Random Forest",
+        X_train,
+        y_train,
+        X_test,
+        y_test,
+        **{**DEFAULT_PARAMS, **params}
     )
-
-    # -------------------------------
-    # Train Model (Time Tracking)
-    # -------------------------------
-    start_time = time.time()
-    model.fit(X_train, y_train)
-    training_time = time.time() - start_time
-
-    # -------------------------------
-    # Predictions
-    # -------------------------------
-    y_pred = model.predict(X_test)
-
-    # -------------------------------
-    # Compute Metrics
-    # -------------------------------
-    metrics = compute_classification_metrics(y_test, y_pred)
-
-    # -------------------------------
-    # Collect Results
-    # -------------------------------
-    results = {
-        "Model": "Random Forest",
-        "Accuracy": metrics["accuracy"],
-        "F1-score": metrics["f1_score"],
-        "Time (s)": training_time
-    }
-
-    return results
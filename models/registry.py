@@ -0,0 +1,297 @@
+"""
+registry.py
+-----------
+Model registry for the GreenScore pipeline.
+
+Responsibilities:
+1. Map model names to trainers, default hyperparameters and cost class
+2. Resolve the sidebar model selection into the models to train
+3. Allow extra scikit-learn estimators to be registered at runtime
+4. List models and their cost class without importing scikit-learn
+
+NOTE:
+- The pipeline never hardcodes the list of models, it asks the registry
+- Cost class is a rough relative training cost: "low", "medium", "high"
+- search_space maps hyperparameters to candidate values for
+  pipeline/search.py (empty = nothing to tune)
+- streaming builds an estimator with partial_fit for out-of-core
+  training (pipeline/streaming.py); None = batch training only
+- Built-in models are registered by name, cost class and import path.
+  Their module (and scikit-learn) is imported on the first get_model,
+  i.e. when a run resolves its models, so the dashboard sidebar starts
+  without scikit-learn. The import happens before any measured region
+"""
+
+import dataclasses
+import importlib
+import sys
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+
+COST_CLASSES = ("low", "medium", "high")
+
+
+@dataclass
+class ModelSpec:
+    """
+    Registry entry describing how to train one model.
+
+    trainer is called as trainer(X_train, y_train, X_test, y_test, **params)
+    and must return the standard results dictionary. When a training
+    budget is set it is also passed as budget=TrainingBudget (see
+    models/budget.py); train_estimator handles it.
+
+    streaming, if set, is called as streaming(**params) and returns an
+    unfitted estimator supporting partial_fit.
+
+    estimator is the scikit-learn class of entries added through
+    register_estimator (None for trainer functions).
+    """
+    name: str
+    trainer: Callable
+    params: dict = field(default_factory=dict)
+    cost_class: str = "medium"
+    search_space: dict = field(default_factory=dict)
+    streaming: Callable = None
+    estimator: type = None
+
+    def supports(self, param: str) -> bool:
+        """
+        True if the model exposes the hyperparameter (e.g. n_jobs).
+        """
+        return param in self.params
+
+    def runner(self, **overrides):
+        """
+        Returns a picklable callable training this model with its
+        default hyperparameters (optionally overridden).
+        """
+        return partial(self.trainer, **{**self.params, **overrides})
+
+    def estimator_identity(self):
+        """
+        Qualified class name and library version of a registered
+        estimator (None for trainer functions), for result keys.
+        """
+        if self.estimator is None:
+            return None
+        module = self.estimator.__module__
+        library = sys.modules.get(module.split(".")[0])
+        return {
+            "class": f"{module}.{self.estimator.__qualname__}",
+            "version": getattr(library, "__version__", None),
+        }
+
+    def with_params(self, **params) -> "ModelSpec":
+        """
+        Returns a copy of this entry with some default hyperparameters
+        replaced (e.g. by the winner of a hyperparameter search).
+        """
+        return dataclasses.replace(self, params={**self.params, **params})
+
+
+@dataclass
+class LazyModel:
+    """
+    Registry entry of a model whose module is imported on first use.
+
+    The module provides the trainer (attribute `trainer`), DEFAULT_PARAMS,
+    SEARCH_SPACE and, if it can be trained out of core,
+    build_streaming_estimator.
+    """
+    name: str
+    module: str
+    trainer: str
+    cost_class: str = "medium"
+
+    def load(self) -> ModelSpec:
+        module = importlib.import_module(self.module)
+        return ModelSpec(
+            self.name,
+            getattr(module, self.trainer),
+            dict(module.DEFAULT_PARAMS),
+            self.cost_class,
+            dict(getattr(module, "SEARCH_SPACE", {})),
+            getattr(module, "build_streaming_estimator", None),
+        )
+
+
+# name -> ModelSpec, or LazyModel until it is first looked up
+_REGISTRY = {}
+
+
+# -------------------------------------------------
+# Registration
+# -------------------------------------------------
+def register_model(
+    name: str,
+    trainer: Callable,
+    params: dict = None,
+    cost_class: str = "medium",
+    replace: bool = False,
+    search_space: dict = None,
+    streaming: Callable = None
+) -> ModelSpec:
+    """
+    Registers a model trainer under a display name.
+
+    Raises
+    ------
+    ValueError
+        If the name is already registered (and replace is False)
+        or the cost class is unknown.
+    """
+    if name in _REGISTRY and not replace:
+        raise ValueError(f"Model '{name}' is already registered.")
+    if cost_class not in COST_CLASSES:
+        raise ValueError(f"Cost class must be one of {COST_CLASSES}.")
+
+    spec = ModelSpec(
+        name, trainer, dict(params or {}), cost_class,
+        dict(search_space or {}), streaming
+    )
+    _REGISTRY[name] = spec
+    return spec
+
+
+def register_lazy_model(
+    name: str,
+    module: str,
+    trainer: str,
+    cost_class: str = "medium",
+    replace: bool = False
+) -> LazyModel:
+    """
+    Registers a model by the import path of its module and trainer,
+    without importing it.
+
+    Example
+    -------
+    >>> register_lazy_model("Logistic Regression", "models.logistic",
+    ...                     "train_logistic_regression", cost_class="low")
+    """
+    if name in _REGISTRY and not replace:
+        raise ValueError(f"Model '{name}' is already registered.")
+    if cost_class not in COST_CLASSES:
+        raise ValueError(f"Cost class must be one of {COST_CLASSES}.")
+
+    entry = LazyModel(name, module, trainer, cost_class)
+    _REGISTRY[name] = entry
+    return entry
+
+
+def register_estimator(
+    name: str,
+    estimator_cls,
+    params: dict = None,
+    cost_class: str = "medium",
+    replace: bool = False,
+    search_space: dict = None
+) -> ModelSpec:
+    """
+    Registers any scikit-learn classifier class without writing a trainer.
+    Classes with partial_fit can also be trained out of core.
+
+    Example
+    -------
+    >>> from sklearn.naive_bayes import GaussianNB
+    >>> register_estimator("Naive Bayes", GaussianNB, cost_class="low")
+    """
+    from models.estimator import train_estimator
+
+    trainer = partial(train_estimator, estimator_cls, name)
+    streaming = estimator_cls if hasattr(estimator_cls, "partial_fit") else None
+    spec = register_model(
+        name, trainer, params, cost_class, replace, search_space, streaming
+    )
+    spec.estimator = estimator_cls
+    return spec
+
+
+# -------------------------------------------------
+# Lookup
+# -------------------------------------------------
+def available_models() -> list:
+    """
+    Returns the registered model names in registration order.
+    """
+    return list(_REGISTRY)
+
+
+def get_model(name: str) -> ModelSpec:
+    """
+    Returns the registry entry for a model name (importing its module
+    if it was registered lazily).
+    """
+    try:
+        spec = _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown model '{name}'.") from None
+
+    if isinstance(spec, LazyModel):
+        spec = _REGISTRY[name] = spec.load()
+    return spec
+
+
+def model_cost_class(name: str) -> str:
+    """
+    Cost class of a model, without importing it.
+    """
+    try:
+        return _REGISTRY[name].cost_class
+    except KeyError:
+        raise ValueError(f"Unknown model '{name}'.") from None
+
+
+def resolve_models(selected_models=None) -> list:
+    """
+    Resolves a model selection into registry entries.
+
+    Parameters
+    ----------
+    selected_models : dict, iterable of str or None
+        Sidebar dict {name: bool}, a list of names, or None for all models
+
+    Returns
+    -------
+    list of ModelSpec
+        Selected models in registry order
+    """
+    if selected_models is None:
+        names = available_models()
+    elif isinstance(selected_models, dict):
+        names = [name for name, chosen in selected_models.items() if chosen]
+    else:
+        names = list(selected_models)
+
+    specs = [get_model(name) for name in names]
+    if not specs:
+        raise ValueError("Select at least one model to evaluate.")
+
+    order = available_models()
+    return sorted(specs, key=lambda spec: order.index(spec.name))
+
+
+# -------------------------------------------------
+# Built-in Models
+# -------------------------------------------------
+register_lazy_model(
+    "Logistic Regression",
+    "models.logistic",
+    "train_logistic_regression",
+    cost_class="low",
+)
+register_lazy_model(
+    "Random Forest",
+    "models.random_forest",
+    "train_random_forest",
+    cost_class="medium",
+)
+register_lazy_model(
+    "Neural Network (MLP)",
+    "models.mlp",
+    "train_mlp",
+    cost_class="high",
+)
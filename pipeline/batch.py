@@ -0,0 +1,429 @@
+"""
+batch.py
+--------
+Headless batch runner for GreenScore benchmark matrices.
+
+Responsibilities:
+1. Load a YAML / JSON matrix of datasets x model sets x weight profiles
+2. Run every (dataset, model set) job on a bounded worker pool
+3. Resume after interruption and keep a consolidated results store
+
+NOTE:
+- Weight profiles never retrain: each (dataset, model set) job runs the
+  pipeline once and is re-scored for every profile
+- A job is done once <out>/raw/<job_id>.csv (its raw measurements) and
+  <out>/jobs/<job_id>.csv exist; files are written atomically, so an
+  interrupted batch simply re-runs unfinished jobs
+- Job IDs leave out the weight profiles: on resume, finished jobs are
+  re-scored from their raw rows for the matrix's current profiles, so
+  added or edited profiles cover every job
+- <out>/results.csv is rebuilt from the job files after every job
+- "Pareto Optimal" is computed per job, over the models of that job
+- Nothing here imports Streamlit or Plotly, so batch jobs start fast
+- YAML needs PyYAML; JSON matrices work without it
+- With a "schedule" section, flexible jobs are deferred into low-carbon
+  windows before a deadline (see pipeline/carbon_schedule.py) and the
+  CO2 saved is written to <out>/schedule.csv
+"""
+
+import dataclasses
+import hashlib
+import json
+import os
+from concurrent.futures import as_completed
+
+import pandas as pd
+
+from pipeline.carbon_schedule import build_scheduler
+from pipeline.jobs import JobQueue
+from pipeline.results import PipelineResult
+from utils.baselines import ReferenceBaseline
+from utils.metrics import mark_pareto
+from utils.storage import atomic_write_csv, atomic_write_json
+
+
+BUILTIN_DATASET_MODE = "Controlled Mode (Built-in)"
+CUSTOM_DATASET_MODE = "Custom Dataset"
+
+DEFAULT_BATCH_DIR = "evaluation/batch"
+
+
+# -------------------------------------------------
+# Matrix Loading
+# -------------------------------------------------
+def load_matrix(path: str) -> dict:
+    """
+    Reads a benchmark matrix from a .yaml / .yml or .json file.
+
+    Example (YAML)
+    --------------
+    datasets:
+      - name: wine                     # built-in dataset
+      - name: churn
+        path: data/churn.parquet
+        target: churned
+        features: [age, tenure]        # optional
+    models:                            # one list, or named model sets
+      fast: [Logistic Regression]
+      all: null                        # null = every registered model
+    weights:
+      balanced: {accuracy: 0.4, energy: 0.2, carbon: 0.2, time: 0.2}
+      eco: {accuracy: 0.2, energy: 0.4, carbon: 0.4, time: 0.0}
+    options:                           # extra run_pipeline arguments
+      repetitions: 3
+    schedule:                          # optional carbon-aware scheduling
+      forecast: data/intensity.csv     # timestamp, carbon_intensity
+      deadline_hours: 8                # or deadline: 2026-01-01T06:00Z
+      job_seconds: 900                 # expected duration per job
+
+    Datasets with "flexible: false" always run immediately.
+    """
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError(
+                    "Reading YAML matrices requires PyYAML "
+                    "(pip install pyyaml); JSON matrices work without it."
+                ) from None
+            matrix = yaml.safe_load(f)
+        else:
+            matrix = json.load(f)
+
+    return validate_matrix(matrix)
+
+
+def validate_matrix(matrix: dict) -> dict:
+    """
+    Normalizes a matrix dict: model sets become {name: list or None},
+    weight profiles are required and every dataset needs a name.
+
+    Raises
+    ------
+    ValueError
+        If a section is missing or malformed.
+    """
+    if not isinstance(matrix, dict):
+        raise ValueError("Matrix must be a mapping.")
+
+    datasets = matrix.get("datasets") or [{"name": "wine"}]
+    for dataset in datasets:
+        if "name" not in dataset:
+            raise ValueError("Every dataset needs a name.")
+        if "path" in dataset and "target" not in dataset:
+            raise ValueError(f"Dataset '{dataset['name']}' needs a target column.")
+
+    models = matrix.get("models")
+    if models is None or isinstance(models, list):
+        models = {"default": models}
+
+    profiles = matrix.get("weights")
+    if not profiles:
+        raise ValueError("Matrix needs at least one weight profile.")
+
+    # Missing weights count as 0
+    weights = {
+        name: {"accuracy": 0.0, "energy": 0.0, "carbon": 0.0, "time": 0.0, **profile}
+        for name, profile in profiles.items()
+    }
+
+    return {
+        "datasets": datasets,
+        "models": models,
+        "weights": weights,
+        "options": matrix.get("options") or {},
+        "schedule": matrix.get("schedule"),
+    }
+
+
+# -------------------------------------------------
+# Jobs
+# -------------------------------------------------
+def job_id(dataset: dict, model_set, options: dict) -> str:
+    """
+    Stable ID of one (dataset, model set, options) job.
+    """
+    payload = json.dumps(
+        {"dataset": dataset, "models": model_set, "options": options},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def expand_jobs(matrix: dict) -> list:
+    """
+    Cross product of datasets and model sets.
+
+    Returns
+    -------
+    list of dict
+        {"id", "dataset", "model_set", "models", "flexible",
+        "pipeline_kwargs"}
+    """
+    jobs = []
+
+    for dataset in matrix["datasets"]:
+        for set_name, models in matrix["models"].items():
+            kwargs = dict(matrix["options"])
+            kwargs["selected_models"] = models
+
+            if "path" in dataset:
+                kwargs["dataset_mode"] = CUSTOM_DATASET_MODE
+                kwargs["uploaded_file"] = dataset["path"]
+                kwargs["target_column"] = dataset["target"]
+                kwargs["feature_columns"] = dataset.get("features")
+            else:
+                kwargs["dataset_mode"] = BUILTIN_DATASET_MODE
+
+            jobs.append({
+                "id": job_id(dataset, models, matrix["options"]),
+                "dataset": dataset["name"],
+                "model_set": set_name,
+                "models": models,
+                "flexible": dataset.get("flexible", True),
+                "pipeline_kwargs": kwargs,
+            })
+
+    return jobs
+
+
+def _job_path(out_dir, job, ext):
+    return os.path.join(out_dir, "jobs", f"{job['id']}.{ext}")
+
+
+def _raw_path(out_dir, job):
+    return os.path.join(out_dir, "raw", f"{job['id']}.csv")
+
+
+def is_done(out_dir: str, job: dict) -> bool:
+    return (
+        os.path.exists(_raw_path(out_dir, job))
+        and os.path.exists(_job_path(out_dir, job, "csv"))
+    )
+
+
+def _score_profiles(result, job, weights):
+    """
+    One block of rows per weight profile, tagged with the job.
+    """
+    frames = []
+    for profile, profile_weights in weights.items():
+        scored = mark_pareto(result.rescore(profile_weights).results)
+        scored.insert(0, "Profile", profile)
+        scored.insert(0, "Model Set", job["model_set"])
+        scored.insert(0, "Dataset", job["dataset"])
+        scored.insert(0, "Job ID", job["id"])
+        scored["Run ID"] = result.run_id
+        frames.append(scored)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _save_job(out_dir, job, result, weights):
+    """
+    Writes a finished job: metadata and baseline, raw rows, then the
+    scored rows (the file that marks the job as done).
+    """
+    baseline = dataclasses.asdict(result.baseline) if result.baseline is not None else None
+    atomic_write_json(
+        {"job": job, "metadata": result.metadata, "baseline": baseline},
+        _job_path(out_dir, job, "json"),
+    )
+    atomic_write_csv(result.raw, _raw_path(out_dir, job))
+    atomic_write_csv(
+        _score_profiles(result, job, weights), _job_path(out_dir, job, "csv")
+    )
+
+
+def rescore_job(out_dir: str, job: dict, weights: dict) -> pd.DataFrame:
+    """
+    Re-scores a finished job's stored raw rows for every weight profile
+    (with the baseline the run was normalized with) and rewrites its
+    scored rows.
+    """
+    with open(_job_path(out_dir, job, "json")) as f:
+        stored = json.load(f)
+
+    baseline = stored.get("baseline")
+    result = PipelineResult(
+        pd.read_csv(_raw_path(out_dir, job)), None, None,
+        metadata=stored["metadata"],
+        baseline=ReferenceBaseline(**baseline) if baseline else None,
+    )
+
+    scored = _score_profiles(result, job, weights)
+    atomic_write_csv(scored, _job_path(out_dir, job, "csv"))
+    return scored
+
+
+def consolidate(out_dir: str) -> pd.DataFrame:
+    """
+    Rebuilds <out_dir>/results.csv from every finished job file.
+    """
+    jobs_dir = os.path.join(out_dir, "jobs")
+    frames = [
+        pd.read_csv(os.path.join(jobs_dir, name))
+        for name in sorted(os.listdir(jobs_dir))
+        if name.endswith(".csv")
+    ] if os.path.isdir(jobs_dir) else []
+
+    results = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    atomic_write_csv(results, os.path.join(out_dir, "results.csv"))
+    return results
+
+
+# -------------------------------------------------
+# Batch Execution
+# -------------------------------------------------
+def run_matrix(
+    matrix: dict,
+    out_dir: str = DEFAULT_BATCH_DIR,
+    workers: int = 1,
+    resume: bool = True,
+    log=print,
+    history_db: str = None,
+    scheduler=None
+) -> dict:
+    """
+    Runs every unfinished job of a matrix.
+
+    Parameters
+    ----------
+    matrix : dict
+        Output of load_matrix / validate_matrix
+    out_dir : str, optional
+        Batch directory (job files, results.csv, matrix.json)
+    workers : int, optional
+        Concurrent pipeline runs (cores are split between them,
+        see pipeline/jobs.py)
+    resume : bool, optional
+        Skip jobs that already have result files (they are re-scored
+        for the current weight profiles instead)
+    log : callable, optional
+        Progress messages
+    history_db : str, optional
+        Also record every run in this run-history database
+        (see record_run in utils/metrics.py)
+    scheduler : CarbonScheduler, optional
+        Defers flexible jobs into low-carbon windows (default: built
+        from the matrix "schedule" section, if any)
+
+    Returns
+    -------
+    dict
+        {"done": [...], "skipped": [...], "failed": {job_id: error}},
+        plus "co2_saved_g" when scheduled
+    """
+    matrix = validate_matrix(matrix)
+    atomic_write_json(matrix, os.path.join(out_dir, "matrix.json"))
+
+    jobs = expand_jobs(matrix)
+    pending = [job for job in jobs if not (resume and is_done(out_dir, job))]
+    summary = {
+        "done": [],
+        "skipped": [job["id"] for job in jobs if job not in pending],
+        "failed": {},
+    }
+
+    if summary["skipped"]:
+        log(f"Resuming: {len(summary['skipped'])} of {len(jobs)} jobs already done.")
+        for job in jobs:
+            if job["id"] in summary["skipped"]:
+                rescore_job(out_dir, job, matrix["weights"])
+
+    # The first profile drives anything scored during the run (e.g. search)
+    run_weights = next(iter(matrix["weights"].values()))
+
+    # -------------------------------
+    # Carbon-aware plan
+    # -------------------------------
+    if scheduler is None and matrix["schedule"]:
+        scheduler = build_scheduler(matrix["schedule"])
+
+    plan = {}
+    started = {}
+    finished = {}
+    savings = []
+    if scheduler is not None:
+        plan_df = scheduler.plan(pending, workers, flexible=lambda job: job["flexible"])
+        plan = plan_df.set_index("Job ID").to_dict("index")
+        # Workers take jobs in submission order
+        pending = sorted(pending, key=lambda job: plan[job["id"]]["Planned Start"])
+        deferred = (plan_df["Hold Until"] > scheduler.clock()).sum()
+        log(f"Scheduled {len(plan_df)} jobs, {deferred} deferred to lower-carbon windows.")
+
+    def wait_for_slot(job):
+        if scheduler is None:
+            return None
+
+        def wait():
+            scheduler.wait_until(plan[job["id"]]["Hold Until"])
+            started[job["id"]] = scheduler.clock()
+        return wait
+
+    def record_finish(job):
+        if scheduler is None:
+            return None
+
+        def finish():
+            finished[job["id"]] = scheduler.clock()
+        return finish
+
+    queue = JobQueue(max_concurrent_runs=workers)
+    try:
+        futures = {
+            queue.submit(
+                wait=wait_for_slot(job),
+                finish=record_finish(job),
+                weights=run_weights,
+                history_db=history_db,
+                **job["pipeline_kwargs"],
+            ): job
+            for job in pending
+        }
+
+        for future in as_completed(futures):
+            job = futures[future]
+            label = f"{job['dataset']} / {job['model_set']} ({job['id']})"
+
+            try:
+                result = future.result()
+            except Exception as e:
+                summary["failed"][job["id"]] = str(e)
+                log(f"FAILED {label}: {e}")
+                continue
+
+            _save_job(out_dir, job, result, matrix["weights"])
+            consolidate(out_dir)
+
+            if scheduler is not None:
+                raw = result.raw
+                # Replayed (cached) and projected rows cost nothing now
+                measured = raw[raw["Source"] == "measured"]
+                savings.append({
+                    "Job ID": job["id"],
+                    "Dataset": job["dataset"],
+                    "Model Set": job["model_set"],
+                    "Flexible": job["flexible"],
+                    **scheduler.savings(
+                        float(measured["Energy (kWh)"].sum()),
+                        plan[job["id"]]["Immediate Start"],
+                        started[job["id"]],
+                        finished[job["id"]],
+                    ),
+                })
+
+            summary["done"].append(job["id"])
+            log(f"done   {label}")
+    finally:
+        queue.shutdown()
+
+    if savings:
+        savings_df = pd.DataFrame(savings)
+        atomic_write_csv(savings_df, os.path.join(out_dir, "schedule.csv"))
+        summary["co2_saved_g"] = float(savings_df["CO2 Saved (g)"].sum())
+        log(f"CO2 saved vs. running immediately: {summary['co2_saved_g']:.4g} g")
+
+    consolidate(out_dir)
+    return summary
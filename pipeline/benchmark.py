@@ -0,0 +1,290 @@
+"""
+benchmark.py
+------------
+Repeated-measurement benchmark mode for the GreenScore pipeline.
+
+Responsibilities:
+1. Train every model N times (after optional warm-up runs)
+2. Summarize time, energy and CO2 with median, IQR and confidence intervals
+3. Rank models by GreenScore while flagging statistically tied models
+
+NOTE:
+- Warm-up runs are a separate pass that ends before the measured runs
+  start; their results are discarded
+- In process mode all measured repetitions run concurrently under one
+  tracker and energy is attributed by CPU time share (see
+  pipeline/executor.py)
+- Confidence intervals are percentile bootstraps of the median
+"""
+
+import numpy as np
+import pandas as pd
+
+from models.budget import BUDGET_COLUMN
+from models.estimator import ARTIFACTS_KEY
+from pipeline.profiling import span
+from pipeline.training import train_serial, train_parallel
+from utils.metrics import RAW_RESULT_COLUMNS, compute_greenscore
+
+
+BENCHMARK_METRICS = ["Accuracy", "Time (s)", "Energy (kWh)", "CO2 (kg)"]
+
+
+# -------------------------------------------------
+# Repeated Training
+# -------------------------------------------------
+def run_repetitions(
+    specs,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    repetitions: int = 5,
+    warmup: int = 1,
+    seeds=None,
+    executor: str = "serial",
+    max_workers: int = None,
+    cpu_affinity=None,
+    overrides: dict = None,
+    return_estimators: bool = False,
+    energy_backend=None,
+    budget=None,
+    memory_backend="rss"
+):
+    """
+    Trains each model `repetitions` times and returns every measurement.
+
+    Parameters
+    ----------
+    specs : list of ModelSpec
+        Models to benchmark (see models/registry.py)
+    X_train, y_train, X_test, y_test : array-like
+        Preprocessed data
+    repetitions : int, optional
+        Measured runs per model
+    warmup : int, optional
+        Discarded runs per model before the measured ones
+    seeds : list of int, optional
+        One random_state per repetition for models that accept it
+        (default = each model's own random_state)
+    executor : {"serial", "process"}, optional
+        Run repetitions one by one or concurrently in a process pool
+    max_workers, cpu_affinity : optional
+        Process pool settings (see pipeline/executor.py)
+    overrides : dict, optional
+        Extra hyperparameters for models that expose them (e.g. n_jobs)
+    return_estimators : bool, optional
+        Also return {model name: fitted estimator} of the last repetition
+    energy_backend : str or EnergyBackend, optional
+        Energy meter (see pipeline/energy.py)
+    budget : TrainingBudget, optional
+        Per-model training limits (see models/budget.py)
+    memory_backend : str, optional
+        Memory meter of the trainers (see pipeline/memory.py)
+
+    Returns
+    -------
+    pd.DataFrame[, dict]
+        One row per model and repetition with a "Repetition" and "Seed"
+        column in addition to the raw result columns
+    """
+
+    if repetitions < 1:
+        raise ValueError("Repetitions must be at least 1.")
+    if seeds is not None and len(seeds) != repetitions:
+        raise ValueError("Provide one seed per repetition.")
+
+    overrides = overrides or {}
+
+    def tasks_for(seed):
+        tasks = []
+        for spec in specs:
+            params = {k: v for k, v in overrides.items() if spec.supports(k)}
+            if seed is not None and spec.supports("random_state"):
+                params["random_state"] = seed
+            if budget is not None:
+                params["budget"] = budget
+            if memory_backend != "rss":
+                params["memory_backend"] = memory_backend
+            tasks.append((spec.name, spec.runner(**params)))
+        return tasks
+
+    def train(tasks):
+        if executor == "process":
+            return train_parallel(
+                tasks, X_train, y_train, X_test, y_test,
+                max_workers, cpu_affinity, energy_backend
+            )
+        return train_serial(
+            tasks, X_train, y_train, X_test, y_test, energy_backend
+        )
+
+    # Warm-ups finish before the measured runs start, so in a process pool
+    # they never compete with them for cores; their results are dropped
+    if warmup:
+        with span("warm-up", runs=warmup):
+            train([task for _ in range(warmup) for task in tasks_for(None)])
+
+    labels = [(rep, seeds[rep] if seeds else None) for rep in range(repetitions)]
+    rows = train([task for _, seed in labels for task in tasks_for(seed)])
+    labels = [label for label in labels for _ in specs]
+
+    measurements = []
+    estimators = {}
+    for row, (rep, seed) in zip(rows, labels):
+        artifacts = row.pop(ARTIFACTS_KEY, None) or {}
+        estimators[row["Model"]] = artifacts.get("estimator")
+        measurements.append({**row, "Repetition": rep, "Seed": seed})
+
+    if return_estimators:
+        return pd.DataFrame(measurements), estimators
+    return pd.DataFrame(measurements)
+
+
+def median_results(repetitions_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Collapses repetitions into one row per model (median of each raw
+    column), keeping the order in which models first appear. A model is
+    "Budget Limited" if any of its repetitions was.
+    """
+    columns = [c for c in RAW_RESULT_COLUMNS if c in repetitions_df.columns]
+    order = list(dict.fromkeys(repetitions_df["Model"]))
+
+    medians = (
+        repetitions_df[columns]
+        .groupby("Model", sort=False)
+        .median()
+        .reindex(order)
+        .reset_index()
+    )
+    medians["Repetitions"] = repetitions_df.groupby("Model", sort=False).size().reindex(order).values
+
+    if BUDGET_COLUMN in repetitions_df.columns:
+        limited = repetitions_df.groupby("Model", sort=False)[BUDGET_COLUMN].any()
+        medians[BUDGET_COLUMN] = limited.reindex(order).values
+
+    return medians
+
+
+# -------------------------------------------------
+# Bootstrap Helpers
+# -------------------------------------------------
+def bootstrap_median_ci(
+    values,
+    confidence: float = 0.95,
+    n_boot: int = 2000,
+    random_state: int = 0
+):
+    """
+    Percentile bootstrap confidence interval of the median.
+
+    Returns
+    -------
+    (float, float)
+        Lower and upper bound
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return float(values[0]), float(values[0])
+
+    rng = np.random.default_rng(random_state)
+    samples = values[rng.integers(0, len(values), size=(n_boot, len(values)))]
+    medians = np.median(samples, axis=1)
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(medians, [alpha, 1 - alpha])
+    return float(low), float(high)
+
+
+# -------------------------------------------------
+# Summary Statistics
+# -------------------------------------------------
+def summarize_repetitions(
+    repetitions_df: pd.DataFrame,
+    metrics=BENCHMARK_METRICS,
+    confidence: float = 0.95,
+    n_boot: int = 2000,
+    random_state: int = 0
+) -> pd.DataFrame:
+    """
+    Median, IQR and bootstrap CI of the median per model and metric.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per model with "<metric> median", "<metric> IQR",
+        "<metric> CI low" and "<metric> CI high" columns
+    """
+    rows = []
+
+    for model, group in repetitions_df.groupby("Model", sort=False):
+        row = {"Model": model, "Repetitions": len(group)}
+
+        for metric in metrics:
+            values = group[metric].to_numpy(dtype=float)
+            q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+            low, high = bootstrap_median_ci(values, confidence, n_boot, random_state)
+
+            row[f"{metric} median"] = median
+            row[f"{metric} IQR"] = q3 - q1
+            row[f"{metric} CI low"] = low
+            row[f"{metric} CI high"] = high
+
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+# -------------------------------------------------
+# Significance-Aware Ranking
+# -------------------------------------------------
+def rank_with_significance(
+    repetitions_df: pd.DataFrame,
+    weights: dict,
+    confidence: float = 0.95,
+    n_boot: int = 2000,
+    random_state: int = 0
+) -> pd.DataFrame:
+    """
+    Ranks models by median GreenScore across repetitions.
+
+    GreenScore is computed within each repetition, then each model is
+    compared to the leader on paired per-repetition differences. A model
+    is "Tied With Best" when the bootstrap CI of the median difference
+    to the leader includes zero.
+
+    Returns
+    -------
+    pd.DataFrame
+        Model, GreenScore median / CI, Rank and Tied With Best
+    """
+    scored = pd.concat(
+        [
+            compute_greenscore(group, weights)
+            for _, group in repetitions_df.groupby("Repetition")
+        ],
+        ignore_index=True,
+    )
+    scores = scored.pivot(index="Repetition", columns="Model", values="GreenScore")
+
+    medians = scores.median().sort_values(ascending=False)
+    leader = medians.index[0]
+
+    rows = []
+    for rank, model in enumerate(medians.index, start=1):
+        low, high = bootstrap_median_ci(
+            scores[model], confidence, n_boot, random_state
+        )
+        diff_low, _ = bootstrap_median_ci(
+            scores[leader] - scores[model], confidence, n_boot, random_state
+        )
+        rows.append({
+            "Model": model,
+            "GreenScore median": medians[model],
+            "GreenScore CI low": low,
+            "GreenScore CI high": high,
+            "Rank": rank,
+            "Tied With Best": model == leader or diff_low <= 0,
+        })
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,304 @@
+"""
+carbon_schedule.py
+------------------
+Carbon-aware scheduling of batch benchmark jobs.
+
+Responsibilities:
+1. Read a grid carbon-intensity forecast (CSV time series)
+2. Plan each flexible job into the lowest-intensity window that still
+   finishes before a deadline
+3. Report the CO2 saved compared with running every job immediately
+
+NOTE:
+- The forecast is a step function: each intensity (gCO2/kWh) holds from
+  its timestamp until the next one; before the first / after the last
+  point the nearest value is used
+- Planning places one job at a time over `workers` slots, using an
+  expected duration per job. Jobs planned back to back start as soon as
+  their predecessor finishes, so shorter-than-expected jobs never wait
+  for the next window. The "immediate" plan runs every job back to back
+  from now
+- Savings use the measured energy and duration of each job and the
+  forecast intensity of its actual vs. immediate window; the CO2 columns
+  of the results themselves are whatever the energy meter reported
+- clock and sleep are injectable, so a stub forecast and a fake clock
+  can replace real time
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+TIMESTAMP_COLUMN = "timestamp"
+INTENSITY_COLUMN = "carbon_intensity"
+
+DEFAULT_JOB_SECONDS = 900
+
+_EPOCH = pd.Timestamp("1970-01-01", tz="UTC")
+
+
+# -------------------------------------------------
+# Forecast
+# -------------------------------------------------
+def to_epoch(timestamp) -> float:
+    """
+    Seconds since the epoch of an ISO 8601 string, datetime or number.
+    Naive timestamps are taken as UTC.
+    """
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+
+    timestamp = pd.Timestamp(timestamp)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize("UTC")
+    return (timestamp - _EPOCH) / pd.Timedelta(seconds=1)
+
+
+def load_intensity_forecast(source) -> pd.DataFrame:
+    """
+    Reads a carbon-intensity forecast.
+
+    Parameters
+    ----------
+    source : str or pd.DataFrame
+        CSV path (or DataFrame) with "timestamp" (ISO 8601, naive = UTC)
+        and "carbon_intensity" (gCO2/kWh) columns
+
+    Returns
+    -------
+    pd.DataFrame
+        "time" (epoch seconds) and "carbon_intensity", sorted by time
+    """
+    df = pd.read_csv(source) if isinstance(source, str) else source.copy()
+
+    missing = {TIMESTAMP_COLUMN, INTENSITY_COLUMN} - set(df.columns)
+    if missing:
+        raise ValueError(f"Forecast is missing column(s): {sorted(missing)}.")
+    if df.empty:
+        raise ValueError("Forecast has no rows.")
+
+    times = pd.to_datetime(df[TIMESTAMP_COLUMN], utc=True)
+    forecast = pd.DataFrame({
+        "time": (times - _EPOCH) / pd.Timedelta(seconds=1),
+        INTENSITY_COLUMN: df[INTENSITY_COLUMN].astype(float),
+    })
+    return forecast.sort_values("time", ignore_index=True)
+
+
+def mean_intensity(forecast: pd.DataFrame, start: float, end: float) -> float:
+    """
+    Time-weighted mean intensity over [start, end] (the value at start
+    for an empty window).
+    """
+    times = forecast["time"].to_numpy()
+    values = forecast[INTENSITY_COLUMN].to_numpy()
+
+    def value_at(t):
+        return values[np.clip(np.searchsorted(times, t, side="right") - 1, 0, None)]
+
+    if end <= start:
+        return float(value_at(start))
+
+    edges = np.concatenate(([start], times[(times > start) & (times < end)], [end]))
+    return float(np.sum(value_at(edges[:-1]) * np.diff(edges)) / (end - start))
+
+
+# -------------------------------------------------
+# Scheduler
+# -------------------------------------------------
+def _last_end(intervals, now):
+    return max([now] + [end for _, end in intervals])
+
+
+def _flatten(intervals):
+    return [edge for interval in intervals for edge in interval]
+
+
+@dataclass
+class CarbonScheduler:
+    """
+    Plans and times flexible jobs against an intensity forecast.
+
+    Attributes
+    ----------
+    forecast : pd.DataFrame
+        Output of load_intensity_forecast
+    deadline : float
+        Epoch seconds by which every job should have finished
+    job_seconds : float
+        Expected duration of one job (used for planning only)
+    clock, sleep : callable
+        Time source and sleep function (time.time / time.sleep)
+    """
+    forecast: pd.DataFrame
+    deadline: float
+    job_seconds: float = DEFAULT_JOB_SECONDS
+    clock: object = time.time
+    sleep: object = time.sleep
+
+    def plan(self, jobs: list, workers: int = 1, flexible=None) -> pd.DataFrame:
+        """
+        Plans jobs over `workers` slots.
+
+        Jobs that cannot move run first, back to back from now. Each
+        flexible job then takes the lowest-intensity start at which a
+        slot is free for job_seconds and that finishes by the deadline
+        (right after the last job if none is left).
+
+        Parameters
+        ----------
+        jobs : list of dict
+            Jobs with an "id" (see pipeline/batch.py)
+        flexible : callable, optional
+            flexible(job) -> False runs that job immediately
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per job, in planned order: "Job ID", "Flexible",
+            "Immediate Start", "Planned Start", "Hold Until" (start of
+            the job's back-to-back block: the job waits until then and
+            otherwise runs as soon as a slot frees up) and the forecast
+            mean intensity of the immediate and planned windows
+        """
+        now = self.clock()
+        duration = self.job_seconds
+        busy = [[] for _ in range(max(1, workers))]
+
+        is_flexible = {job["id"]: flexible is None or flexible(job) for job in jobs}
+        ordered = sorted(jobs, key=lambda job: is_flexible[job["id"]])
+
+        placed = {}
+        for job in ordered:
+            if is_flexible[job["id"]]:
+                start, slot = self._place(busy, now)
+            else:
+                slot = int(np.argmin([_last_end(intervals, now) for intervals in busy]))
+                start = _last_end(busy[slot], now)
+            busy[slot].append((start, start + duration))
+            placed[job["id"]] = (slot, start)
+
+        # A job right after another one in its slot starts with that block
+        hold = {}
+        for slot, intervals in enumerate(busy):
+            block_start = None
+            previous_end = None
+            for start, end in sorted(intervals):
+                if previous_end is None or start > previous_end + 1e-6:
+                    block_start = start
+                hold[slot, start] = block_start
+                previous_end = end
+
+        rows = []
+        immediate_slots = [now] * len(busy)
+        for job in ordered:
+            slot = int(np.argmin(immediate_slots))
+            immediate = immediate_slots[slot]
+            immediate_slots[slot] = immediate + duration
+
+            slot, start = placed[job["id"]]
+            rows.append({
+                "Job ID": job["id"],
+                "Flexible": is_flexible[job["id"]],
+                "Immediate Start": immediate,
+                "Planned Start": start,
+                "Hold Until": hold[slot, start],
+                "Immediate Intensity": mean_intensity(
+                    self.forecast, immediate, immediate + duration
+                ),
+                "Planned Intensity": mean_intensity(
+                    self.forecast, start, start + duration
+                ),
+            })
+
+        return pd.DataFrame(rows).sort_values("Planned Start", ignore_index=True)
+
+    def _place(self, busy, now):
+        duration = self.job_seconds
+        latest = self.deadline - duration
+
+        # Breakpoints of the forecast and edges of already planned jobs
+        times = self.forecast["time"].to_numpy()
+        edges = np.array([edge for intervals in busy for edge in _flatten(intervals)])
+        candidates = np.concatenate(([now, latest], times, times - duration, edges, edges - duration))
+        candidates = np.unique(candidates[(candidates >= now) & (candidates <= latest)])
+
+        means = [mean_intensity(self.forecast, t, t + duration) for t in candidates]
+        for i in np.lexsort((candidates, means)):
+            start = candidates[i]
+            for slot, intervals in enumerate(busy):
+                if all(start + duration <= s or start >= e for s, e in intervals):
+                    return float(start), slot
+
+        # Nothing fits before the deadline: run after the last job
+        slot = int(np.argmin([_last_end(intervals, now) for intervals in busy]))
+        return _last_end(busy[slot], now), slot
+
+    def wait_until(self, start: float):
+        """
+        Blocks until the clock reaches start.
+        """
+        while True:
+            remaining = start - self.clock()
+            if remaining <= 0:
+                return
+            self.sleep(remaining)
+
+    def savings(
+        self,
+        energy_kwh: float,
+        immediate_start: float,
+        started: float,
+        finished: float
+    ) -> dict:
+        """
+        CO2 of a finished job in its actual window vs. the same job run
+        in its immediate window (grams, from the forecast).
+        """
+        duration = finished - started
+        actual = mean_intensity(self.forecast, started, finished)
+        immediate = mean_intensity(
+            self.forecast, immediate_start, immediate_start + duration
+        )
+        return {
+            "Energy (kWh)": energy_kwh,
+            "Intensity (g/kWh)": actual,
+            "Immediate Intensity (g/kWh)": immediate,
+            "CO2 (g)": energy_kwh * actual,
+            "Immediate CO2 (g)": energy_kwh * immediate,
+            "CO2 Saved (g)": energy_kwh * (immediate - actual),
+        }
+
+
+def build_scheduler(config: dict, clock=time.time, sleep=time.sleep) -> CarbonScheduler:
+    """
+    CarbonScheduler from a matrix "schedule" section.
+
+    config keys: "forecast" (CSV path), "deadline" (ISO 8601 timestamp)
+    or "deadline_hours" (from now), optional "job_seconds".
+
+    Raises
+    ------
+    ValueError
+        If the forecast or deadline is missing.
+    """
+    if "forecast" not in config:
+        raise ValueError("Schedule needs a forecast file.")
+
+    if "deadline" in config:
+        deadline = to_epoch(config["deadline"])
+    elif "deadline_hours" in config:
+        deadline = clock() + float(config["deadline_hours"]) * 3600
+    else:
+        raise ValueError("Schedule needs a deadline or deadline_hours.")
+
+    return CarbonScheduler(
+        forecast=load_intensity_forecast(config["forecast"]),
+        deadline=deadline,
+        job_seconds=float(config.get("job_seconds", DEFAULT_JOB_SECONDS)),
+        clock=clock,
+        sleep=sleep,
+    )
@@ -0,0 +1,415 @@
+"""
+energy.py
+---------
+Pluggable energy measurement backends for the GreenScore pipeline.
+
+Responsibilities:
+1. Common interface: measure the energy of a labelled code region
+2. CodeCarbon backend (one EmissionsTracker per region, the default)
+3. Long-lived sampler reading RAPL counters directly, falling back to
+   a CPU-time x TDP estimate where RAPL is not available
+
+NOTE:
+- A region is started with backend.start_region(label) and stopped
+  with region.stop(), which returns (emissions_kg, energy_kwh)
+- The sampler reads the counters synchronously at region boundaries,
+  so short fits are not limited by the sampling interval. The
+  background thread (default every 50 ms) catches counter wraparound
+  and keeps a power history
+- Counters are machine-wide: regions measured at the same time (e.g.
+  concurrent sessions) each see the whole machine's energy
+- Counter sources only need read() -> {domain: microjoules} and
+  max_range() -> {domain: microjoules or None}, so the sampler can be
+  driven by FakeCounterSource on machines without RAPL
+"""
+
+import glob
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+ENERGY_BACKENDS = ("codecarbon", "rapl", "cputime", "auto")
+
+DEFAULT_SAMPLE_INTERVAL = 0.05
+DEFAULT_POWERCAP_ROOT = "/sys/class/powercap"
+
+# Fallback estimate: CPU package TDP (W), split evenly over logical CPUs
+DEFAULT_TDP_WATTS = 85.0
+
+# Grid carbon intensity (g CO2 / kWh) used by the sampler backends
+DEFAULT_CARBON_INTENSITY = 475.0
+
+JOULES_PER_KWH = 3.6e6
+
+
+# -------------------------------------------------
+# Backend Interface
+# -------------------------------------------------
+class EnergyBackend:
+    """
+    Base class of all energy backends.
+    """
+    name = "base"
+
+    def start_region(self, label: str = None):
+        """
+        Starts measuring a region; returns an object whose stop()
+        returns (emissions_kg, energy_kwh).
+        """
+        raise NotImplementedError
+
+    @contextmanager
+    def region(self, label: str = None):
+        """
+        Context manager measuring the enclosed block.
+
+        The yielded dict receives "emissions_kg" and "energy_kwh"
+        when the block exits.
+        """
+        measurement = {"label": label}
+        active = self.start_region(label)
+        try:
+            yield measurement
+        finally:
+            emissions_kg, energy_kwh = active.stop()
+            measurement["emissions_kg"] = emissions_kg
+            measurement["energy_kwh"] = energy_kwh
+
+    def close(self) -> None:
+        """
+        Releases background resources (no-op by default).
+        """
+
+
+# -------------------------------------------------
+# CodeCarbon Backend
+# -------------------------------------------------
+class _CodeCarbonRegion:
+
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def stop(self):
+        emissions_kg = self.tracker.stop() or 0.0
+
+        data = self.tracker.final_emissions_data
+        energy_kwh = data.energy_consumed if data is not None else 0.0
+
+        return emissions_kg, energy_kwh
+
+
+class CodeCarbonBackend(EnergyBackend):
+    """
+    Starts a CodeCarbon tracker per region that keeps its data in
+    memory only.
+    """
+    name = "codecarbon"
+
+    def start_region(self, label: str = None):
+        # Imported here so the sampler backends work without codecarbon
+        from codecarbon import EmissionsTracker
+
+        tracker = EmissionsTracker(
+            project_name="GreenScore",
+            save_to_file=False,
+            log_level="error",
+        )
+        tracker.start()
+        return _CodeCarbonRegion(tracker)
+
+
+# -------------------------------------------------
+# Counter Sources
+# -------------------------------------------------
+class RaplCounterSource:
+    """
+    Reads the package-level RAPL energy counters under
+    /sys/class/powercap (intel-rapl:0, intel-rapl:1, ...).
+
+    Sub-domains (core, uncore, dram) are skipped since the package
+    counters already include them.
+    """
+
+    def __init__(self, root: str = DEFAULT_POWERCAP_ROOT):
+        self.root = root
+        self.domains = sorted(
+            path for path in glob.glob(os.path.join(root, "intel-rapl:*"))
+            if os.path.basename(path).count(":") == 1
+            and os.path.exists(os.path.join(path, "energy_uj"))
+        )
+
+    @staticmethod
+    def _read_int(path):
+        with open(path) as f:
+            return int(f.read().strip())
+
+    def available(self) -> bool:
+        """
+        True if at least one domain exists and is readable
+        (energy_uj is often root-only).
+        """
+        try:
+            self.read()
+        except OSError:
+            return False
+        return bool(self.domains)
+
+    def read(self) -> dict:
+        return {
+            path: self._read_int(os.path.join(path, "energy_uj"))
+            for path in self.domains
+        }
+
+    def max_range(self) -> dict:
+        ranges = {}
+        for path in self.domains:
+            try:
+                ranges[path] = self._read_int(
+                    os.path.join(path, "max_energy_range_uj")
+                )
+            except OSError:
+                ranges[path] = None
+        return ranges
+
+
+class CpuTimeCounterSource:
+    """
+    Estimates energy from CPU time: every busy logical CPU is assumed
+    to draw tdp_watts / cpu_count.
+
+    CPU time of this process and its finished children (e.g. process
+    pool workers) is counted.
+    """
+
+    def __init__(self, tdp_watts: float = DEFAULT_TDP_WATTS, cpu_count: int = None):
+        self.watts_per_cpu = tdp_watts / (cpu_count or os.cpu_count() or 1)
+
+    def read(self) -> dict:
+        t = os.times()
+        cpu_seconds = t.user + t.system + t.children_user + t.children_system
+        return {"cpu": int(cpu_seconds * self.watts_per_cpu * 1e6)}
+
+    def max_range(self) -> dict:
+        return {"cpu": None}
+
+
+class FakeCounterSource:
+    """
+    Deterministic counter for testing: draws a constant `watts` as
+    measured by `clock` and wraps around at max_range_uj (if given).
+    """
+
+    def __init__(self, watts: float = 10.0, max_range_uj: int = None, clock=time.perf_counter):
+        self.watts = watts
+        self.max_range_uj = max_range_uj
+        self.clock = clock
+        self.started = clock()
+
+    def read(self) -> dict:
+        value = int((self.clock() - self.started) * self.watts * 1e6)
+        if self.max_range_uj:
+            value %= self.max_range_uj
+        return {"fake": value}
+
+    def max_range(self) -> dict:
+        return {"fake": self.max_range_uj}
+
+
+# -------------------------------------------------
+# Sampler Backend
+# -------------------------------------------------
+class _SamplerRegion:
+
+    def __init__(self, sampler, label):
+        self.sampler = sampler
+        self.label = label
+        self.started = time.perf_counter()
+        self.start_joules = sampler.sample()
+
+    def peek(self):
+        """
+        (emissions_kg, energy_kwh) so far, without ending the region.
+        """
+        joules = self.sampler.sample() - self.start_joules
+        energy_kwh = joules / JOULES_PER_KWH
+        return energy_kwh * self.sampler.carbon_intensity / 1000, energy_kwh
+
+    def stop(self):
+        emissions_kg, energy_kwh = self.peek()
+
+        self.sampler.regions.append({
+            "label": self.label,
+            "seconds": time.perf_counter() - self.started,
+            "energy_kwh": energy_kwh,
+            "emissions_kg": emissions_kg,
+        })
+
+        return emissions_kg, energy_kwh
+
+
+class EnergySampler(EnergyBackend):
+    """
+    Long-lived sampler accumulating energy from a counter source.
+
+    Parameters
+    ----------
+    source : counter source
+        RaplCounterSource, CpuTimeCounterSource or FakeCounterSource
+    interval : float, optional
+        Background sampling interval in seconds (0 disables the thread;
+        region boundaries are always sampled)
+    carbon_intensity : float, optional
+        g CO2 per kWh used to convert energy to emissions
+    history : int, optional
+        Number of samples and finished regions kept for inspection
+    """
+
+    def __init__(
+        self,
+        source,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        carbon_intensity: float = DEFAULT_CARBON_INTENSITY,
+        history: int = 2048,
+        name: str = "sampler"
+    ):
+        self.source = source
+        self.interval = interval
+        self.carbon_intensity = carbon_intensity
+        self.name = name
+
+        self.samples = deque(maxlen=history)   # (perf_counter, joules)
+        self.regions = deque(maxlen=history)   # finished region dicts
+
+        self._lock = threading.Lock()
+        self._ranges = source.max_range()
+        self._last = source.read()
+        self._total_uj = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    # -------------------------------
+    # Sampling
+    # -------------------------------
+    def sample(self) -> float:
+        """
+        Reads the counters and returns the accumulated energy (J).
+
+        A counter lower than its previous reading wrapped around at its
+        max range (or was reset if the range is unknown).
+        """
+        with self._lock:
+            current = self.source.read()
+
+            for domain, value in current.items():
+                delta = value - self._last.get(domain, value)
+                if delta < 0:
+                    max_range = self._ranges.get(domain)
+                    delta = delta + max_range if max_range else value
+                self._total_uj += delta
+
+            self._last = current
+            joules = self._total_uj / 1e6
+            self.samples.append((time.perf_counter(), joules))
+
+        return joules
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        """
+        Starts the background sampling thread (idempotent).
+        """
+        if self.interval and (self._thread is None or not self._thread.is_alive()):
+            self._stop_event.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="greenscore-energy", daemon=True
+            )
+            self._thread.start()
+
+    def close(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    # -------------------------------
+    # Regions
+    # -------------------------------
+    def start_region(self, label: str = None):
+        self.start()
+        return _SamplerRegion(self, label)
+
+    def power_watts(self) -> list:
+        """
+        Average power between consecutive samples as
+        [(perf_counter, watts), ...].
+        """
+        samples = list(self.samples)
+        return [
+            (t1, (j1 - j0) / (t1 - t0))
+            for (t0, j0), (t1, j1) in zip(samples, samples[1:])
+            if t1 > t0
+        ]
+
+
+# -------------------------------------------------
+# Backend Lookup
+# -------------------------------------------------
+_SHARED_BACKENDS = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def create_energy_backend(name: str = "codecarbon", **kwargs) -> EnergyBackend:
+    """
+    Builds a new backend.
+
+    Parameters
+    ----------
+    name : {"codecarbon", "rapl", "cputime", "auto"}
+        "auto" uses RAPL if readable and the CPU-time estimate otherwise
+    **kwargs
+        Passed to EnergySampler (interval, carbon_intensity, ...)
+
+    Raises
+    ------
+    ValueError
+        Unknown backend name
+    RuntimeError
+        "rapl" requested but no readable RAPL counters
+    """
+    if name not in ENERGY_BACKENDS:
+        raise ValueError(f"Energy backend must be one of {ENERGY_BACKENDS}.")
+
+    if name == "codecarbon":
+        return CodeCarbonBackend()
+
+    if name in ("rapl", "auto"):
+        source = RaplCounterSource()
+        if source.available():
+            return EnergySampler(source, name="rapl", **kwargs)
+        if name == "rapl":
+            raise RuntimeError(
+                f"No readable RAPL counters under {DEFAULT_POWERCAP_ROOT}."
+            )
+
+    return EnergySampler(CpuTimeCounterSource(), name="cputime", **kwargs)
+
+
+def get_energy_backend(backend=None) -> EnergyBackend:
+    """
+    Returns the shared, long-lived backend for a name (default
+    "codecarbon"). Backend instances are passed through unchanged.
+    """
+    if isinstance(backend, EnergyBackend):
+        return backend
+
+    name = backend or "codecarbon"
+    with _SHARED_LOCK:
+        if name not in _SHARED_BACKENDS:
+            _SHARED_BACKENDS[name] = create_energy_backend(name)
+        return _SHARED_BACKENDS[name]
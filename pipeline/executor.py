@@ -0,0 +1,153 @@
+"""
+executor.py
+-----------
+Parallel model training for the GreenScore pipeline.
+
+Responsibilities:
+1. Train several models concurrently in a process pool
+2. Optionally pin each training task to a set of CPU cores
+3. Measure the CPU time each model consumed
+4. Split a jointly measured energy / CO2 total across models
+
+NOTE:
+- Energy is measured once for the whole pool at pipeline level,
+  then attributed to each model by its share of CPU time
+- Worker processes are spawned (not forked) so they never inherit
+  the running CodeCarbon monitoring threads
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# -------------------------------------------------
+# CPU Affinity Helpers
+# -------------------------------------------------
+def available_cpus():
+    """
+    Returns the sorted list of CPU ids this process may run on.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def split_cpus(n_groups: int):
+    """
+    Splits the available CPUs into n_groups contiguous core sets.
+
+    Used by cpu_affinity="auto" so that concurrently running models
+    do not compete for the same cores.
+    """
+    cpus = available_cpus()
+    n_groups = max(1, min(n_groups, len(cpus)))
+    size, extra = divmod(len(cpus), n_groups)
+
+    groups = []
+    start = 0
+    for i in range(n_groups):
+        end = start + size + (1 if i < extra else 0)
+        groups.append(cpus[start:end])
+        start = end
+
+    return groups
+
+
+# -------------------------------------------------
+# Worker Task
+# -------------------------------------------------
+def _train_in_worker(train_fn, cpus, X_train, y_train, X_test, y_test):
+    """
+    Runs a single trainer inside a pool worker.
+
+    Returns the trainer result together with the CPU seconds
+    consumed by the worker process (all threads) during training.
+    """
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+    cpu_start = time.process_time()
+    result = train_fn(X_train, y_train, X_test, y_test)
+    cpu_seconds = time.process_time() - cpu_start
+
+    return result, cpu_seconds
+
+
+# -------------------------------------------------
+# Parallel Training
+# -------------------------------------------------
+def train_in_process_pool(
+    model_runners,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    max_workers: int = None,
+    cpu_affinity=None
+):
+    """
+    Trains all models concurrently in a process pool.
+
+    Parameters
+    ----------
+    model_runners : list of (str, callable)
+        Model names and trainer functions
+    X_train, y_train, X_test, y_test : array-like
+        Preprocessed data passed to every trainer
+    max_workers : int, optional
+        Number of worker processes (default = one per model, capped
+        at the number of available CPUs)
+    cpu_affinity : None, "auto" or list of lists of int, optional
+        None leaves scheduling to the OS, "auto" splits the available
+        cores evenly between workers, an explicit list assigns
+        cpu_affinity[i % len(cpu_affinity)] to the i-th model
+
+    Returns
+    -------
+    list of (dict, float)
+        Trainer result and CPU seconds per model, in model_runners order
+    """
+
+    if max_workers is None:
+        max_workers = min(len(model_runners), len(available_cpus()))
+    max_workers = max(1, max_workers)
+
+    if cpu_affinity == "auto":
+        cpu_affinity = split_cpus(max_workers)
+
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = []
+        for i, (_, train_fn) in enumerate(model_runners):
+            cpus = cpu_affinity[i % len(cpu_affinity)] if cpu_affinity else None
+            futures.append(
+                pool.submit(
+                    _train_in_worker,
+                    train_fn, cpus,
+                    X_train, y_train, X_test, y_test
+                )
+            )
+
+        return [future.result() for future in futures]
+
+
+# -------------------------------------------------
+# Energy Attribution
+# -------------------------------------------------
+def attribute_by_cpu_time(total: float, cpu_seconds) -> list:
+    """
+    Splits a jointly measured quantity (energy or CO2) across models
+    proportionally to the CPU time each of them consumed.
+
+    Falls back to an even split when no CPU time was recorded.
+    """
+    cpu_seconds = list(cpu_seconds)
+    cpu_total = sum(cpu_seconds)
+
+    if cpu_total <= 0:
+        return [total / len(cpu_seconds)] * len(cpu_seconds)
+
+    return [total * seconds / cpu_total for seconds in cpu_seconds]
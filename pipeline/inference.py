@@ -0,0 +1,193 @@
+"""
+inference.py
+------------
+Inference cost benchmark for the GreenScore pipeline.
+
+Responsibilities:
+1. Sweep batch sizes and time every predict call
+2. Report p50 / p99 per-request latency and rows per second
+3. Measure inference energy and express it per 1k predictions
+
+NOTE:
+- Runs on already fitted estimators, separate from training
+- One measured region wraps each model's sweep; its energy is split across
+  batch sizes by their share of the elapsed time
+- Batches cycle through the test rows, so batch sizes larger than
+  the test set are still possible
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from pipeline.training import start_tracker, stop_tracker
+
+
+DEFAULT_BATCH_SIZES = (1, 32, 256, 2048)
+
+# Columns added to the results table (see compute_greenscore)
+INFERENCE_COLUMNS = [
+    "Latency p50 (ms)",
+    "Latency p99 (ms)",
+    "Throughput (rows/s)",
+    "Energy / 1k preds (kWh)",
+]
+
+
+# -------------------------------------------------
+# Batch Sweep
+# -------------------------------------------------
+def _time_batches(estimator, X, batch_size, min_requests, max_seconds):
+    """
+    Calls predict on consecutive batches until min_requests calls were
+    made and max_seconds elapsed (whichever comes last, capped at
+    10 x min_requests calls). Returns per-call latencies in seconds.
+    """
+    n_rows = X.shape[0]
+    latencies = []
+    start = 0
+    started = time.perf_counter()
+
+    while True:
+        idx = np.arange(start, start + batch_size) % n_rows
+        batch = X[idx]
+
+        t0 = time.perf_counter()
+        estimator.predict(batch)
+        latencies.append(time.perf_counter() - t0)
+
+        start = (start + batch_size) % n_rows
+        elapsed = time.perf_counter() - started
+
+        if len(latencies) >= 10 * min_requests:
+            break
+        if len(latencies) >= min_requests and elapsed >= max_seconds:
+            break
+
+    return np.asarray(latencies)
+
+
+def benchmark_inference(
+    estimator,
+    X,
+    batch_sizes=DEFAULT_BATCH_SIZES,
+    min_requests: int = 50,
+    max_seconds: float = 1.0,
+    label: str = "inference",
+    energy_backend=None
+) -> pd.DataFrame:
+    """
+    Measures latency, throughput and energy of one fitted estimator.
+
+    Parameters
+    ----------
+    estimator : fitted scikit-learn estimator
+    X : array-like
+        Rows to predict on (usually the scaled test set)
+    batch_sizes : iterable of int, optional
+        Rows per predict call
+    min_requests : int, optional
+        Minimum predict calls per batch size
+    max_seconds : float, optional
+        Time budget per batch size once min_requests is reached
+    label : str, optional
+        Name of the measured energy region
+    energy_backend : str or EnergyBackend, optional
+        Energy meter (see pipeline/energy.py)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per batch size with latency percentiles (ms), rows/s,
+        energy (kWh) and energy per 1k predictions
+    """
+    X = np.asarray(X)
+
+    tracker = start_tracker(label, energy_backend)
+
+    sweeps = []
+    for batch_size in batch_sizes:
+        latencies = _time_batches(
+            estimator, X, batch_size, min_requests, max_seconds
+        )
+        sweeps.append((batch_size, latencies))
+
+    emissions_kg, energy_kwh = stop_tracker(tracker)
+
+    total_time = sum(lat.sum() for _, lat in sweeps) or 1.0
+
+    rows = []
+    for batch_size, latencies in sweeps:
+        n_predictions = batch_size * len(latencies)
+        share = latencies.sum() / total_time
+        batch_energy = energy_kwh * share
+
+        rows.append({
+            "Batch Size": batch_size,
+            "Requests": len(latencies),
+            "Latency p50 (ms)": np.percentile(latencies, 50) * 1000,
+            "Latency p99 (ms)": np.percentile(latencies, 99) * 1000,
+            "Throughput (rows/s)": n_predictions / latencies.sum(),
+            "Energy (kWh)": batch_energy,
+            "CO2 (kg)": emissions_kg * share,
+            "Energy / 1k preds (kWh)": batch_energy / n_predictions * 1000,
+        })
+
+    return pd.DataFrame(rows)
+
+
+# -------------------------------------------------
+# Per-Model Summary
+# -------------------------------------------------
+def summarize_inference(sweep_df: pd.DataFrame) -> dict:
+    """
+    Condenses a batch sweep into the results-table columns.
+
+    Latency is the per-request latency of the smallest batch (single
+    requests), throughput the best rows/s over all batch sizes and
+    energy per 1k predictions the overall sweep average.
+    """
+    smallest = sweep_df.loc[sweep_df["Batch Size"].idxmin()]
+    n_predictions = (sweep_df["Batch Size"] * sweep_df["Requests"]).sum()
+
+    return {
+        "Latency p50 (ms)": smallest["Latency p50 (ms)"],
+        "Latency p99 (ms)": smallest["Latency p99 (ms)"],
+        "Throughput (rows/s)": sweep_df["Throughput (rows/s)"].max(),
+        "Energy / 1k preds (kWh)": sweep_df["Energy (kWh)"].sum() / n_predictions * 1000,
+    }
+
+
+def run_inference_stage(estimators: dict, X_test, **sweep_kwargs):
+    """
+    Benchmarks every fitted estimator.
+
+    Parameters
+    ----------
+    estimators : dict
+        Model name -> fitted estimator (None entries are skipped)
+    X_test : array-like
+        Scaled test features
+
+    Returns
+    -------
+    summary : dict
+        Model name -> dict of INFERENCE_COLUMNS
+    sweeps : pd.DataFrame
+        All batch-size rows with a "Model" column
+    """
+    summary = {}
+    sweeps = []
+
+    for name, estimator in estimators.items():
+        if estimator is None:
+            continue
+        sweep_df = benchmark_inference(
+            estimator, X_test, label=f"inference: {name}", **sweep_kwargs
+        )
+        summary[name] = summarize_inference(sweep_df)
+        sweeps.append(sweep_df.assign(Model=name))
+
+    sweeps_df = pd.concat(sweeps, ignore_index=True) if sweeps else pd.DataFrame()
+    return summary, sweeps_df
@@ -0,0 +1,99 @@
+"""
+jobs.py
+-------
+Server-side job queue for running the GreenScore pipeline.
+
+Responsibilities:
+1. Queue pipeline runs from many Streamlit sessions
+2. Bound how many runs execute at the same time
+3. Split the machine's cores between concurrent runs (n_jobs)
+
+NOTE:
+- One queue is shared per server process (see app.py)
+- Without a core budget, every Random Forest would start n_jobs=-1
+  threads and concurrent runs would oversubscribe the CPU
+- Concurrent runs share the machine's power draw, so their energy
+  readings overlap; keep max_concurrent_runs small for clean numbers
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline.executor import available_cpus
+from pipeline.options import as_run_options
+from pipeline.run_pipeline import run_pipeline
+
+
+class JobQueue:
+    """
+    Bounded-concurrency queue of run_pipeline calls.
+
+    Parameters
+    ----------
+    max_concurrent_runs : int, optional
+        Number of runs executing at once (default = 2)
+    total_cores : int, optional
+        Cores shared between concurrent runs (default = all available)
+    """
+
+    def __init__(self, max_concurrent_runs: int = 2, total_cores: int = None):
+        total_cores = total_cores or len(available_cpus())
+
+        self.max_concurrent_runs = max(1, max_concurrent_runs)
+        self.cores_per_run = max(1, total_cores // self.max_concurrent_runs)
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_runs,
+            thread_name_prefix="greenscore-run",
+        )
+        self._lock = threading.Lock()
+        self._waiting = 0
+
+    def submit(self, wait=None, finish=None, **pipeline_kwargs):
+        """
+        Queues a run_pipeline call (same arguments: flat options and / or
+        options=RunOptions, see pipeline/options.py).
+
+        n_jobs defaults to this queue's per-run core budget. wait, if
+        given, is called on the worker before the run starts (e.g. to
+        hold a deferred job until its planned start, see
+        pipeline/carbon_schedule.py); the run keeps its slot meanwhile.
+        finish, if given, is called on the worker once the run has
+        ended, before the future resolves.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the PipelineResult (or raises the run's error).
+        """
+        options = as_run_options(pipeline_kwargs.pop("options", None))
+        if options.execution.n_jobs is None:
+            pipeline_kwargs.setdefault("n_jobs", self.cores_per_run)
+
+        with self._lock:
+            self._waiting += 1
+
+        def job():
+            try:
+                if wait is not None:
+                    wait()
+            finally:
+                with self._lock:
+                    self._waiting -= 1
+            try:
+                return run_pipeline(options=options, **pipeline_kwargs)
+            finally:
+                if finish is not None:
+                    finish()
+
+        return self._pool.submit(job)
+
+    def waiting(self) -> int:
+        """
+        Number of submitted runs that have not started yet.
+        """
+        with self._lock:
+            return self._waiting
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,234 @@
+"""
+memory.py
+---------
+Low-overhead memory measurement for the GreenScore pipeline.
+
+Responsibilities:
+1. Peak memory of a code region (training, prediction, profiling spans)
+2. Serialized model size
+3. The memory columns of the results table
+
+NOTE:
+- "rss" (default): on Linux the kernel's RSS high-water mark is reset
+  when a region starts (/proc/self/clear_refs) and read when it ends,
+  so nothing runs while the region does and timings are unaffected.
+  Regions open at the same time (nested spans, concurrent runs) share
+  that mark: every reset first folds the current peak into each open
+  region. Elsewhere a daemon thread samples the RSS (psutil, installed
+  with CodeCarbon) every `interval`; without psutil there is no reading
+- "tracemalloc": traces every Python / NumPy allocation. Exact even for
+  small models, but it slows the region down, so it is opt-in
+- Regions report the peak above the memory in use when they started
+  (extra_bytes), i.e. what the region itself needed
+- Memory is per process: process pool workers measure their own models
+"""
+
+import os
+import pickle
+import threading
+import tracemalloc
+
+import numpy as np
+
+
+MEMORY_BACKENDS = ("rss", "tracemalloc")
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+BYTES_PER_MB = 1024 ** 2
+
+# Results columns reported by every trainer
+MEMORY_COLUMNS = [
+    "Train Memory (MB)",
+    "Model Size (MB)",
+    "Inference Memory (MB)",
+    "Memory Footprint (MB)",
+]
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_STATM = "/proc/self/statm"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+_OPEN_REGIONS = set()
+_HWM_LOCK = threading.Lock()
+
+
+# -------------------------------------------------
+# Process Memory
+# -------------------------------------------------
+def current_rss_bytes():
+    """
+    Resident memory of this process now (None if unavailable).
+    """
+    try:
+        with open(_PROC_STATM) as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def _high_water_mark_bytes():
+    try:
+        with open(_PROC_STATUS) as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _reset_high_water_mark() -> bool:
+    """
+    Folds the current peak into every open region, then resets the
+    high-water mark. False if the kernel does not allow it.
+    """
+    peak = _high_water_mark_bytes()
+    for region in _OPEN_REGIONS:
+        region._fold(peak)
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+# -------------------------------------------------
+# Peak Memory of a Region
+# -------------------------------------------------
+class PeakMemory:
+    """
+    Context manager measuring the peak memory of the enclosed block.
+
+    Attributes (after the block)
+    ----------------------------
+    peak_bytes : int or None
+        Highest memory in use during the block (RSS, or traced bytes
+        with "tracemalloc")
+    extra_bytes : int or None
+        peak_bytes minus the memory in use when the block started
+
+    Example
+    -------
+    >>> with PeakMemory() as memory:
+    ...     model.fit(X_train, y_train)
+    >>> memory.extra_bytes
+    """
+
+    def __init__(self, backend: str = "rss", interval: float = DEFAULT_SAMPLE_INTERVAL):
+        if backend not in MEMORY_BACKENDS:
+            raise ValueError(f"Memory backend must be one of {MEMORY_BACKENDS}.")
+
+        self.backend = backend
+        self.interval = interval
+        self.start_bytes = None
+        self.peak_bytes = None
+        self.extra_bytes = None
+
+        self._mode = None
+        self._stop_event = None
+        self._thread = None
+        self._started_tracing = False
+
+    def _fold(self, value):
+        if value is not None:
+            self.peak_bytes = max(self.peak_bytes or 0, value)
+
+    def __enter__(self):
+        if self.backend == "tracemalloc":
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.start_bytes = tracemalloc.get_traced_memory()[0]
+            self._mode = "tracemalloc"
+            return self
+
+        self.start_bytes = current_rss_bytes()
+        self._fold(self.start_bytes)
+
+        with _HWM_LOCK:
+            if _reset_high_water_mark():
+                self._mode = "hwm"
+                _OPEN_REGIONS.add(self)
+                return self
+
+        if self.start_bytes is not None:
+            self._mode = "sampled"
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._sample, name="greenscore-memory", daemon=True
+            )
+            self._thread.start()
+
+        return self
+
+    def _sample(self):
+        while not self._stop_event.wait(self.interval):
+            self._fold(current_rss_bytes())
+
+    def __exit__(self, *exc_info):
+        if self._mode == "tracemalloc":
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+
+        elif self._mode == "hwm":
+            with _HWM_LOCK:
+                self._fold(_high_water_mark_bytes())
+                _OPEN_REGIONS.discard(self)
+
+        elif self._mode == "sampled":
+            self._stop_event.set()
+            self._thread.join()
+            self._fold(current_rss_bytes())
+
+        if self.peak_bytes is not None and self.start_bytes is not None:
+            self.extra_bytes = max(0, self.peak_bytes - self.start_bytes)
+
+        return False
+
+
+# -------------------------------------------------
+# Model Size
+# -------------------------------------------------
+class _ByteCounter:
+    # File-like sink that only counts what pickle writes
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        # Protocol 5 passes large array buffers as PickleBuffer (no len())
+        self.size += memoryview(data).nbytes
+
+
+def model_size_bytes(estimator) -> int:
+    """
+    Size of the pickled estimator, counted without building the bytes.
+    """
+    counter = _ByteCounter()
+    pickle.dump(estimator, counter, protocol=pickle.HIGHEST_PROTOCOL)
+    return counter.size
+
+
+def memory_columns(train: PeakMemory, model_bytes: int, inference: PeakMemory) -> dict:
+    """
+    Results columns (MB) from the training / prediction regions and the
+    model size. The footprint of a deployed model is its size plus its
+    inference working set.
+    """
+    def to_mb(value):
+        return value / BYTES_PER_MB if value is not None else np.nan
+
+    return dict(zip(MEMORY_COLUMNS, [
+        to_mb(train.extra_bytes),
+        to_mb(model_bytes),
+        to_mb(inference.extra_bytes),
+        to_mb(model_bytes + (inference.extra_bytes or 0)),
+    ]))
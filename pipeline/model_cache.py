@@ -0,0 +1,216 @@
+"""
+model_cache.py
+--------------
+Content-addressed cache of trained models for the GreenScore pipeline.
+
+Responsibilities:
+1. Key each trained model by dataset hash, split parameters,
+   hyperparameters and library versions
+2. Store the fitted estimator, test predictions and measured metrics
+3. Keep the cache within a size / entry budget (LRU eviction)
+
+NOTE:
+- Shared across sessions on the same machine (local disk)
+- A hit replays the measurements of the original training run;
+  the pipeline flags such rows with Source = "cached"
+"""
+
+import hashlib
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from utils.storage import atomic_path
+
+
+DEFAULT_CACHE_DIR = "evaluation/model_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+
+# -------------------------------------------------
+# Cache Key
+# -------------------------------------------------
+def library_versions() -> dict:
+    """
+    Versions of the libraries that influence training results.
+    """
+    return {
+        "scikit-learn": sklearn.__version__,
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def model_cache_key(
+    dataset_fp: str,
+    model_name: str,
+    params: dict,
+    energy_backend: str = None,
+    memory_backend: str = None,
+    preprocessing: dict = None,
+    executor: str = None,
+    estimator: dict = None
+) -> str:
+    """
+    Content address of one trained model.
+
+    Parameters
+    ----------
+    dataset_fp : str
+        Dataset fingerprint (includes the split parameters)
+    model_name : str
+        Registry name of the model
+    params : dict
+        Hyperparameters the model was trained with
+    energy_backend : str, optional
+        Energy meter of the cached measurements (None = CodeCarbon)
+    memory_backend : str, optional
+        Memory meter of the cached measurements (None = RSS)
+    preprocessing : dict, optional
+        Non-default preprocessing (lean mode, feature dtype)
+    executor : str, optional
+        "process" if energy was attributed by CPU time share (None = serial)
+    estimator : dict, optional
+        Class and version of a registered estimator
+        (see ModelSpec.estimator_identity)
+    """
+    content = {
+        "dataset": dataset_fp,
+        "model": model_name,
+        "params": params,
+        "versions": library_versions(),
+    }
+    if energy_backend is not None:
+        content["energy_backend"] = energy_backend
+    if memory_backend is not None:
+        content["memory_backend"] = memory_backend
+    if preprocessing is not None:
+        content["preprocessing"] = preprocessing
+    if executor is not None:
+        content["executor"] = executor
+    if estimator is not None:
+        content["estimator"] = estimator
+
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# -------------------------------------------------
+# Model Cache
+# -------------------------------------------------
+class ModelCache:
+    """
+    Size-bounded on-disk LRU cache of trained models.
+
+    Each entry is a joblib file holding a dict with the keys
+    "measurements", "estimator" and "y_pred". Recency is tracked
+    through the file modification time, which is refreshed on every hit.
+
+    Parameters
+    ----------
+    root : str
+        Cache directory
+    max_bytes : int
+        Total size budget of the cache
+    max_entries : int, optional
+        Maximum number of entries (unbounded by default)
+    """
+
+    def __init__(
+        self,
+        root: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = None
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.joblib")
+
+    def get(self, key: str):
+        """
+        Returns the cached entry for a key, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            entry = joblib.load(path)
+        except (FileNotFoundError, EOFError):
+            return None
+
+        # Mark as most recently used
+        os.utime(path)
+        return entry
+
+    def put(self, key: str, entry: dict) -> str:
+        """
+        Stores an entry atomically, then evicts old entries if needed.
+        """
+        path = self._path(key)
+        with atomic_path(path) as tmp_path:
+            joblib.dump(entry, tmp_path)
+
+        self.evict()
+        return path
+
+    def entries(self) -> list:
+        """
+        Returns (path, size, mtime) of all entries, oldest first.
+        """
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for name in names:
+            if not name.endswith(".joblib") or name.startswith(".tmp-"):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+
+        return sorted(entries, key=lambda e: e[2])
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> int:
+        """
+        Removes least recently used entries until the cache fits its
+        size and entry budget.
+
+        Returns
+        -------
+        int
+            Number of removed entries.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        while entries and (
+            total > self.max_bytes
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            path, size, _ = entries.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        return removed
+
+    def clear(self) -> None:
+        for path, _, _ in self.entries():
+            os.remove(path)
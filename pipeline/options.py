@@ -0,0 +1,293 @@
+"""
+options.py
+----------
+Run options of the GreenScore pipeline.
+
+Responsibilities:
+1. Group the options of run_pipeline by concern (loading, execution,
+   measurement, tuning, scoring, storage)
+2. Build them from flat option names (run_pipeline keyword arguments,
+   dashboard run options, batch matrix "options")
+3. Reject invalid and incompatible options before any data is loaded
+
+NOTE:
+- Option names are unique across groups, so a flat dict maps onto the
+  groups without ambiguity: {"repetitions": 3} sets
+  RunOptions.measurement.repetitions
+- Groups are plain dataclasses; RunOptions.replace returns a copy with
+  some flat options changed
+"""
+
+import dataclasses
+from dataclasses import dataclass, field
+
+from data.custom_dataset import DEFAULT_CHUNKSIZE
+from pipeline.energy import ENERGY_BACKENDS
+from pipeline.inference import DEFAULT_BATCH_SIZES
+from pipeline.memory import MEMORY_BACKENDS
+from pipeline.progressive import DEFAULT_FRACTIONS
+from pipeline.search import DEFAULT_ETA
+from pipeline.streaming import DEFAULT_STREAM_EPOCHS
+from utils.baselines import BASELINE_MODES, DEFAULT_BASELINE_DIR, DEFAULT_WINDOW
+
+
+EXECUTORS = ("serial", "process")
+
+
+# -------------------------------------------------
+# Option Groups
+# -------------------------------------------------
+@dataclass
+class LoadOptions:
+    """
+    Where the data comes from and how it is prepared.
+
+    Attributes
+    ----------
+    uploaded_file : pd.DataFrame, str or file-like
+        Custom dataset in any format of data/custom_dataset.py
+    target_column : str
+        Label column of the custom dataset
+    feature_columns : list of str
+        Columns read as features (None = all but the target)
+    memmap_dir : str
+        Memory-map loaded features under this directory
+    lean_preprocessing : bool
+        Memory-lean preprocess_data mode; its peak memory is reported
+        in result.metadata["preprocess"]
+    streaming : bool
+        Train out of core on chunks of stream_chunksize rows for
+        stream_epochs passes (see pipeline/streaming.py)
+    """
+    uploaded_file: object = None
+    target_column: str = None
+    feature_columns: list = None
+    memmap_dir: str = None
+    lean_preprocessing: bool = False
+    streaming: bool = False
+    stream_chunksize: int = DEFAULT_CHUNKSIZE
+    stream_epochs: int = DEFAULT_STREAM_EPOCHS
+
+
+@dataclass
+class ExecutionOptions:
+    """
+    How models are trained.
+
+    Attributes
+    ----------
+    executor : str
+        "serial" or "process" (concurrent training in a process pool,
+        energy attributed by CPU time; see pipeline/executor.py)
+    max_workers, cpu_affinity
+        Process pool size and CPU pinning
+    n_jobs : int
+        Cores each run may use (see pipeline/jobs.py)
+    """
+    executor: str = "serial"
+    max_workers: int = None
+    cpu_affinity: object = None
+    n_jobs: int = None
+
+    def __post_init__(self):
+        if self.executor not in EXECUTORS:
+            raise ValueError("Executor must be 'serial' or 'process'.")
+
+
+@dataclass
+class MeasurementOptions:
+    """
+    What is measured and with which meters.
+
+    Attributes
+    ----------
+    energy_backend : str or EnergyBackend
+        "codecarbon", "rapl", "cputime" or "auto" (see pipeline/energy.py)
+    memory_backend : str
+        "rss" or "tracemalloc" (see pipeline/memory.py)
+    repetitions, warmup, seeds
+        repetitions > 1 makes the run a benchmark: medians over
+        repetitions after warmup discarded runs (see pipeline/benchmark.py)
+    measure_inference : bool
+        Sweep inference_batch_sizes on the fitted models
+        (see pipeline/inference.py)
+    budget : TrainingBudget or dict
+        Per-model training limits (see models/budget.py)
+    """
+    energy_backend: object = "codecarbon"
+    memory_backend: str = "rss"
+    repetitions: int = 1
+    warmup: int = 0
+    seeds: list = None
+    measure_inference: bool = False
+    inference_batch_sizes: tuple = DEFAULT_BATCH_SIZES
+    budget: object = None
+
+    def __post_init__(self):
+        if isinstance(self.energy_backend, str) and self.energy_backend not in ENERGY_BACKENDS:
+            raise ValueError(f"Energy backend must be one of {ENERGY_BACKENDS}.")
+        if self.memory_backend not in MEMORY_BACKENDS:
+            raise ValueError(f"Memory backend must be one of {MEMORY_BACKENDS}.")
+
+    @property
+    def benchmark(self) -> bool:
+        return self.repetitions > 1
+
+
+@dataclass
+class TuningOptions:
+    """
+    Which configurations are trained.
+
+    Attributes
+    ----------
+    model_params : dict
+        {model name: {param: value}} overriding registered hyperparameters
+    search : str
+        "halving" or "hyperband": tune every model by partial GreenScore
+        first (see pipeline/search.py)
+    progressive : bool
+        Prune dominated models on progressive_fractions subsamples
+        before the full-size run (see pipeline/progressive.py)
+    """
+    model_params: dict = None
+    search: str = None
+    search_eta: int = DEFAULT_ETA
+    progressive: bool = False
+    progressive_fractions: tuple = DEFAULT_FRACTIONS
+
+
+@dataclass
+class ScoringOptions:
+    """
+    How GreenScores are normalized.
+
+    Attributes
+    ----------
+    normalization : str
+        None (min-max within the run) or a baseline mode: scores against
+        the dataset's reference baseline in baseline_dir, over its last
+        baseline_window runs (see utils/baselines.py)
+    baseline_anchors : dict
+        {column: [low, high]} stored as fixed anchors
+    """
+    normalization: str = None
+    baseline_window: int = DEFAULT_WINDOW
+    baseline_anchors: dict = None
+    baseline_dir: str = DEFAULT_BASELINE_DIR
+
+    def __post_init__(self):
+        if self.normalization is not None and self.normalization not in BASELINE_MODES:
+            raise ValueError(f"Normalization must be one of {BASELINE_MODES}.")
+
+
+@dataclass
+class StorageOptions:
+    """
+    What is reused and where results go.
+
+    Attributes
+    ----------
+    use_store : bool
+        Replay stored raw measurements of the same data and models
+    use_cache, model_cache
+        Replay cached trained models (default cache evaluation/model_cache)
+    results_sink : str
+        Append the scored rows to this CSV file
+    workspace_root : str
+        Write results, profile.json and trace.json to
+        <workspace_root>/<run_id>/
+    history_db : str
+        Record the run in this SQLite run-history database
+    """
+    use_store: bool = True
+    use_cache: bool = True
+    model_cache: object = None
+    results_sink: str = None
+    workspace_root: str = None
+    history_db: str = None
+
+
+# -------------------------------------------------
+# All Options
+# -------------------------------------------------
+@dataclass
+class RunOptions:
+    """
+    Every option of one run_pipeline call, by group.
+
+    Example
+    -------
+    >>> options = RunOptions.from_flat(repetitions=3, energy_backend="cputime")
+    >>> options.measurement.repetitions
+    3
+    """
+    load: LoadOptions = field(default_factory=LoadOptions)
+    execution: ExecutionOptions = field(default_factory=ExecutionOptions)
+    measurement: MeasurementOptions = field(default_factory=MeasurementOptions)
+    tuning: TuningOptions = field(default_factory=TuningOptions)
+    scoring: ScoringOptions = field(default_factory=ScoringOptions)
+    storage: StorageOptions = field(default_factory=StorageOptions)
+
+    def __post_init__(self):
+        if self.load.streaming:
+            unsupported = [
+                option for option, enabled in (
+                    ("repetitions", self.measurement.benchmark),
+                    ("measure_inference", self.measurement.measure_inference),
+                    ("budget", self.measurement.budget is not None),
+                    ("progressive", self.tuning.progressive),
+                    ("search", self.tuning.search is not None),
+                )
+                if enabled
+            ]
+            if unsupported:
+                raise ValueError(
+                    f"Streaming mode cannot be combined with: {', '.join(unsupported)}."
+                )
+
+    @classmethod
+    def from_flat(cls, **options) -> "RunOptions":
+        """
+        Builds the groups from flat option names.
+
+        Raises
+        ------
+        TypeError
+            If an option name is unknown.
+        """
+        return cls().replace(**options)
+
+    def replace(self, **options) -> "RunOptions":
+        """
+        Returns a copy with some flat options changed.
+        """
+        changes = {}
+        for name, value in options.items():
+            if name not in _OPTION_GROUPS:
+                raise TypeError(f"Unknown pipeline option '{name}'.")
+            changes.setdefault(_OPTION_GROUPS[name], {})[name] = value
+
+        return dataclasses.replace(self, **{
+            group: dataclasses.replace(getattr(self, group), **values)
+            for group, values in changes.items()
+        })
+
+
+# Flat option name -> RunOptions group attribute
+_OPTION_GROUPS = {
+    option.name: group.name
+    for group in dataclasses.fields(RunOptions)
+    for option in dataclasses.fields(group.default_factory)
+}
+
+
+def as_run_options(options=None) -> RunOptions:
+    """
+    Accepts a RunOptions, a dict of flat options or None.
+    """
+    if options is None:
+        return RunOptions()
+    if isinstance(options, RunOptions):
+        return options
+    return RunOptions.from_flat(**options)
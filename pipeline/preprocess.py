@@ -7,12 +7,20 @@ Responsibilities:
 1. Train-test split
 2. Feature scaling
 3. Return clean data for model training
+4. Optionally measure the peak memory preprocessing needed
 
 NOTE:
 - Works only for classification tasks (for now)
 - Keeps preprocessing logic centralized and reusable
+- lean=True splits by row index, gathers the rows once into a single
+  contiguous float array and scales it in place, so only the source plus
+  one copy of the feature matrix exist at a time
 """
 
+import tracemalloc
+
+import numpy as np
+import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
@@ -24,7 +32,10 @@ def preprocess_data(
     X,
     y,
     test_size: float = 0.2,
-    random_state: int = 42
+    random_state: int = 42,
+    lean: bool = False,
+    dtype=None,
+    return_info: bool = False
 ):
     """
     Splits the dataset into train and test sets
@@ -40,12 +51,32 @@ def preprocess_data(
         Fraction of data to use for testing (default = 0.2)
     random_state : int, optional
         Random seed for reproducibility
+    lean : bool, optional
+        Memory-lean mode: index-based split and in-place scaling
+        (same rows and values as the default mode)
+    dtype : np.dtype, optional
+        Feature dtype in lean mode (default = float32 for float32 input,
+        float64 otherwise)
+    return_info : bool, optional
+        Also return a dict with the measured peak memory (tracemalloc)
 
     Returns
     -------
-    X_train_scaled, X_test_scaled, y_train, y_test
+    X_train_scaled, X_test_scaled, y_train, y_test[, info]
     """
 
+    if return_info:
+        return _measure_peak_memory(
+            preprocess_data, X, y,
+            test_size=test_size,
+            random_state=random_state,
+            lean=lean,
+            dtype=dtype,
+        )
+
+    if lean:
+        return _preprocess_lean(X, y, test_size, random_state, dtype)
+
     # -------------------------------
     # Train-Test Split
     # -------------------------------
@@ -69,3 +100,136 @@ def preprocess_data(
     X_test_scaled = scaler.transform(X_test)
 
     return X_train_scaled, X_test_scaled, y_train, y_test
+
+
+# -------------------------------------------------
+# Memory-Lean Preprocessing
+# -------------------------------------------------
+# Size of the temporary buffers used while gathering / scaling
+LEAN_BLOCK_BYTES = 4 * 1024 ** 2
+
+
+def _block_rows(X) -> int:
+    return max(1, LEAN_BLOCK_BYTES // (8 * max(1, X.shape[1])))
+
+
+def _gather_rows(X, order, dtype):
+    """
+    Copies the rows of X in the given order into one new C-contiguous
+    array, column by column for DataFrames and in row blocks for arrays,
+    so no full-size temporary is created.
+    """
+    out = np.empty((len(order), X.shape[1]), dtype=dtype)
+
+    if isinstance(X, pd.DataFrame):
+        for j, column in enumerate(X.columns):
+            out[:, j] = X[column].to_numpy()[order]
+        return out
+
+    step = _block_rows(out)
+    for start in range(0, len(order), step):
+        block = order[start:start + step]
+        out[start:start + len(block)] = X[block]
+
+    return out
+
+
+def _standardize_in_place(X_all, n_train):
+    """
+    Standardizes X_all in place with the mean / std of its first n_train
+    rows (same statistics as StandardScaler). Statistics are accumulated
+    in float64 block by block.
+    """
+    X_train = X_all[:n_train]
+    step = _block_rows(X_all)
+
+    total = np.zeros(X_all.shape[1])
+    for start in range(0, n_train, step):
+        total += X_train[start:start + step].sum(axis=0, dtype=np.float64)
+    mean = total / n_train
+
+    sq_dev = np.zeros(X_all.shape[1])
+    for start in range(0, n_train, step):
+        block = X_train[start:start + step] - mean
+        sq_dev += np.einsum("ij,ij->j", block, block)
+
+    scale = np.sqrt(sq_dev / n_train)
+    scale[scale == 0.0] = 1.0
+
+    X_all -= mean.astype(X_all.dtype)
+    X_all /= scale.astype(X_all.dtype)
+
+
+def _preprocess_lean(X, y, test_size, random_state, dtype):
+    """
+    Index-based split with in-place scaling.
+
+    Train rows followed by test rows are gathered once into a single
+    contiguous array; X_train and X_test are views into it and are
+    scaled in place. Apart from the caller's X this is the only copy
+    of the feature matrix.
+    """
+
+    if dtype is None:
+        dtypes = X.dtypes if isinstance(X, pd.DataFrame) else [np.asarray(X).dtype]
+        dtype = np.float32 if all(t == np.float32 for t in dtypes) else np.float64
+
+    labels = np.asarray(y)
+
+    # -------------------------------
+    # Split by row index
+    # -------------------------------
+    train_idx, test_idx = train_test_split(
+        np.arange(len(labels)),
+        test_size=test_size,
+        random_state=random_state,
+        stratify=labels
+    )
+
+    X_all = _gather_rows(X, np.concatenate([train_idx, test_idx]), dtype)
+    n_train = len(train_idx)
+
+    if isinstance(y, pd.Series):
+        y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+    else:
+        y_train, y_test = labels[train_idx], labels[test_idx]
+
+    # -------------------------------
+    # Feature Scaling (in place)
+    # -------------------------------
+    _standardize_in_place(X_all, n_train)
+
+    return X_all[:n_train], X_all[n_train:], y_train, y_test
+
+
+# -------------------------------------------------
+# Peak Memory Measurement
+# -------------------------------------------------
+def _measure_peak_memory(fn, *args, **kwargs):
+    """
+    Runs fn and appends {"peak_bytes", "lean", "dtype"} to its output.
+
+    Peak memory is the highest traced allocation size during the call,
+    NumPy buffers included.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    try:
+        outputs = fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    info = {
+        "peak_bytes": max(0, peak - baseline),
+        "lean": kwargs.get("lean", False),
+        "dtype": str(outputs[0].dtype),
+    }
+
+    return (*outputs, info)
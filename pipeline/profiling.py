@@ -0,0 +1,221 @@
+"""
+profiling.py
+------------
+Per-stage instrumentation of GreenScore pipeline runs.
+
+Responsibilities:
+1. Record nested spans (load, preprocess, train, fit, predict, metrics,
+   tracker start / stop, scoring, ...) with wall time, CPU time, peak
+   RSS and energy
+2. Make the active profiler available to any code of the run through
+   a context variable, so stages deep in the call stack need no extra
+   arguments
+3. Export spans as a DataFrame, JSON or a Chrome trace
+   (chrome://tracing, Perfetto)
+
+NOTE:
+- span() is a no-op when no profiler is active (e.g. inside process
+  pool workers, which do not inherit the context), so instrumented
+  code runs unchanged outside profiled runs
+- CPU time, RSS and energy are process-wide: runs executing at the same
+  time (see pipeline/jobs.py) and threads outside the span overlap
+- Peak RSS comes from pipeline/memory.py: free of sampling on Linux,
+  sampled elsewhere
+- Stage energy needs nested regions, so it is read from a sampler meter:
+  the run's own meter if it is "rapl" or "cputime", otherwise the
+  CPU-time estimate (one CodeCarbon tracker per span would cost more
+  than most spans)
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import pandas as pd
+
+from pipeline.energy import EnergySampler, get_energy_backend
+from pipeline.memory import PeakMemory
+from utils.storage import atomic_write_json
+
+
+PROFILE_COLUMNS = [
+    "Stage", "Parent", "Depth", "Start (s)", "Wall (s)", "CPU (s)",
+    "Peak RSS (MB)", "Energy (kWh)",
+]
+
+_ACTIVE_PROFILER = ContextVar("greenscore_profiler", default=None)
+
+
+# -------------------------------------------------
+# Profiler
+# -------------------------------------------------
+class RunProfiler:
+    """
+    Collects the spans of one pipeline run.
+
+    Parameters
+    ----------
+    energy_backend : str or EnergyBackend, optional
+        The run's energy meter; used for stage energy if it is a
+        sampler, otherwise the CPU-time estimate is used
+    """
+
+    def __init__(self, energy_backend=None):
+        meter = get_energy_backend(energy_backend)
+        if not isinstance(meter, EnergySampler):
+            meter = get_energy_backend("cputime")
+
+        self.meter = meter
+        self.spans = []
+        self._open = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        Measures the enclosed block as a child of the innermost open span.
+
+        Yields the span's record; attrs (and keys added to
+        record["attrs"] inside the block) are exported with it.
+        """
+        record = {
+            "name": name,
+            "parent": self._open[-1]["id"] if self._open else None,
+            "depth": len(self._open),
+            "id": len(self.spans),
+            "start_s": time.perf_counter() - self._started,
+            "peak_rss_bytes": None,
+            "attrs": dict(attrs),
+        }
+        self.spans.append(record)
+        self._open.append(record)
+
+        memory = PeakMemory()
+        region = self.meter.start_region(f"span: {name}")
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            with memory:
+                yield record
+        finally:
+            record["cpu_s"] = time.process_time() - cpu_start
+            record["wall_s"] = time.perf_counter() - wall_start
+            emissions_kg, energy_kwh = region.stop()
+            record["energy_kwh"] = energy_kwh
+            record["emissions_kg"] = emissions_kg
+            record["peak_rss_bytes"] = memory.peak_bytes
+            self._open.pop()
+
+    @contextmanager
+    def activate(self):
+        """
+        Makes this profiler the target of span() in the current context.
+        """
+        token = _ACTIVE_PROFILER.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_PROFILER.reset(token)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        One row per span in start order (PROFILE_COLUMNS plus "Attributes").
+        """
+        names = {record["id"]: record["name"] for record in self.spans}
+        rows = [
+            {
+                "Stage": record["name"],
+                "Parent": names.get(record["parent"]),
+                "Depth": record["depth"],
+                "Start (s)": record["start_s"],
+                "Wall (s)": record.get("wall_s"),
+                "CPU (s)": record.get("cpu_s"),
+                "Peak RSS (MB)": (
+                    record["peak_rss_bytes"] / 1024 ** 2
+                    if record["peak_rss_bytes"] is not None else None
+                ),
+                "Energy (kWh)": record.get("energy_kwh"),
+                "Attributes": record["attrs"],
+            }
+            for record in self.spans
+        ]
+        return pd.DataFrame(rows, columns=PROFILE_COLUMNS + ["Attributes"])
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Records the enclosed block on the active profiler (no-op without one).
+
+    Example
+    -------
+    >>> with span("predict", rows=len(X_test)):
+    ...     y_pred = model.predict(X_test)
+    """
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield None
+        return
+
+    with profiler.span(name, **attrs) as record:
+        yield record
+
+
+# -------------------------------------------------
+# Export
+# -------------------------------------------------
+def profile_records(profile_df: pd.DataFrame) -> list:
+    """
+    Spans as JSON-ready dicts (missing values become None).
+    """
+    return json.loads(profile_df.to_json(orient="records", default_handler=str))
+
+
+def profile_to_json(profile_df: pd.DataFrame, path: str = None) -> str:
+    """
+    Spans as a JSON list of objects (written atomically to path if given).
+    """
+    records = profile_records(profile_df)
+    if path is not None:
+        atomic_write_json(records, path)
+    return json.dumps(records, indent=2)
+
+
+def profile_to_chrome_trace(
+    profile_df: pd.DataFrame,
+    path: str = None,
+    process_name: str = "GreenScore run"
+) -> dict:
+    """
+    Spans in the Chrome trace event format ("X" complete events on one
+    thread, nested by time), loadable in chrome://tracing or Perfetto.
+    Written atomically to path if given.
+    """
+    events = [{
+        "name": "process_name", "ph": "M", "pid": 0, "tid": 0,
+        "args": {"name": process_name},
+    }]
+
+    for record in profile_records(profile_df):
+        args = {
+            column: record[column]
+            for column in ("CPU (s)", "Peak RSS (MB)", "Energy (kWh)")
+            if record[column] is not None
+        }
+        args.update(record["Attributes"] or {})
+        events.append({
+            "name": record["Stage"],
+            "cat": record["Parent"] or "run",
+            "ph": "X",
+            "ts": record["Start (s)"] * 1e6,
+            "dur": (record["Wall (s)"] or 0.0) * 1e6,
+            "pid": 0,
+            "tid": 0,
+            "args": args,
+        })
+
+    trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+    if path is not None:
+        atomic_write_json(trace, path)
+    return trace
@@ -0,0 +1,222 @@
+"""
+progressive.py
+--------------
+Learning-curve (progressive) mode for the GreenScore pipeline.
+
+Responsibilities:
+1. Train every model on growing stratified subsamples of the training set
+2. Fit cost and error curves and project full-size time, energy,
+   CO2 and accuracy
+3. Flag models whose projection is dominated so they can be skipped at
+   full size
+
+NOTE:
+- Subsamples are drawn from the regular preprocess_data training split
+  and every point is evaluated on the full test set
+- Cost (time, energy, CO2) is fitted as a power law a * n^b in log-log
+  space; error (1 - accuracy, 1 - F1) as a non-increasing power law.
+  Zero errors are clamped to half a test sample so logs stay finite
+- Projections from 1-20% subsamples are rough; they are meant for
+  pruning clearly dominated models, not for reporting
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from models.estimator import ARTIFACTS_KEY
+from pipeline.training import train_serial, train_parallel
+from utils.metrics import PARETO_COLUMN, mark_pareto
+
+
+DEFAULT_FRACTIONS = (0.01, 0.05, 0.2)
+
+COST_COLUMNS = ["Time (s)", "Energy (kWh)", "CO2 (kg)"]
+QUALITY_COLUMNS = ["Accuracy", "F1-score"]
+
+# Smallest value used for log fits of costs reported as zero
+_COST_FLOOR = 1e-12
+
+
+# -------------------------------------------------
+# Subsampling
+# -------------------------------------------------
+def subsample_indices(y_train, fraction: float, random_state: int = 42):
+    """
+    Stratified row indices covering `fraction` of the training set
+    (at least one row per class).
+    """
+    labels = np.asarray(y_train)
+    n_classes = len(np.unique(labels))
+    n_rows = max(n_classes, int(round(fraction * len(labels))))
+
+    if n_rows >= len(labels):
+        return np.arange(len(labels))
+
+    try:
+        idx, _ = train_test_split(
+            np.arange(len(labels)),
+            train_size=n_rows,
+            random_state=random_state,
+            stratify=labels,
+        )
+    except ValueError:
+        # Classes too small to stratify at this size
+        idx, _ = train_test_split(
+            np.arange(len(labels)),
+            train_size=n_rows,
+            random_state=random_state,
+        )
+
+    return np.sort(idx)
+
+
+def take_rows(data, idx):
+    """
+    Rows idx of an array, DataFrame or Series.
+    """
+    return data.iloc[idx] if isinstance(data, (pd.DataFrame, pd.Series)) else data[idx]
+
+
+# -------------------------------------------------
+# Learning Curve
+# -------------------------------------------------
+def run_learning_curve(
+    model_runners,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    fractions=DEFAULT_FRACTIONS,
+    executor: str = "serial",
+    max_workers: int = None,
+    cpu_affinity=None,
+    energy_backend=None,
+    random_state: int = 42
+) -> pd.DataFrame:
+    """
+    Trains every model on each subsample fraction.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per model and fraction with "Fraction" and "Rows"
+        columns in addition to the raw result columns
+    """
+    rows = []
+
+    for fraction in sorted(fractions):
+        idx = subsample_indices(y_train, fraction, random_state)
+        X_sub, y_sub = take_rows(X_train, idx), take_rows(y_train, idx)
+
+        if executor == "process":
+            results = train_parallel(
+                model_runners, X_sub, y_sub, X_test, y_test,
+                max_workers, cpu_affinity, energy_backend
+            )
+        else:
+            results = train_serial(
+                model_runners, X_sub, y_sub, X_test, y_test, energy_backend
+            )
+
+        for result in results:
+            result.pop(ARTIFACTS_KEY, None)
+            rows.append({**result, "Fraction": fraction, "Rows": len(idx)})
+
+    return pd.DataFrame(rows)
+
+
+# -------------------------------------------------
+# Curve Fitting
+# -------------------------------------------------
+def fit_power_law(n, values):
+    """
+    Least-squares fit of values = a * n^b in log-log space.
+
+    Returns
+    -------
+    (float, float)
+        a and b (b = 1, i.e. linear scaling from the largest point, if
+        fewer than two distinct sizes are available)
+    """
+    n = np.asarray(n, dtype=float)
+    values = np.maximum(np.asarray(values, dtype=float), _COST_FLOOR)
+
+    if len(np.unique(n)) < 2:
+        return values[-1] / n[-1], 1.0
+
+    b, log_a = np.polyfit(np.log(n), np.log(values), 1)
+    return float(np.exp(log_a)), float(b)
+
+
+def _project_cost(n, values, n_full):
+    a, b = fit_power_law(n, values)
+    return a * n_full ** b
+
+
+def _project_quality(n, values, n_full, n_test):
+    floor = 0.5 / max(1, n_test)
+    errors = np.maximum(1 - np.asarray(values, dtype=float), floor)
+
+    a, b = fit_power_law(n, errors)
+    # More data never makes the projected error worse
+    b = min(b, 0.0)
+    if b == 0.0:
+        a = errors[-1]
+
+    return float(np.clip(1 - a * n_full ** b, 0.0, 1.0))
+
+
+def project_full_size(curve_df: pd.DataFrame, n_full: int, n_test: int) -> pd.DataFrame:
+    """
+    Projects each model's full training-set cost and quality from its
+    learning curve.
+
+    Parameters
+    ----------
+    curve_df : pd.DataFrame
+        Output of run_learning_curve
+    n_full : int
+        Rows of the full training set
+    n_test : int
+        Rows of the test set (bounds the accuracy resolution)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per model with projected raw result columns and
+        "CO2 (tons)"
+    """
+    rows = []
+
+    for model, group in curve_df.groupby("Model", sort=False):
+        group = group.sort_values("Rows")
+        n = group["Rows"].to_numpy()
+
+        row = {"Model": model}
+        for column in QUALITY_COLUMNS:
+            row[column] = _project_quality(n, group[column], n_full, n_test)
+        for column in COST_COLUMNS:
+            row[column] = _project_cost(n, group[column], n_full)
+        row["CO2 (tons)"] = row["CO2 (kg)"] / 1000
+
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+# -------------------------------------------------
+# Pruning
+# -------------------------------------------------
+def mark_dominated(projection_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds a "Dominated" column: True if another model is projected to be
+    at least as accurate and at most as costly in time, energy and CO2,
+    and strictly better in at least one of them.
+    """
+    objectives = {"Accuracy": True, **dict.fromkeys(COST_COLUMNS, False)}
+    front = mark_pareto(projection_df, objectives)[PARETO_COLUMN]
+
+    projected = projection_df.copy()
+    projected["Dominated"] = ~front.to_numpy()
+    return projected
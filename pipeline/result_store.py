@@ -0,0 +1,153 @@
+"""
+result_store.py
+---------------
+Persistent store of raw model measurements for the GreenScore pipeline.
+
+Responsibilities:
+1. Fingerprint datasets so identical inputs map to the same key
+2. Persist raw per-model measurements (accuracy, energy, CO2, time)
+3. Reload stored measurements so GreenScore can be re-weighted
+   without retraining any model
+
+NOTE:
+- GreenScore is never stored, it only depends on the weights
+- Stored rows live under evaluation/result_store/ as one CSV per key,
+  written atomically
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import RAW_RESULT_COLUMNS
+from utils.storage import atomic_write_csv
+
+
+DEFAULT_STORE_DIR = "evaluation/result_store"
+
+
+# -------------------------------------------------
+# Dataset Fingerprint
+# -------------------------------------------------
+def dataset_fingerprint(X, y, **split_params) -> str:
+    """
+    Computes a content hash of a dataset and its split parameters.
+
+    Parameters
+    ----------
+    X : pd.DataFrame or np.ndarray
+        Feature matrix
+    y : pd.Series or np.ndarray
+        Target labels
+    **split_params
+        Parameters passed to preprocess_data (test_size, random_state, ...)
+
+    Returns
+    -------
+    str
+        Hex digest identifying the dataset
+    """
+
+    digest = hashlib.sha256()
+    _update_digest(digest, X)
+    _update_digest(digest, y)
+    digest.update(json.dumps(split_params, sort_keys=True).encode())
+
+    return digest.hexdigest()
+
+
+def _update_digest(digest, data):
+    """
+    Feeds a DataFrame, Series or NumPy array into a hash.
+    Arrays (including memory-mapped ones) are hashed without copying.
+    """
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        if isinstance(data, pd.DataFrame):
+            digest.update(json.dumps(list(map(str, data.columns))).encode())
+        digest.update(
+            pd.util.hash_pandas_object(data, index=True).values.tobytes()
+        )
+        return
+
+    array = np.ascontiguousarray(data)
+    digest.update(f"{array.dtype.str}{array.shape}".encode())
+    if array.dtype.kind == "O":
+        digest.update(
+            pd.util.hash_pandas_object(pd.Series(array.ravel())).values.tobytes()
+        )
+    else:
+        digest.update(memoryview(array.reshape(-1).view(np.uint8)))
+
+
+# -------------------------------------------------
+# Run Key
+# -------------------------------------------------
+def make_run_key(fingerprint: str, model_config) -> str:
+    """
+    Combines a dataset fingerprint with the model configuration.
+
+    Parameters
+    ----------
+    fingerprint : str
+        Output of dataset_fingerprint
+    model_config : JSON-serializable
+        Description of the models trained in the run
+
+    Returns
+    -------
+    str
+        Key under which raw measurements are stored
+    """
+
+    payload = json.dumps(
+        {"dataset": fingerprint, "models": model_config},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# -------------------------------------------------
+# Load / Save Raw Results
+# -------------------------------------------------
+def load_raw_results(key: str, store_dir: str = DEFAULT_STORE_DIR):
+    """
+    Loads stored raw measurements for a run key.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Raw results, or None if the key has not been stored yet.
+    """
+    path = os.path.join(store_dir, f"{key}.csv")
+    try:
+        return pd.read_csv(path)
+    except FileNotFoundError:
+        return None
+
+
+def save_raw_results(
+    key: str,
+    results_df: pd.DataFrame,
+    store_dir: str = DEFAULT_STORE_DIR
+) -> str:
+    """
+    Persists the raw measurement columns of a results DataFrame.
+
+    The file is replaced atomically, so concurrent runs on the same
+    key never leave a partially written entry behind.
+
+    Returns
+    -------
+    str
+        Path of the stored CSV file.
+    """
+    path = os.path.join(store_dir, f"{key}.csv")
+
+    columns = [c for c in RAW_RESULT_COLUMNS if c in results_df.columns]
+    atomic_write_csv(results_df[columns], path)
+
+    return path
@@ -0,0 +1,96 @@
+"""
+results.py
+----------
+In-memory result object returned by the GreenScore pipeline.
+
+Responsibilities:
+1. Carry raw measurements and GreenScores from the pipeline to the UI
+2. Re-score the same measurements under new weights
+
+NOTE:
+- Nothing here touches the disk; persistence is an optional sink
+  (see append_results_csv in utils/metrics.py)
+"""
+
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from utils.metrics import compute_greenscore
+
+
+@dataclass
+class PipelineResult:
+    """
+    Outcome of one run_pipeline call.
+
+    Attributes
+    ----------
+    results : pd.DataFrame
+        Raw measurements plus the GreenScore column
+    weights : dict
+        Weights the GreenScore was computed with
+    run_key : str
+        Result store key (dataset fingerprint + model configuration)
+    from_store : bool
+        True if the measurements were replayed from the result store
+    metadata : dict
+        Run information (run_id, executor, dataset mode, ...)
+    repetitions : pd.DataFrame or None
+        Every measurement of a repeated benchmark run
+    inference : pd.DataFrame or None
+        Inference batch-size sweep per model (see pipeline/inference.py)
+    learning_curve : pd.DataFrame or None
+        Subsample measurements of a progressive run
+    projection : pd.DataFrame or None
+        Projected full-size results with a "Dominated" column
+        (see pipeline/progressive.py)
+    search : pd.DataFrame or None
+        Every hyperparameter search trial (see pipeline/search.py)
+    baseline : ReferenceBaseline or None
+        Anchors the GreenScore was normalized with (see
+        utils/baselines.py); None = min-max within this run
+    profile : pd.DataFrame or None
+        Per-stage spans of the run (see pipeline/profiling.py)
+    """
+    results: pd.DataFrame
+    weights: dict
+    run_key: str
+    from_store: bool = False
+    metadata: dict = field(default_factory=dict)
+    repetitions: pd.DataFrame = None
+    inference: pd.DataFrame = None
+    learning_curve: pd.DataFrame = None
+    projection: pd.DataFrame = None
+    search: pd.DataFrame = None
+    baseline: object = None
+    profile: pd.DataFrame = None
+
+    @property
+    def raw(self) -> pd.DataFrame:
+        """
+        Raw measurement columns only (no GreenScore).
+        """
+        return self.results.drop(columns=["GreenScore"], errors="ignore")
+
+    def rescore(self, weights: dict) -> "PipelineResult":
+        """
+        Returns a copy of this result scored with different weights.
+        """
+        results = compute_greenscore(self.raw, weights, self.baseline)
+        return PipelineResult(
+            results, weights, self.run_key, self.from_store,
+            dict(self.metadata), self.repetitions, self.inference,
+            self.learning_curve, self.projection, self.search,
+            self.baseline, self.profile
+        )
+
+    @property
+    def run_id(self) -> str:
+        return self.metadata.get("run_id")
+
+    def best_model(self) -> str:
+        """
+        Name of the model with the highest GreenScore.
+        """
+        return self.results.sort_values("GreenScore", ascending=False).iloc[0]["Model"]
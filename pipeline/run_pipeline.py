@@ -1,39 +1,507 @@
 import os
+from functools import partial
+
+import numpy as np
 import pandas as pd
-from codecarbon import EmissionsTracker
 
 from data.controlled.wine_dataset import load_wine_dataset
-from data.custom_dataset import load_custom_dataset
+from data.custom_dataset import (
+    DEFAULT_CHUNKSIZE,
+    iter_custom_chunks,
+    load_custom_dataset,
+    load_custom_file,
+)
 from pipeline.preprocess import preprocess_data
+from pipeline.training import train_serial, train_parallel
+from pipeline.energy import get_energy_backend
+from pipeline.benchmark import run_repetitions, median_results
+from pipeline.search import run_search
+from pipeline.progressive import (
+    run_learning_curve,
+    project_full_size,
+    mark_dominated,
+)
+from pipeline.inference import INFERENCE_COLUMNS, run_inference_stage
+from pipeline.streaming import scan_stream, train_streaming
+from pipeline.profiling import (
+    RunProfiler,
+    profile_to_chrome_trace,
+    profile_to_json,
+    span,
+)
+from pipeline.options import as_run_options
+from pipeline.results import PipelineResult
+from pipeline.model_cache import ModelCache, model_cache_key
+from pipeline.workspace import new_run_id, create_run_workspace
+from pipeline.result_store import (
+    dataset_fingerprint,
+    make_run_key,
+    load_raw_results,
+    save_raw_results,
+)
 
-from models.logistic import train_logistic_regression
-from models.random_forest import train_random_forest
-from models.mlp import train_mlp
+from models.registry import resolve_models
+from models.estimator import ARTIFACTS_KEY
+from models.budget import as_budget
 
-from utils.metrics import compute_greenscore
+from utils.metrics import compute_greenscore, append_results_csv, record_run
+from utils.baselines import load_baseline, save_baseline
 
 
-def run_pipeline(
-    dataset_mode,
-    selected_models,
-    weights,
-    uploaded_file=None,
-    target_column=None,
-):
+# -------------------------------------------------
+# Pipeline
+# -------------------------------------------------
+def run_pipeline(dataset_mode, selected_models, weights, *, options=None, **kwargs):
+    """
+    Trains the selected models and scores them with GreenScore.
+
+    selected_models is resolved against models/registry.py, so only
+    ticked models are trained (None trains every registered model).
+    Options are passed as keyword arguments (e.g. repetitions=3,
+    energy_backend="rapl") and / or grouped as options=RunOptions (or a
+    dict of the same names); keyword arguments override options. See
+    pipeline/options.py for every option.
+
+    Raw measurements are kept in the result store keyed by the dataset
+    fingerprint and model configuration, and trained models in the model
+    cache, so a repeated run only re-applies the weights; replayed rows
+    have Source = "cached" instead of "measured". Benchmarks, inference
+    runs and budgeted runs bypass them.
+
+    Every stage (load, preprocess, train, inference, scoring, ...) is
+    recorded as a span with wall time, CPU time, peak RSS and energy in
+    result.profile (see pipeline/profiling.py). With a workspace,
+    profile.json and trace.json (Chrome trace) are written next to the
+    results.
+
+    Returns
+    -------
+    PipelineResult
+        Results with raw measurements and the GreenScore column
+    """
+    options = as_run_options(options).replace(**kwargs)
+
+    profiler = RunProfiler(options.measurement.energy_backend)
+    with profiler.activate(), profiler.span("run"):
+        result = _run_stages(dataset_mode, selected_models, weights, options)
+
+    result.profile = profiler.to_frame()
+    result.metadata["profile_energy_backend"] = profiler.meter.name
+
+    workspace = result.metadata.get("workspace")
+    if workspace is not None:
+        profile_to_json(result.profile, os.path.join(workspace, "profile.json"))
+        profile_to_chrome_trace(
+            result.profile, os.path.join(workspace, "trace.json"),
+            process_name=f"GreenScore run {result.run_id}",
+        )
 
-    os.makedirs("evaluation", exist_ok=True)
+    return result
 
-    results_path = "evaluation/results.csv"
-    emissions_path = "evaluation/emissions.csv"
 
-    if os.path.exists(results_path):
-        os.remove(results_path)
-    if os.path.exists(emissions_path):
-        os.remove(emissions_path)
+def _run_stages(dataset_mode, selected_models, weights, options):
+    """
+    Pipeline stages of run_pipeline, inside its root profiling span.
+    """
+    load, execution, measurement = options.load, options.execution, options.measurement
+    tuning, scoring, storage = options.tuning, options.scoring, options.storage
 
     # -------------------------------
     # Load dataset
     # -------------------------------
+    if load.streaming:
+        chunks = stream_dataset(
+            dataset_mode, load.uploaded_file, load.target_column,
+            feature_columns=load.feature_columns,
+            chunksize=load.stream_chunksize,
+        )
+        with span("load (streaming scan)"):
+            stream_stats = scan_stream(chunks)
+    else:
+        with span("load", dataset_mode=dataset_mode):
+            X, y = load_dataset(
+                dataset_mode, load.uploaded_file, load.target_column,
+                feature_columns=load.feature_columns,
+                memmap_dir=load.memmap_dir,
+            )
+
+    run_id = new_run_id()
+
+    meter = get_energy_backend(measurement.energy_backend)
+    # CodeCarbon keys stay unchanged so earlier stored results still match
+    meter_key = None if meter.name == "codecarbon" else meter.name
+
+    specs = resolve_models(selected_models)
+    if tuning.model_params:
+        specs = [
+            spec.with_params(**tuning.model_params.get(spec.name, {}))
+            for spec in specs
+        ]
+    skipped = []
+    if load.streaming:
+        skipped = [spec.name for spec in specs if spec.streaming is None]
+        specs = [spec for spec in specs if spec.streaming is not None]
+        if not specs:
+            raise ValueError("None of the selected models can be trained in streaming mode.")
+
+    budget = as_budget(measurement.budget)
+    budget_override = {"budget": budget} if budget is not None else {}
+    memory_backend = measurement.memory_backend
+    memory_override = {"memory_backend": memory_backend} if memory_backend != "rss" else {}
+
+    executor, n_jobs = execution.executor, execution.n_jobs
+    max_workers, cpu_affinity = execution.max_workers, execution.cpu_affinity
+    if executor == "process" and n_jobs is not None:
+        max_workers = max_workers or min(len(specs), n_jobs)
+        model_n_jobs = max(1, n_jobs // max_workers)
+    else:
+        model_n_jobs = n_jobs
+
+    repetitions_df = None
+    inference_df = None
+    curve_df = None
+    projection_df = None
+    search_df = None
+    projected_rows = []
+    X_train = preprocess_info = None
+    estimators = {}
+
+    # -------------------------------
+    # Hyperparameter search
+    # -------------------------------
+    if tuning.search is not None:
+        X_train, X_test, y_train, y_test, preprocess_info = _preprocess(
+            X, y, load.lean_preprocessing
+        )
+
+        with span("search", strategy=tuning.search):
+            search_df, tuned = run_search(
+                tuning.search, specs, X_train, y_train, weights,
+                eta=tuning.search_eta,
+                executor=executor,
+                max_workers=max_workers,
+                cpu_affinity=cpu_affinity,
+                energy_backend=meter,
+                overrides={"n_jobs": model_n_jobs} if model_n_jobs else None,
+                budget=budget,
+            )
+        specs = [spec.with_params(**tuned[spec.name]) for spec in specs]
+
+    model_runners = [
+        (
+            spec.name,
+            spec.runner(
+                **_core_budget(spec, model_n_jobs), **budget_override, **memory_override
+            ),
+        )
+        for spec in specs
+    ]
+
+    # -------------------------------
+    # Learning curve and pruning
+    # -------------------------------
+    if tuning.progressive:
+        if X_train is None:
+            X_train, X_test, y_train, y_test, preprocess_info = _preprocess(
+                X, y, load.lean_preprocessing
+            )
+
+        with span("learning curve"):
+            curve_df = run_learning_curve(
+                model_runners, X_train, y_train, X_test, y_test,
+                fractions=tuning.progressive_fractions,
+                executor=executor,
+                max_workers=max_workers,
+                cpu_affinity=cpu_affinity,
+                energy_backend=meter,
+            )
+        projection_df = mark_dominated(
+            project_full_size(curve_df, len(y_train), len(y_test))
+        )
+
+        pruned = set(projection_df.loc[projection_df["Dominated"], "Model"])
+        projected_rows = [
+            {**row, "Source": "projected"}
+            for row in projection_df.drop(columns="Dominated").to_dict("records")
+            if row["Model"] in pruned
+        ]
+        specs = [spec for spec in specs if spec.name not in pruned]
+        model_runners = [
+            (name, runner) for name, runner in model_runners
+            if name not in pruned
+        ]
+
+    # -------------------------------
+    # Reuse stored measurements
+    # -------------------------------
+    if load.streaming:
+        dataset_fp = stream_stats.fingerprint
+    else:
+        with span("fingerprint"):
+            dataset_fp = dataset_fingerprint(X, y, test_size=0.2, random_state=42)
+    model_config = [(spec.name, spec.params) for spec in specs]
+    estimator_keys = {
+        spec.name: spec.estimator_identity()
+        for spec in specs if spec.estimator is not None
+    }
+    if estimator_keys:
+        model_config.append(("estimators", estimator_keys))
+    if meter_key is not None:
+        model_config.append(("energy_backend", meter_key))
+    # Process pools attribute energy by CPU time share; serial keys stay
+    # unchanged. Streaming always trains serially
+    executor_key = "process" if executor == "process" and not load.streaming else None
+    if executor_key is not None:
+        model_config.append(("executor", executor_key))
+    if memory_override:
+        model_config.append(("memory_backend", memory_backend))
+    preprocessing_key = (
+        None if load.streaming else _preprocessing_key(X, load.lean_preprocessing)
+    )
+    if preprocessing_key is not None:
+        model_config.append(("preprocessing", preprocessing_key))
+    if load.streaming:
+        # Chunk boundaries and passes change what partial_fit sees
+        model_config.append(
+            ("streaming", {"chunksize": load.stream_chunksize, "epochs": load.stream_epochs})
+        )
+    run_key = make_run_key(dataset_fp, model_config)
+
+    benchmark = measurement.benchmark
+    use_store, use_cache = storage.use_store, storage.use_cache
+    if budget is not None:
+        use_store = use_cache = False
+
+    replay = use_store and not benchmark and not measurement.measure_inference
+    with span("result store"):
+        raw_df = load_raw_results(run_key) if replay else None
+    from_store = raw_df is not None
+
+    if from_store:
+        raw_df["Source"] = "cached"
+
+    elif benchmark:
+        if X_train is None:
+            X_train, X_test, y_train, y_test, preprocess_info = _preprocess(
+                X, y, load.lean_preprocessing
+            )
+
+        with span("benchmark", repetitions=measurement.repetitions, warmup=measurement.warmup):
+            repetitions_df, estimators = run_repetitions(
+                specs, X_train, y_train, X_test, y_test,
+                repetitions=measurement.repetitions,
+                warmup=measurement.warmup,
+                seeds=measurement.seeds,
+                executor=executor,
+                max_workers=max_workers,
+                cpu_affinity=cpu_affinity,
+                overrides={"n_jobs": model_n_jobs} if model_n_jobs else None,
+                return_estimators=True,
+                energy_backend=meter,
+                budget=budget,
+                memory_backend=memory_backend,
+            )
+
+        raw_df = median_results(repetitions_df)
+        raw_df["Source"] = "measured"
+
+    elif load.streaming:
+        with span("train (streaming)", epochs=load.stream_epochs):
+            raw_df = pd.DataFrame(train_streaming(
+                specs, chunks, stream_stats, load.stream_epochs, meter, memory_backend
+            ))
+        raw_df["Source"] = "measured"
+
+        if use_store:
+            save_raw_results(run_key, raw_df)
+
+    else:
+        model_cache = storage.model_cache
+        if use_cache and model_cache is None:
+            model_cache = ModelCache()
+
+        rows = {}
+        to_train = []
+
+        # -------------------------------
+        # Replay cached models
+        # -------------------------------
+        cache_keys = {
+            spec.name: model_cache_key(
+                dataset_fp, spec.name, spec.params, meter_key,
+                memory_override.get("memory_backend"),
+                preprocessing_key,
+                executor_key,
+                estimator_keys.get(spec.name),
+            )
+            for spec in specs
+        }
+
+        with span("model cache lookup"):
+            for name, runner in model_runners:
+                entry = model_cache.get(cache_keys[name]) if use_cache else None
+                if entry is not None:
+                    rows[name] = {**entry["measurements"], "Source": "cached"}
+                    estimators[name] = entry.get("estimator")
+                else:
+                    to_train.append((name, runner))
+
+        # -------------------------------
+        # Train the remaining models
+        # -------------------------------
+        if (to_train or measurement.measure_inference) and X_train is None:
+            X_train, X_test, y_train, y_test, preprocess_info = _preprocess(
+                X, y, load.lean_preprocessing
+            )
+
+        if to_train:
+            with span("train", executor=executor):
+                if executor == "process":
+                    trained = train_parallel(
+                        to_train, X_train, y_train, X_test, y_test,
+                        max_workers, cpu_affinity, meter
+                    )
+                else:
+                    trained = train_serial(
+                        to_train, X_train, y_train, X_test, y_test, meter
+                    )
+
+            for model_result in trained:
+                artifacts = model_result.pop(ARTIFACTS_KEY, None) or {}
+                name = model_result["Model"]
+
+                if use_cache:
+                    model_cache.put(cache_keys[name], {
+                        "measurements": dict(model_result),
+                        "estimator": artifacts.get("estimator"),
+                        "y_pred": artifacts.get("y_pred"),
+                    })
+
+                rows[name] = {**model_result, "Source": "measured"}
+                estimators[name] = artifacts.get("estimator")
+
+        raw_df = pd.DataFrame([rows[name] for name, _ in model_runners])
+
+        if use_store:
+            save_raw_results(run_key, raw_df)
+
+    if projected_rows:
+        raw_df = pd.concat(
+            [raw_df, pd.DataFrame(projected_rows)], ignore_index=True
+        )
+
+    # -------------------------------
+    # Inference stage
+    # -------------------------------
+    if measurement.measure_inference:
+        with span("inference"):
+            summary, inference_df = run_inference_stage(
+                estimators, X_test,
+                batch_sizes=measurement.inference_batch_sizes,
+                energy_backend=meter,
+            )
+        for column in INFERENCE_COLUMNS:
+            raw_df[column] = [
+                summary.get(name, {}).get(column) for name in raw_df["Model"]
+            ]
+        raw_df[INFERENCE_COLUMNS] = raw_df[INFERENCE_COLUMNS].astype(float)
+
+    # -------------------------------
+    # Reference baseline
+    # -------------------------------
+    baseline = None
+    if scoring.normalization is not None:
+        with span("baseline", mode=scoring.normalization):
+            baseline = load_baseline(
+                dataset_fp, scoring.normalization, scoring.baseline_window,
+                scoring.baseline_anchors, scoring.baseline_dir
+            )
+            # Replayed runs are already in the history; projections are
+            # estimates, not measurements
+            if not from_store:
+                baseline.update(raw_df[raw_df["Source"] != "projected"], run_id)
+            save_baseline(baseline, scoring.baseline_dir)
+
+    with span("score"):
+        results_df = compute_greenscore(raw_df, weights, baseline)
+
+    metadata = {
+        "run_id": run_id,
+        "dataset_mode": dataset_mode,
+        "executor": executor,
+        "n_jobs": n_jobs,
+        "preprocess": preprocess_info,
+        "repetitions": measurement.repetitions,
+        "warmup": measurement.warmup,
+        "inference": measurement.measure_inference,
+        "energy_backend": meter.name,
+        "budget": vars(budget) if budget is not None else None,
+        "progressive": list(tuning.progressive_fractions) if tuning.progressive else None,
+        "search": tuning.search,
+        "model_params": {spec.name: spec.params for spec in specs},
+        "normalization": scoring.normalization,
+        "memory_backend": memory_backend,
+        "streaming": {
+            "chunksize": load.stream_chunksize,
+            "epochs": load.stream_epochs,
+            "train_rows": stream_stats.n_train,
+            "test_rows": stream_stats.n_test,
+            "skipped": skipped,
+        } if load.streaming else None,
+    }
+
+    with span("record"):
+        if storage.workspace_root is not None:
+            workspace = create_run_workspace(storage.workspace_root, run_id)
+            workspace.write_results(
+                results_df,
+                {**metadata, "run_key": run_key, "weights": weights},
+            )
+            metadata["workspace"] = workspace.path
+
+        if storage.results_sink is not None:
+            append_results_csv(results_df, storage.results_sink, run_id=run_id)
+
+        if storage.history_db is not None:
+            record_run(
+                results_df, run_id, dataset_fp, weights,
+                {**metadata, "run_key": run_key, "from_store": from_store},
+                storage.history_db,
+            )
+
+    return PipelineResult(
+        results=results_df,
+        weights=weights,
+        run_key=run_key,
+        from_store=from_store,
+        metadata=metadata,
+        repetitions=repetitions_df,
+        inference=inference_df,
+        learning_curve=curve_df,
+        projection=projection_df,
+        search=search_df,
+        baseline=baseline,
+    )
+
+
+# -------------------------------------------------
+# Dataset Loading
+# -------------------------------------------------
+def load_dataset(
+    dataset_mode,
+    uploaded_file=None,
+    target_column=None,
+    feature_columns=None,
+    memmap_dir=None,
+):
+    """
+    Loads the built-in or a custom dataset.
+
+    Returns
+    -------
+    X, y
+        Features (DataFrame or array) and labels
+    """
     if dataset_mode == "Controlled Mode (Built-in)":
         X, y = load_wine_dataset()
 
@@ -41,51 +509,90 @@ def run_pipeline(
         if uploaded_file is None or target_column is None:
             raise ValueError("Custom dataset and target column must be provided.")
 
-        custom_df = uploaded_file
-        X, y = load_custom_dataset(custom_df, target_column)
+        if isinstance(uploaded_file, pd.DataFrame):
+            custom_df = uploaded_file
+            if feature_columns is not None:
+                custom_df = custom_df[list(feature_columns) + [target_column]]
+            X, y = load_custom_dataset(custom_df, target_column)
+        else:
+            X, y = load_custom_file(
+                uploaded_file,
+                target_column,
+                feature_columns=feature_columns,
+                memmap_dir=memmap_dir,
+            )
 
     else:
         raise ValueError("Invalid dataset mode.")
 
-    X_train, X_test, y_train, y_test = preprocess_data(X, y)
+    return X, y
 
-    model_runners = [
-        ("Logistic Regression", train_logistic_regression),
-        ("Random Forest", train_random_forest),
-        ("Neural Network (MLP)", train_mlp),
-    ]
 
-    results = []
+def stream_dataset(
+    dataset_mode,
+    uploaded_file=None,
+    target_column=None,
+    feature_columns=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+):
+    """
+    Chunk source of the built-in or a custom dataset for streaming runs.
 
-    for model_name, train_fn in model_runners:
+    Returns
+    -------
+    callable
+        chunks() starts a new pass yielding (start, X, y)
+        (see iter_custom_chunks in data/custom_dataset.py)
+    """
+    if dataset_mode == "Controlled Mode (Built-in)":
+        X, y = load_wine_dataset()
+        source = pd.concat([X, y], axis=1)
+        target_column = y.name
 
-        tracker = EmissionsTracker(
-            project_name="GreenScore",
-            output_dir="evaluation",
-            log_level="error",
-        )
+    elif dataset_mode == "Custom Dataset":
+        if uploaded_file is None or target_column is None:
+            raise ValueError("Custom dataset and target column must be provided.")
+        source = uploaded_file
+
+    else:
+        raise ValueError("Invalid dataset mode.")
 
-        tracker.start()
+    return partial(
+        iter_custom_chunks, source, target_column,
+        feature_columns=feature_columns,
+        chunksize=chunksize,
+    )
 
-        model_result = train_fn(
-            X_train, y_train, X_test, y_test
-        )
 
-        emissions_kg = tracker.stop()
+def _core_budget(spec, n_jobs):
+    """
+    Hyperparameter override limiting a model's parallelism,
+    only for models that expose n_jobs.
+    """
+    if n_jobs is None or not spec.supports("n_jobs"):
+        return {}
+    return {"n_jobs": n_jobs}
 
-        if os.path.exists(emissions_path):
-            emissions_df = pd.read_csv(emissions_path)
-            energy_kwh = emissions_df["energy_consumed"].iloc[-1]
-        else:
-            energy_kwh = 0.0
 
-        model_result["Model"] = model_name
-        model_result["Energy (kWh)"] = energy_kwh
-        model_result["CO2 (kg)"] = emissions_kg
-        model_result["CO2 (tons)"] = emissions_kg / 1000
+def _preprocess(X, y, lean):
+    """
+    preprocess_data recorded as a span. The peak-memory info is only
+    measured in lean mode (None otherwise): tracemalloc would slow down
+    the default path.
+    """
+    with span("preprocess", lean=lean):
+        if lean:
+            return preprocess_data(X, y, lean=True, return_info=True)
+        return (*preprocess_data(X, y), None)
 
-        results.append(model_result)
 
-    results_df = pd.DataFrame(results)
-    results_df = compute_greenscore(results_df, weights)
-    results_df.to_csv(results_path, index=False)
+def _preprocessing_key(X, lean):
+    """
+    Preprocessing settings that change what the models are trained on,
+    for the result store and model cache keys (None = the defaults).
+    """
+    dtypes = X.dtypes if isinstance(X, pd.DataFrame) else [X.dtype]
+    dtype = str(np.result_type(*dtypes))
+    if not lean and dtype == "float64":
+        return None
+    return {"lean": lean, "dtype": dtype}
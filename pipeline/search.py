@@ -0,0 +1,311 @@
+"""
+search.py
+---------
+GreenScore-driven hyperparameter search for the GreenScore pipeline.
+
+Responsibilities:
+1. Expand each model's search space into candidate configurations
+2. Successive halving: train every candidate on a small subsample, keep
+   the best 1/eta by partial GreenScore and grow the subsample by eta
+3. Hyperband: several halving brackets trading candidates for rows
+
+NOTE:
+- Search space comes from the registry (ModelSpec.search_space)
+- Candidates are scored on a validation split carved out of the
+  training split, never on the test set
+- The data is preprocessed once by the caller; every rung reuses
+  stratified subsamples of it (see pipeline/progressive.py)
+- Candidates only compete with other configurations of the same model:
+  the partial GreenScore is compute_greenscore over that model's
+  candidates in the rung, with the run weights
+- Every trial is measured with the chosen energy backend, so the trials
+  table is the full cost of the search
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from models.estimator import ARTIFACTS_KEY
+from pipeline.progressive import subsample_indices, take_rows
+from pipeline.training import train_serial, train_parallel
+from utils.metrics import compute_greenscore
+
+
+DEFAULT_ETA = 3
+SEARCH_METHODS = ("halving", "hyperband")
+
+
+# -------------------------------------------------
+# Candidates
+# -------------------------------------------------
+def expand_grid(search_space: dict) -> list:
+    """
+    All combinations of a {param: [values]} grid as a list of dicts
+    ([{}] for an empty grid, i.e. the default configuration only).
+    """
+    keys = list(search_space)
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(search_space[k] for k in keys))
+    ]
+
+
+def _trial_label(model_name, params):
+    settings = ", ".join(f"{k}={v}" for k, v in params.items())
+    return f"{model_name} [{settings}]" if settings else model_name
+
+
+def validation_split(X_train, y_train, validation_size: float = 0.2, random_state: int = 42):
+    """
+    Stratified split of the training data into fit and validation parts.
+
+    Returns
+    -------
+    X_fit, X_val, y_fit, y_val
+    """
+    fit_idx, val_idx = train_test_split(
+        np.arange(len(y_train)),
+        test_size=validation_size,
+        random_state=random_state,
+        stratify=np.asarray(y_train),
+    )
+    return (
+        take_rows(X_train, fit_idx), take_rows(X_train, val_idx),
+        take_rows(y_train, fit_idx), take_rows(y_train, val_idx),
+    )
+
+
+# -------------------------------------------------
+# Successive Halving
+# -------------------------------------------------
+def successive_halving(
+    specs,
+    X_train,
+    y_train,
+    weights: dict,
+    configs: dict = None,
+    eta: int = DEFAULT_ETA,
+    n_rungs: int = None,
+    executor: str = "serial",
+    max_workers: int = None,
+    cpu_affinity=None,
+    energy_backend=None,
+    overrides: dict = None,
+    budget=None,
+    validation_size: float = 0.2,
+    random_state: int = 42,
+    bracket: int = 0
+) -> pd.DataFrame:
+    """
+    Successive halving over every model's candidate configurations.
+
+    Parameters
+    ----------
+    specs : list of ModelSpec
+        Models to tune (see models/registry.py)
+    X_train, y_train : array-like
+        Preprocessed training data (a validation split is carved out)
+    weights : dict
+        GreenScore weights used to rank candidates
+    configs : dict, optional
+        {model name: [params, ...]} (default = full grid of each model)
+    eta : int, optional
+        Keep 1/eta of the candidates per rung and grow the rows by eta
+    n_rungs : int, optional
+        Number of rungs (default: enough to halve the largest grid to
+        one candidate); the last rung uses all fit rows
+    executor, max_workers, cpu_affinity : optional
+        Run the trials of a rung serially or in a process pool
+    energy_backend : str or EnergyBackend, optional
+        Energy meter for every trial
+    overrides : dict, optional
+        Extra hyperparameters for models that expose them (e.g. n_jobs)
+    budget : TrainingBudget, optional
+        Per-trial training limits
+    bracket : int, optional
+        Bracket number recorded in the output (Hyperband)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per trial with "Trial", "Params", "Bracket", "Rung",
+        "Rows", "Partial GreenScore" and "Promoted" in addition to the
+        raw result columns
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2.")
+
+    overrides = overrides or {}
+    configs = configs or {spec.name: expand_grid(spec.search_space) for spec in specs}
+
+    if n_rungs is None:
+        largest = max(len(c) for c in configs.values())
+        n_rungs = 1 + int(math.floor(math.log(largest, eta) + 1e-9))
+
+    X_fit, X_val, y_fit, y_val = validation_split(
+        X_train, y_train, validation_size, random_state
+    )
+
+    alive = {spec.name: list(configs[spec.name]) for spec in specs}
+    trials = []
+
+    for rung in range(n_rungs):
+        fraction = float(eta) ** (rung - n_rungs + 1)
+        idx = subsample_indices(y_fit, fraction, random_state)
+        X_sub, y_sub = take_rows(X_fit, idx), take_rows(y_fit, idx)
+
+        # -------------------------------
+        # Train this rung's candidates
+        # -------------------------------
+        runners = []
+        labels = []
+        for spec in specs:
+            fixed = {k: v for k, v in overrides.items() if spec.supports(k)}
+            if budget is not None:
+                fixed["budget"] = budget
+            for params in alive[spec.name]:
+                label = _trial_label(spec.name, params)
+                runners.append((label, spec.runner(**{**params, **fixed})))
+                labels.append((spec.name, label, params))
+
+        if executor == "process":
+            results = train_parallel(
+                runners, X_sub, y_sub, X_val, y_val,
+                max_workers, cpu_affinity, energy_backend
+            )
+        else:
+            results = train_serial(
+                runners, X_sub, y_sub, X_val, y_val, energy_backend
+            )
+
+        rung_rows = []
+        for result, (model, label, params) in zip(results, labels):
+            result.pop(ARTIFACTS_KEY, None)
+            rung_rows.append({
+                **result,
+                "Model": model,
+                "Trial": label,
+                "Params": params,
+                "Bracket": bracket,
+                "Rung": rung,
+                "Rows": len(idx),
+            })
+        rung_df = pd.DataFrame(rung_rows)
+
+        # -------------------------------
+        # Promote the best 1/eta per model
+        # -------------------------------
+        last_rung = rung == n_rungs - 1
+        for model, group in rung_df.groupby("Model", sort=False):
+            scored = compute_greenscore(group, weights)
+            scores = scored["GreenScore"].to_numpy()
+            keep = 1 if last_rung else max(1, math.ceil(len(group) / eta))
+            best = np.argsort(-scores, kind="stable")[:keep]
+
+            rung_df.loc[group.index, "Partial GreenScore"] = scores
+            rung_df.loc[group.index, "Promoted"] = np.isin(np.arange(len(group)), best)
+            alive[model] = [group["Params"].iloc[i] for i in best]
+
+        trials.append(rung_df)
+
+    trials_df = pd.concat(trials, ignore_index=True)
+    trials_df["Promoted"] = trials_df["Promoted"].astype(bool)
+    return trials_df
+
+
+# -------------------------------------------------
+# Hyperband
+# -------------------------------------------------
+def hyperband(
+    specs,
+    X_train,
+    y_train,
+    weights: dict,
+    eta: int = DEFAULT_ETA,
+    random_state: int = 42,
+    **halving_kwargs
+) -> pd.DataFrame:
+    """
+    Hyperband: successive halving brackets from "many candidates on few
+    rows" down to "few candidates on all rows". Candidates of each bracket
+    are sampled from the grid without replacement.
+
+    Returns
+    -------
+    pd.DataFrame
+        Trials of every bracket (see successive_halving)
+    """
+    grids = {spec.name: expand_grid(spec.search_space) for spec in specs}
+    largest = max(len(grid) for grid in grids.values())
+    s_max = int(math.floor(math.log(largest, eta) + 1e-9))
+
+    rng = np.random.default_rng(random_state)
+    brackets = []
+
+    for s in range(s_max, -1, -1):
+        n_configs = int(math.ceil((s_max + 1) / (s + 1) * eta ** s))
+        configs = {
+            name: [
+                grid[i] for i in
+                sorted(rng.choice(len(grid), min(n_configs, len(grid)), replace=False))
+            ]
+            for name, grid in grids.items()
+        }
+        brackets.append(successive_halving(
+            specs, X_train, y_train, weights,
+            configs=configs,
+            eta=eta,
+            n_rungs=s + 1,
+            random_state=random_state,
+            bracket=s,
+            **halving_kwargs,
+        ))
+
+    return pd.concat(brackets, ignore_index=True)
+
+
+# -------------------------------------------------
+# Results
+# -------------------------------------------------
+def best_configs(trials_df: pd.DataFrame, weights: dict) -> dict:
+    """
+    Best configuration per model among its trials on the most rows
+    (the final rung of every bracket).
+
+    Returns
+    -------
+    dict
+        {model name: params}
+    """
+    best = {}
+
+    for model, group in trials_df.groupby("Model", sort=False):
+        final = group[group["Rows"] == group["Rows"].max()]
+        final = final.drop_duplicates("Trial", keep="last").reset_index(drop=True)
+        scored = compute_greenscore(final, weights)
+        best[model] = dict(scored.loc[scored["GreenScore"].idxmax(), "Params"])
+
+    return best
+
+
+def run_search(
+    method: str,
+    specs,
+    X_train,
+    y_train,
+    weights: dict,
+    **kwargs
+):
+    """
+    Runs "halving" or "hyperband" and returns (trials_df, best_configs).
+    """
+    if method not in SEARCH_METHODS:
+        raise ValueError(f"Search method must be one of {SEARCH_METHODS}.")
+
+    search_fn = hyperband if method == "hyperband" else successive_halving
+    trials_df = search_fn(specs, X_train, y_train, weights, **kwargs)
+    return trials_df, best_configs(trials_df, weights)
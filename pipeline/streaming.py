@@ -0,0 +1,316 @@
+"""
+streaming.py
+------------
+Out-of-core training for datasets larger than memory.
+
+Responsibilities:
+1. Split rows into train / test by a hash of their row index, so the
+   split never needs the whole dataset
+2. Compute the scaling statistics incrementally in one pass
+3. Train models that support partial_fit chunk by chunk and evaluate
+   them on the test rows, each inside its own measured energy region
+
+NOTE:
+- Data comes from a chunk source: a callable starting a new pass over
+  (start, X, y) chunks, e.g. data/custom_dataset.iter_custom_chunks.
+  Only one chunk of features is in memory at a time; the test labels
+  and predictions (one value per test row) are kept for the metrics
+- The split is random but not stratified; it does not depend on the
+  chunk size
+- Scaling uses the train rows' mean / population std, like
+  StandardScaler, accumulated with the parallel variance formula
+- Rows are shuffled within each chunk only; data sorted by class
+  should be shuffled on disk first
+- Each model reads the data itself, so its energy region includes the
+  I/O of its own passes (training and evaluation), just as a batch
+  model's region includes fit and predict
+- Train / inference memory include the chunks being read (about one
+  chunk of features at a time) and, for prediction, the collected test
+  labels and predictions
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from pipeline.memory import PeakMemory, memory_columns, model_size_bytes
+from pipeline.profiling import span
+from pipeline.training import start_tracker, stop_tracker
+from utils.metrics import compute_classification_metrics
+
+
+DEFAULT_STREAM_EPOCHS = 1
+
+# splitmix64 constants (row index -> uniform hash)
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+# -------------------------------------------------
+# Hash Split
+# -------------------------------------------------
+def split_mask(start: int, n_rows: int, test_size: float, random_state: int) -> np.ndarray:
+    """
+    True for the test rows among rows start .. start + n_rows - 1.
+
+    Each row is assigned from a hash of its index and the seed alone,
+    so the split is the same whatever the chunk size.
+    """
+    z = np.arange(start, start + n_rows, dtype=np.uint64)
+    z += np.uint64((random_state + 1) * _GOLDEN % 2 ** 64)
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)) * (1.0 / 2 ** 53) < test_size
+
+
+# -------------------------------------------------
+# Incremental Scaling
+# -------------------------------------------------
+@dataclass
+class IncrementalScaler:
+    """
+    Running mean / variance of the training features.
+
+    Attributes
+    ----------
+    n_samples : int
+        Rows seen so far
+    mean, m2 : np.ndarray
+        Per-feature mean and sum of squared deviations (float64)
+    """
+    n_samples: int = 0
+    mean: np.ndarray = None
+    m2: np.ndarray = None
+
+    def update(self, X) -> "IncrementalScaler":
+        """
+        Adds a block of rows (Chan et al. pairwise update).
+        """
+        n = len(X)
+        if n == 0:
+            return self
+
+        block_mean = X.mean(axis=0, dtype=np.float64)
+        centered = X - block_mean
+        block_m2 = np.einsum("ij,ij->j", centered, centered)
+
+        if self.n_samples == 0:
+            self.n_samples, self.mean, self.m2 = n, block_mean, block_m2
+            return self
+
+        total = self.n_samples + n
+        delta = block_mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + block_m2 + delta ** 2 * (self.n_samples * n / total)
+        self.n_samples = total
+        return self
+
+    @property
+    def scale(self) -> np.ndarray:
+        scale = np.sqrt(self.m2 / self.n_samples)
+        scale[scale == 0.0] = 1.0
+        return scale
+
+    def transform(self, X) -> np.ndarray:
+        return (X - self.mean) / self.scale
+
+
+# -------------------------------------------------
+# Statistics Pass
+# -------------------------------------------------
+@dataclass
+class StreamStats:
+    """
+    What the statistics pass learns about a chunk source.
+    """
+    n_train: int
+    n_test: int
+    n_features: int
+    classes: np.ndarray
+    scaler: IncrementalScaler
+    fingerprint: str
+    split: dict = field(default_factory=dict)
+
+
+def scan_stream(chunks, test_size: float = 0.2, random_state: int = 42) -> StreamStats:
+    """
+    One pass over the data: validates it, fits the scaler on the train
+    rows, collects the classes and fingerprints the content.
+
+    Parameters
+    ----------
+    chunks : callable
+        chunks() starts a new pass yielding (start, X, y)
+    test_size : float, optional
+        Expected fraction of test rows
+    random_state : int, optional
+        Seed of the hash split
+
+    Returns
+    -------
+    StreamStats
+
+    Raises
+    ------
+    ValueError
+        If the data is empty, has fewer than 2 classes or one side of
+        the split is empty.
+    """
+    scaler = IncrementalScaler()
+    classes = None
+    n_train = n_test = n_features = 0
+    features_digest = hashlib.sha256()
+    labels_digest = hashlib.sha256()
+
+    for start, X, y in chunks():
+        test = split_mask(start, len(y), test_size, random_state)
+        scaler.update(X[~test])
+        n_test += int(test.sum())
+        n_train += int((~test).sum())
+        n_features = X.shape[1]
+
+        chunk_classes = np.unique(y)
+        classes = chunk_classes if classes is None else np.union1d(classes, chunk_classes)
+
+        # Row-major bytes and per-row label hashes: independent of chunking
+        features_digest.update(np.ascontiguousarray(X).tobytes())
+        labels_digest.update(
+            pd.util.hash_pandas_object(pd.Series(y), index=False).values.tobytes()
+        )
+
+    if classes is None:
+        raise ValueError("Dataset is empty.")
+    if len(classes) < 2:
+        raise ValueError("Target column must have at least 2 classes.")
+    if n_train == 0 or n_test == 0:
+        raise ValueError("Dataset is too small to split into train and test rows.")
+
+    split = {"test_size": test_size, "random_state": random_state, "split": "hash"}
+    digest = hashlib.sha256()
+    digest.update(features_digest.digest())
+    digest.update(labels_digest.digest())
+    digest.update(f"{n_features}{sorted(split.items())}".encode())
+
+    return StreamStats(
+        n_train=n_train,
+        n_test=n_test,
+        n_features=n_features,
+        classes=classes,
+        scaler=scaler,
+        fingerprint=digest.hexdigest(),
+        split=split,
+    )
+
+
+# -------------------------------------------------
+# Chunked Training
+# -------------------------------------------------
+def fit_stream(model, chunks, stats: StreamStats, epochs: int = DEFAULT_STREAM_EPOCHS):
+    """
+    Trains model in place with partial_fit on the scaled train rows of
+    every chunk, `epochs` passes over the data.
+    """
+    rng = np.random.default_rng(stats.split["random_state"])
+
+    for _ in range(epochs):
+        for start, X, y in chunks():
+            train = ~split_mask(
+                start, len(y), stats.split["test_size"], stats.split["random_state"]
+            )
+            if not train.any():
+                continue
+            order = rng.permutation(int(train.sum()))
+            model.partial_fit(
+                stats.scaler.transform(X[train])[order],
+                y[train][order],
+                classes=stats.classes,
+            )
+
+    return model
+
+
+def predict_stream(model, chunks, stats: StreamStats):
+    """
+    Predicts the test rows chunk by chunk; returns (y_true, y_pred).
+    """
+    y_true, y_pred = [], []
+
+    for start, X, y in chunks():
+        test = split_mask(
+            start, len(y), stats.split["test_size"], stats.split["random_state"]
+        )
+        if test.any():
+            y_true.append(y[test])
+            y_pred.append(model.predict(stats.scaler.transform(X[test])))
+
+    return np.concatenate(y_true), np.concatenate(y_pred)
+
+
+def train_streaming(
+    specs, chunks, stats: StreamStats,
+    epochs: int = DEFAULT_STREAM_EPOCHS,
+    energy_backend=None,
+    memory_backend: str = "rss"
+):
+    """
+    Trains each streaming-capable model inside its own measured region
+    and returns the raw measurements (one dict per model), in the same
+    format as pipeline/training.train_serial.
+
+    Parameters
+    ----------
+    specs : list of ModelSpec
+        Models with a streaming factory (see models/registry.py)
+    chunks : callable
+        chunks() starts a new pass yielding (start, X, y)
+    stats : StreamStats
+        Output of scan_stream on the same chunks
+    epochs : int, optional
+        Passes over the training rows
+    energy_backend : str or EnergyBackend, optional
+        Energy meter (see pipeline/energy.py)
+    memory_backend : str, optional
+        Memory meter, "rss" or "tracemalloc" (see pipeline/memory.py)
+    """
+    results = []
+
+    for spec in specs:
+        model = spec.streaming(**spec.params)
+
+        tracker = start_tracker(f"train (streaming): {spec.name}", energy_backend)
+
+        with span(f"train: {spec.name}"):
+            with span("fit", rows=stats.n_train, epochs=epochs):
+                with PeakMemory(memory_backend) as train_memory:
+                    start_time = time.perf_counter()
+                    fit_stream(model, chunks, stats, epochs)
+                    training_time = time.perf_counter() - start_time
+
+            with span("predict", rows=stats.n_test):
+                with PeakMemory(memory_backend) as inference_memory:
+                    y_true, y_pred = predict_stream(model, chunks, stats)
+
+        emissions_kg, energy_kwh = stop_tracker(tracker)
+
+        with span("metrics"):
+            metrics = compute_classification_metrics(y_true, y_pred)
+
+        with span("model size"):
+            model_bytes = model_size_bytes(model)
+        results.append({
+            "Model": spec.name,
+            "Accuracy": metrics["accuracy"],
+            "F1-score": metrics["f1_score"],
+            "Time (s)": training_time,
+            **memory_columns(train_memory, model_bytes, inference_memory),
+            "Energy (kWh)": energy_kwh,
+            "CO2 (kg)": emissions_kg,
+            "CO2 (tons)": emissions_kg / 1000,
+        })
+
+    return results
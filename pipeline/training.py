@@ -0,0 +1,117 @@
+"""
+training.py
+-----------
+Measured model training for the GreenScore pipeline.
+
+Responsibilities:
+1. Start / stop energy measurements of labelled regions
+2. Train models one after another, each in its own region
+3. Train models concurrently and attribute the joint energy by CPU time
+
+NOTE:
+- Each trainer returns the standard results dictionary; energy and
+  CO2 columns are added here
+- energy_backend selects the meter (see pipeline/energy.py); the
+  default is one in-memory CodeCarbon tracker per region
+- Starting and stopping a tracker are recorded as their own profiling
+  spans (see pipeline/profiling.py), so meter overhead is visible
+"""
+
+from pipeline.energy import get_energy_backend
+from pipeline.executor import train_in_process_pool, attribute_by_cpu_time
+from pipeline.profiling import span
+
+
+# -------------------------------------------------
+# Energy Tracking
+# -------------------------------------------------
+def start_tracker(label: str = None, energy_backend=None):
+    """
+    Starts measuring a labelled region on an energy backend
+    (name or instance, default CodeCarbon).
+    """
+    with span("tracker start", label=label):
+        return get_energy_backend(energy_backend).start_region(label)
+
+
+def stop_tracker(tracker):
+    """
+    Stops a region and returns (emissions_kg, energy_kwh).
+    """
+    with span("tracker stop"):
+        return tracker.stop()
+
+
+# -------------------------------------------------
+# Model Training
+# -------------------------------------------------
+def train_serial(
+    model_runners, X_train, y_train, X_test, y_test,
+    energy_backend=None
+):
+    """
+    Trains each model inside its own measured region
+    and returns the raw measurements (one dict per model).
+    """
+
+    results = []
+
+    for model_name, train_fn in model_runners:
+
+        tracker = start_tracker(f"train: {model_name}", energy_backend)
+
+        with span(f"train: {model_name}"):
+            model_result = train_fn(
+                X_train, y_train, X_test, y_test
+            )
+
+        emissions_kg, energy_kwh = stop_tracker(tracker)
+
+        model_result["Model"] = model_name
+        model_result["Energy (kWh)"] = energy_kwh
+        model_result["CO2 (kg)"] = emissions_kg
+        model_result["CO2 (tons)"] = emissions_kg / 1000
+
+        results.append(model_result)
+
+    return results
+
+
+def train_parallel(
+    model_runners, X_train, y_train, X_test, y_test,
+    max_workers, cpu_affinity, energy_backend=None
+):
+    """
+    Trains all models concurrently in a single measured region
+    and attributes energy and CO2 to each model by CPU time share.
+    Returns one dict per model.
+    """
+
+    tracker = start_tracker("train: process pool", energy_backend)
+
+    with span("process pool", workers=max_workers):
+        outcomes = train_in_process_pool(
+            model_runners, X_train, y_train, X_test, y_test,
+            max_workers=max_workers,
+            cpu_affinity=cpu_affinity,
+        )
+
+    emissions_kg, energy_kwh = stop_tracker(tracker)
+
+    cpu_seconds = [cpu for _, cpu in outcomes]
+    energy_shares = attribute_by_cpu_time(energy_kwh, cpu_seconds)
+    emissions_shares = attribute_by_cpu_time(emissions_kg, cpu_seconds)
+
+    results = []
+
+    for i, (model_name, _) in enumerate(model_runners):
+        model_result = outcomes[i][0]
+
+        model_result["Model"] = model_name
+        model_result["Energy (kWh)"] = energy_shares[i]
+        model_result["CO2 (kg)"] = emissions_shares[i]
+        model_result["CO2 (tons)"] = emissions_shares[i] / 1000
+
+        results.append(model_result)
+
+    return results
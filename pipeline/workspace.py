@@ -0,0 +1,76 @@
+"""
+workspace.py
+------------
+Per-run workspaces for the GreenScore pipeline.
+
+Responsibilities:
+1. Generate unique run IDs
+2. Create an isolated output directory for each run
+3. Write run outputs atomically inside that directory
+
+NOTE:
+- A run never deletes or rewrites another run's files, so concurrent
+  Streamlit sessions cannot corrupt each other's results
+"""
+
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from utils.storage import atomic_write_csv, atomic_write_json
+
+
+DEFAULT_RUNS_DIR = "evaluation/runs"
+
+
+def new_run_id() -> str:
+    """
+    Returns a unique, sortable run ID (UTC timestamp + random suffix).
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    return f"{stamp}-{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class RunWorkspace:
+    """
+    Output directory owned by a single run.
+    """
+    run_id: str
+    path: str
+
+    def file(self, name: str) -> str:
+        """
+        Path of a file inside the workspace.
+        """
+        return os.path.join(self.path, name)
+
+    def write_results(self, results_df, metadata: dict) -> None:
+        """
+        Atomically writes results.csv and run.json for this run.
+        """
+        atomic_write_csv(results_df, self.file("results.csv"))
+        atomic_write_json(
+            {"run_id": self.run_id, **metadata},
+            self.file("run.json"),
+        )
+
+
+def create_run_workspace(
+    root: str = DEFAULT_RUNS_DIR,
+    run_id: str = None
+) -> RunWorkspace:
+    """
+    Creates a fresh workspace directory for a run.
+
+    Raises
+    ------
+    FileExistsError
+        If a workspace with the same run ID already exists.
+    """
+    run_id = run_id or new_run_id()
+    path = os.path.join(root, run_id)
+    os.makedirs(path)
+
+    return RunWorkspace(run_id, path)
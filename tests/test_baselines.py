@@ -0,0 +1,135 @@
+"""
+Tests for reference baselines (utils/baselines.py): anchors of each
+mode, persistence, and GreenScores that stay comparable across runs.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline.run_pipeline import run_pipeline
+from utils.baselines import ReferenceBaseline, load_baseline, save_baseline
+from utils.metrics import compute_greenscore
+
+
+WEIGHTS = {"accuracy": 0.5, "energy": 0.5}
+
+
+def _run(accuracy, energy, time=(1.0, 1.0)):
+    return pd.DataFrame({
+        "Model": ["A", "B"],
+        "Accuracy": accuracy,
+        "Energy (kWh)": energy,
+        "CO2 (tons)": [1e-9, 1e-9],
+        "Time (s)": time,
+    })
+
+
+# -------------------------------------------------
+# Anchors
+# -------------------------------------------------
+def test_rolling_anchors_span_the_runs_in_the_window():
+    baseline = ReferenceBaseline("data", window=2)
+    baseline.update(_run([0.5, 0.6], [1.0, 9.0]), "r1")
+    baseline.update(_run([0.7, 0.8], [2.0, 4.0]), "r2")
+    baseline.update(_run([0.8, 0.9], [3.0, 5.0]), "r3")
+
+    assert [run["run_id"] for run in baseline.runs] == ["r2", "r3"]
+    assert baseline.bounds()["Accuracy"] == (0.7, 0.9)
+    assert baseline.bounds()["Energy (kWh)"] == (2.0, 5.0)
+
+
+def test_normalize_clips_and_handles_flat_or_missing_anchors():
+    baseline = ReferenceBaseline("data")
+    baseline.update(_run([0.5, 0.9], [1.0, 3.0]))
+
+    np.testing.assert_allclose(
+        baseline.normalize("Energy (kWh)", [0.0, 2.0, 5.0]), [0.0, 0.5, 1.0]
+    )
+    # Both models took the same time
+    assert list(baseline.normalize("Time (s)", [1.0, 2.0])) == [0.5, 0.5]
+    assert np.isnan(baseline.normalize("Latency p99 (ms)", [1.0])).all()
+
+
+def test_log_mode_scales_costs_but_not_accuracy():
+    baseline = ReferenceBaseline("data", mode="log")
+    baseline.update(_run([0.0, 1.0], [1e-6, 1e-2]))
+
+    np.testing.assert_allclose(baseline.normalize("Energy (kWh)", [1e-4]), [0.5])
+    np.testing.assert_allclose(baseline.normalize("Accuracy", [0.25]), [0.25])
+    # Zero costs sit on the log floor instead of producing -inf
+    assert baseline.normalize("Energy (kWh)", [0.0])[0] == 0.0
+
+
+def test_fixed_anchors_fall_back_to_rolling_for_other_columns():
+    baseline = ReferenceBaseline("data", mode="fixed", anchors={"Energy (kWh)": [0.0, 10.0]})
+    baseline.update(_run([0.5, 0.9], [1.0, 3.0]))
+
+    assert baseline.bounds()["Energy (kWh)"] == (0.0, 10.0)
+    assert baseline.bounds()["Accuracy"] == (0.5, 0.9)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="Baseline mode"):
+        ReferenceBaseline("data", mode="zscore")
+
+
+# -------------------------------------------------
+# Persistence
+# -------------------------------------------------
+def test_saved_baseline_loads_with_merged_anchors(tmp_path):
+    store = str(tmp_path / "baselines")
+    baseline = ReferenceBaseline("data", mode="fixed", anchors={"Time (s)": [0.0, 5.0]})
+    baseline.update(_run([0.5, 0.9], [1.0, 3.0]), "r1")
+
+    path = save_baseline(baseline, store)
+    loaded = load_baseline(
+        "data", mode="rolling", window=5,
+        anchors={"Energy (kWh)": [0.0, 1.0]}, store_dir=store,
+    )
+
+    with open(path) as f:
+        assert json.load(f)["runs"][0]["run_id"] == "r1"
+    assert loaded.runs == baseline.runs
+    assert loaded.mode == "rolling" and loaded.window == 5
+    assert loaded.anchors == {"Time (s)": [0.0, 5.0], "Energy (kWh)": [0.0, 1.0]}
+
+
+def test_missing_baseline_starts_empty(tmp_path):
+    baseline = load_baseline("new", store_dir=str(tmp_path))
+
+    assert baseline.runs == [] and baseline.bounds() == {}
+
+
+# -------------------------------------------------
+# Comparable GreenScores
+# -------------------------------------------------
+def test_model_scores_the_same_whatever_else_ran():
+    baseline = ReferenceBaseline("data")
+    baseline.update(_run([0.5, 0.9], [1.0, 3.0]))
+    alone = _run([0.7, 0.7], [2.0, 2.0]).iloc[:1]
+    with_rival = pd.concat([alone, _run([0.99, 0.99], [0.5, 0.5]).iloc[:1]])
+
+    score_alone = compute_greenscore(alone, WEIGHTS, baseline)["GreenScore"].iloc[0]
+    score_with_rival = compute_greenscore(with_rival, WEIGHTS, baseline)["GreenScore"].iloc[0]
+    within_run = compute_greenscore(with_rival, WEIGHTS)["GreenScore"].iloc[0]
+
+    assert score_alone == pytest.approx(score_with_rival)
+    assert score_alone == pytest.approx(0.5 * 0.5 + 0.5 * 0.5)
+    assert within_run != pytest.approx(score_alone)
+
+
+def test_replayed_runs_are_not_added_to_the_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    options = {"energy_backend": "cputime", "normalization": "rolling"}
+
+    first = run_pipeline("Controlled Mode (Built-in)", ["Logistic Regression"], WEIGHTS, **options)
+    second = run_pipeline("Controlled Mode (Built-in)", ["Logistic Regression"], WEIGHTS, **options)
+
+    (path,) = (tmp_path / "evaluation" / "baselines").glob("*.json")
+    history = json.loads(path.read_text())["runs"]
+    assert second.from_store
+    assert [run["run_id"] for run in history] == [first.metadata["run_id"]]
+    assert list(second.results["GreenScore"]) == pytest.approx(list(first.results["GreenScore"]))
@@ -0,0 +1,166 @@
+"""
+Tests for the headless batch runner (pipeline/batch.py) and its
+carbon-aware scheduling, with a stub forecast and a fake clock.
+"""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from pipeline import jobs
+from pipeline.batch import expand_jobs, run_matrix, validate_matrix
+from pipeline.carbon_schedule import CarbonScheduler
+from pipeline.jobs import JobQueue
+
+
+class FakeClock:
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+MATRIX = {
+    "datasets": [{"name": "wine"}, {"name": "wine-now", "flexible": False}],
+    "models": {"linear": ["Logistic Regression"]},
+    "weights": {
+        "accuracy": {"accuracy": 1.0},
+        "eco": {"accuracy": 0.2, "energy": 0.4, "carbon": 0.4},
+    },
+    "options": {"energy_backend": "cputime", "use_cache": False},
+}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Run stores, workspaces and sinks default to relative paths
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _scheduler(clock):
+    forecast = pd.DataFrame({"time": [0.0, 1000.0], "carbon_intensity": [500.0, 100.0]})
+    return CarbonScheduler(
+        forecast, deadline=5000, job_seconds=100, clock=clock, sleep=clock.sleep
+    )
+
+
+# -------------------------------------------------
+# Matrix
+# -------------------------------------------------
+def test_validate_matrix_requires_weights_and_targets():
+    with pytest.raises(ValueError):
+        validate_matrix({"weights": {}})
+    with pytest.raises(ValueError):
+        validate_matrix({"datasets": [{"name": "x", "path": "x.csv"}], "weights": {"w": {}}})
+
+
+def test_job_ids_are_stable_and_distinct():
+    first = expand_jobs(validate_matrix(MATRIX))
+    second = expand_jobs(validate_matrix(MATRIX))
+
+    assert [job["id"] for job in first] == [job["id"] for job in second]
+    assert len({job["id"] for job in first}) == 2
+
+
+# -------------------------------------------------
+# Job Queue
+# -------------------------------------------------
+def test_finish_hook_runs_before_the_future_resolves(monkeypatch):
+    monkeypatch.setattr(jobs, "run_pipeline", lambda **kwargs: "result")
+    finished = []
+
+    def finish():
+        time.sleep(0.05)
+        finished.append(True)
+
+    queue = JobQueue(max_concurrent_runs=1)
+    try:
+        future = queue.submit(finish=finish)
+        assert future.result() == "result"
+        assert finished == [True]
+        assert queue.waiting() == 0
+    finally:
+        queue.shutdown()
+
+
+def test_failed_wait_does_not_leave_a_waiting_job(monkeypatch):
+    monkeypatch.setattr(jobs, "run_pipeline", lambda **kwargs: "result")
+
+    def wait():
+        raise KeyboardInterrupt
+
+    queue = JobQueue(max_concurrent_runs=1)
+    try:
+        future = queue.submit(wait=wait)
+        with pytest.raises(KeyboardInterrupt):
+            future.result()
+        assert queue.waiting() == 0
+    finally:
+        queue.shutdown()
+
+
+# -------------------------------------------------
+# Scheduled Batch
+# -------------------------------------------------
+def test_run_matrix_defers_flexible_jobs_and_reports_savings(workdir):
+    clock = FakeClock()
+    out_dir = str(workdir / "batch")
+
+    summary = run_matrix(
+        MATRIX, out_dir, workers=2, log=lambda message: None,
+        scheduler=_scheduler(clock),
+    )
+
+    assert len(summary["done"]) == 2 and not summary["failed"]
+    assert summary["co2_saved_g"] > 0
+    assert clock() >= 1000.0
+
+    schedule = pd.read_csv(workdir / "batch" / "schedule.csv").set_index("Dataset")
+    assert schedule.loc["wine", "Intensity (g/kWh)"] == 100.0
+    assert schedule.loc["wine-now", "Intensity (g/kWh)"] == 500.0
+    assert schedule.loc["wine-now", "CO2 Saved (g)"] == 0.0
+
+    results = pd.read_csv(workdir / "batch" / "results.csv")
+    assert set(results["Profile"]) == {"accuracy", "eco"}
+    assert len(results) == 4
+
+
+def test_run_matrix_resumes_finished_jobs(workdir):
+    out_dir = str(workdir / "batch")
+    run_matrix(MATRIX, out_dir, log=lambda message: None)
+
+    summary = run_matrix(MATRIX, out_dir, log=lambda message: None)
+
+    assert summary["done"] == [] and len(summary["skipped"]) == 2
+    assert len(pd.read_csv(workdir / "batch" / "results.csv")) == 4
+
+
+def test_resume_rescores_finished_jobs_for_new_profiles(workdir):
+    out_dir = str(workdir / "batch")
+    run_matrix(MATRIX, out_dir, log=lambda message: None)
+    first = pd.read_csv(workdir / "batch" / "results.csv")
+
+    extended = {**MATRIX, "weights": {**MATRIX["weights"], "time": {"time": 1.0}}}
+    summary = run_matrix(extended, out_dir, log=lambda message: None)
+
+    assert summary["done"] == [] and len(summary["skipped"]) == 2
+    results = pd.read_csv(workdir / "batch" / "results.csv")
+    assert set(results["Profile"]) == {"accuracy", "eco", "time"}
+    assert len(results) == 6
+
+    # Existing profiles keep their scores
+    key = ["Job ID", "Profile", "Model"]
+    before = first.set_index(key)["GreenScore"]
+    after = results.set_index(key)["GreenScore"].loc[before.index]
+    pd.testing.assert_series_equal(before, after)
+
@@ -0,0 +1,69 @@
+"""
+Tests for repeated-measurement benchmarks (pipeline/benchmark.py) with
+fake trainers, so only the scheduling of runs is exercised.
+"""
+
+import pytest
+
+from models.registry import ModelSpec
+from pipeline import benchmark
+from pipeline.benchmark import median_results, run_repetitions
+
+
+def _trainer(X_train, y_train, X_test, y_test, random_state=0):
+    return {"Accuracy": 0.9, "Time (s)": float(random_state)}
+
+
+SPECS = [
+    ModelSpec("A", _trainer, {"random_state": 0}),
+    ModelSpec("B", _trainer, {"random_state": 0}),
+]
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    # One entry per training pass: the runner seeds it was given
+    calls = []
+
+    def fake_train(tasks, *args, **kwargs):
+        calls.append([runner.keywords["random_state"] for _, runner in tasks])
+        return [
+            {"Model": name, **runner(None, None, None, None),
+             "Energy (kWh)": 0.0, "CO2 (kg)": 0.0, "CO2 (tons)": 0.0}
+            for name, runner in tasks
+        ]
+
+    monkeypatch.setattr(benchmark, "train_parallel", fake_train)
+    monkeypatch.setattr(benchmark, "train_serial", fake_train)
+    return calls
+
+
+@pytest.mark.parametrize("executor", ["serial", "process"])
+def test_warmups_run_in_an_earlier_pass_and_are_dropped(batches, executor):
+    df = run_repetitions(
+        SPECS, None, None, None, None,
+        repetitions=3, warmup=2, seeds=[7, 8, 9], executor=executor,
+    )
+
+    assert batches == [[0, 0, 0, 0], [7, 7, 8, 8, 9, 9]]
+    assert list(df["Repetition"]) == [0, 0, 1, 1, 2, 2]
+    assert list(df["Seed"]) == [7, 7, 8, 8, 9, 9]
+    assert list(df["Time (s)"]) == [7.0, 7.0, 8.0, 8.0, 9.0, 9.0]
+
+
+def test_no_warmup_trains_once(batches):
+    run_repetitions(SPECS, None, None, None, None, repetitions=2, warmup=0)
+
+    assert len(batches) == 1
+
+
+def test_median_results_keeps_model_order(batches):
+    df = run_repetitions(
+        SPECS[::-1], None, None, None, None, repetitions=3, warmup=0, seeds=[1, 5, 3],
+    )
+
+    medians = median_results(df)
+
+    assert list(medians["Model"]) == ["B", "A"]
+    assert list(medians["Time (s)"]) == [3.0, 3.0]
+    assert list(medians["Repetitions"]) == [3, 3]
@@ -0,0 +1,90 @@
+"""
+Tests for budget-aware training (models/budget.py): where fitting stops
+and what the fitted model's parameters look like afterwards.
+"""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.neural_network import MLPClassifier
+
+from models.budget import TrainingBudget, as_budget, fit_within_budget
+from models.estimator import train_estimator
+
+
+# Exceeded right after the first step
+EXHAUSTED = TrainingBudget(seconds=0, energy_backend="cputime")
+UNLIMITED = TrainingBudget(energy_backend="cputime")
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 20))
+    y = (X[:, 0] + 0.5 * X[:, 1] > 0).astype(int)
+    return X, y
+
+
+# -------------------------------------------------
+# Solver Chunks (warm_start + max_iter)
+# -------------------------------------------------
+@pytest.mark.parametrize("budget, reason", [(EXHAUSTED, "time"), (UNLIMITED, None)])
+def test_solver_restores_max_iter_and_warm_start(data, budget, reason):
+    # Chunks of one solver iteration each
+    model = LogisticRegression(max_iter=10, tol=1e-12)
+
+    assert fit_within_budget(model, *data, budget) == reason
+
+    assert model.get_params()["max_iter"] == 10
+    assert model.get_params()["warm_start"] is False
+    assert hasattr(model, "coef_")
+
+
+def test_solver_stopped_early_ran_fewer_iterations(data):
+    model = LogisticRegression(max_iter=10, tol=1e-12)
+
+    fit_within_budget(model, *data, EXHAUSTED)
+
+    assert int(np.max(model.n_iter_)) == 1
+
+
+# -------------------------------------------------
+# Ensembles And Epochs
+# -------------------------------------------------
+def test_ensemble_cut_short_keeps_the_trees_it_grew(data):
+    model = RandomForestClassifier(n_estimators=20, random_state=0)
+
+    assert fit_within_budget(model, *data, EXHAUSTED) == "time"
+
+    assert model.get_params()["warm_start"] is False
+    assert model.get_params()["n_estimators"] == len(model.estimators_) == 2
+
+
+def test_epochs_stop_after_the_first_partial_fit(data):
+    model = MLPClassifier(hidden_layer_sizes=(8,), max_iter=50, random_state=0)
+
+    assert fit_within_budget(model, *data, EXHAUSTED) == "time"
+    assert model.n_iter_ == 1
+
+
+# -------------------------------------------------
+# Trainer Integration
+# -------------------------------------------------
+def test_train_estimator_flags_budget_limited_models(data):
+    X, y = data
+
+    result = train_estimator(
+        LogisticRegression, "LR", X[:240], y[:240], X[240:], y[240:],
+        budget={"seconds": 0, "energy_backend": "cputime"}, max_iter=10, tol=1e-12,
+    )
+
+    assert result["Budget Limited"] is True
+    assert result["artifacts"]["limited_by"] == "time"
+    assert result["artifacts"]["estimator"].get_params()["max_iter"] == 10
+
+
+def test_as_budget_accepts_dicts_and_none():
+    assert as_budget(None) is None
+    assert as_budget({"seconds": 5}) == TrainingBudget(seconds=5)
+    assert as_budget(EXHAUSTED) is EXHAUSTED
@@ -0,0 +1,175 @@
+"""
+Tests for carbon-aware planning (pipeline/carbon_schedule.py) with a
+stub forecast and a fake clock.
+"""
+
+import pandas as pd
+import pytest
+
+from pipeline.carbon_schedule import (
+    CarbonScheduler,
+    build_scheduler,
+    load_intensity_forecast,
+    mean_intensity,
+    to_epoch,
+)
+
+
+class FakeClock:
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _forecast(points):
+    return pd.DataFrame(
+        {"time": [float(t) for t, _ in points],
+         "carbon_intensity": [float(v) for _, v in points]}
+    )
+
+
+def _jobs(*ids):
+    return [{"id": job_id} for job_id in ids]
+
+
+# -------------------------------------------------
+# Forecast
+# -------------------------------------------------
+def test_load_forecast_sorts_and_converts_timestamps():
+    raw = pd.DataFrame({
+        "timestamp": ["2026-01-01T01:00Z", "2026-01-01T00:00Z"],
+        "carbon_intensity": [100, 300],
+    })
+
+    forecast = load_intensity_forecast(raw)
+
+    assert list(forecast["carbon_intensity"]) == [300.0, 100.0]
+    assert forecast["time"].iloc[0] == to_epoch("2026-01-01T00:00Z")
+
+
+def test_load_forecast_requires_columns():
+    with pytest.raises(ValueError):
+        load_intensity_forecast(pd.DataFrame({"timestamp": ["2026-01-01"]}))
+
+
+def test_mean_intensity_is_time_weighted_step_function():
+    forecast = _forecast([(0, 400), (100, 100)])
+
+    assert mean_intensity(forecast, 50, 150) == pytest.approx(250.0)
+    assert mean_intensity(forecast, -50, 0) == pytest.approx(400.0)
+    assert mean_intensity(forecast, 500, 500) == pytest.approx(100.0)
+
+
+# -------------------------------------------------
+# Planning
+# -------------------------------------------------
+def test_flexible_jobs_move_to_the_low_carbon_window():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 500), (1000, 100)]),
+        deadline=5000, job_seconds=100, clock=clock, sleep=clock.sleep,
+    )
+
+    plan = scheduler.plan(_jobs("a", "b")).set_index("Job ID")
+
+    assert list(plan["Planned Start"]) == [1000.0, 1100.0]
+    assert list(plan["Hold Until"]) == [1000.0, 1000.0]
+    assert (plan["Planned Intensity"] == 100.0).all()
+    assert list(plan["Immediate Start"]) == [0.0, 100.0]
+
+
+def test_inflexible_jobs_run_immediately():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 500), (1000, 100)]),
+        deadline=5000, job_seconds=100, clock=clock, sleep=clock.sleep,
+    )
+
+    plan = scheduler.plan(
+        _jobs("now", "later"), flexible=lambda job: job["id"] == "later"
+    ).set_index("Job ID")
+
+    assert plan.loc["now", "Planned Start"] == 0.0
+    assert not plan.loc["now", "Flexible"]
+    assert plan.loc["later", "Planned Start"] == 1000.0
+
+
+def test_jobs_that_cannot_meet_the_deadline_run_after_the_last_job():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 100)]),
+        deadline=150, job_seconds=100, clock=clock, sleep=clock.sleep,
+    )
+
+    plan = scheduler.plan(_jobs("a", "b"))
+
+    assert list(plan["Planned Start"]) == [0.0, 100.0]
+
+
+def test_hold_until_is_tracked_per_slot():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 500), (100, 100)]),
+        deadline=300, job_seconds=100, clock=clock, sleep=clock.sleep,
+    )
+
+    plan = scheduler.plan(
+        _jobs("first", "chained", "alone"),
+        workers=2,
+        flexible=lambda job: job["id"] != "first",
+    ).set_index("Job ID")
+
+    # Both flexible jobs start at 100, in different slots: "chained"
+    # follows "first" in its slot, "alone" opens a block of its own
+    assert plan.loc["chained", "Planned Start"] == 100.0
+    assert plan.loc["alone", "Planned Start"] == 100.0
+    assert plan.loc["chained", "Hold Until"] == 0.0
+    assert plan.loc["alone", "Hold Until"] == 100.0
+
+
+def test_wait_until_sleeps_on_the_injected_clock():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 100)]), deadline=1000, clock=clock, sleep=clock.sleep
+    )
+
+    scheduler.wait_until(250.0)
+
+    assert clock() == 250.0
+
+
+def test_savings_compare_actual_and_immediate_windows():
+    clock = FakeClock()
+    scheduler = CarbonScheduler(
+        _forecast([(0, 500), (100, 100)]), deadline=1000, clock=clock
+    )
+
+    savings = scheduler.savings(2.0, immediate_start=0, started=100, finished=200)
+
+    assert savings["CO2 (g)"] == pytest.approx(200.0)
+    assert savings["Immediate CO2 (g)"] == pytest.approx(1000.0)
+    assert savings["CO2 Saved (g)"] == pytest.approx(800.0)
+
+
+# -------------------------------------------------
+# Configuration
+# -------------------------------------------------
+def test_build_scheduler_from_matrix_section(tmp_path):
+    path = tmp_path / "forecast.csv"
+    path.write_text("timestamp,carbon_intensity\n1970-01-01T00:00Z,300\n")
+    clock = FakeClock(1000.0)
+
+    scheduler = build_scheduler(
+        {"forecast": str(path), "deadline_hours": 2, "job_seconds": 60}, clock=clock
+    )
+
+    assert scheduler.deadline == 1000.0 + 7200
+    assert scheduler.job_seconds == 60.0
+    with pytest.raises(ValueError):
+        build_scheduler({"forecast": str(path)})
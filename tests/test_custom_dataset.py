@@ -0,0 +1,180 @@
+"""
+Tests for the custom dataset loaders (data/custom_dataset.py).
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.feather  # noqa: E402
+import pyarrow.ipc  # noqa: E402
+
+from data.custom_dataset import (  # noqa: E402
+    iter_custom_chunks,
+    load_custom_csv_chunked,
+    load_custom_file,
+    read_columns,
+)
+
+
+def _frame(n_rows=40):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.normal(size=n_rows),
+        "b": rng.integers(0, 5, size=n_rows).astype(float),
+        "label": np.arange(n_rows) % 2,
+    })
+
+
+def _write_feather(df, path, layout):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if layout == "stream":
+        with pa.OSFile(str(path), "wb") as sink:
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            pa.feather.write_feather(table, str(path), version=1 if layout == "v1" else 2)
+
+
+# -------------------------------------------------
+# Chunked CSV
+# -------------------------------------------------
+@pytest.mark.parametrize("chunksize", [1, 7, 1000])
+def test_chunked_csv_matches_a_whole_file_read(tmp_path, chunksize):
+    df = _frame()
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    X, y = load_custom_csv_chunked(str(path), "label", chunksize=chunksize)
+
+    whole = pd.read_csv(path)
+    assert X.flags["C_CONTIGUOUS"] and X.shape == (40, 2)
+    np.testing.assert_array_equal(X, whole[["a", "b"]].to_numpy())
+    assert list(y) == list(whole["label"])
+
+
+def test_chunked_csv_downcasts_only_exact_values(tmp_path):
+    exact = pd.DataFrame({"a": [0.5, 1.0, 2.0, 3.0], "label": [0, 1, 0, 1]})
+    inexact = pd.DataFrame({"a": [0.1, 1.0, 2.0, 3.0], "label": [0, 1, 0, 1]})
+    exact.to_csv(tmp_path / "exact.csv", index=False)
+    inexact.to_csv(tmp_path / "inexact.csv", index=False)
+
+    assert load_custom_csv_chunked(str(tmp_path / "exact.csv"), "label", chunksize=2)[0].dtype == np.float32
+    X, _ = load_custom_csv_chunked(str(tmp_path / "inexact.csv"), "label", chunksize=2)
+    assert X.dtype == np.float64 and X[0, 0] == 0.1
+
+
+def test_chunked_csv_reports_missing_values_in_later_chunks(tmp_path):
+    df = _frame()
+    df.loc[35, "a"] = np.nan
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="missing values"):
+        load_custom_csv_chunked(str(path), "label", chunksize=10)
+
+
+def test_chunked_csv_reads_only_selected_columns_into_a_memmap(tmp_path):
+    df = _frame()
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    X, _ = load_custom_csv_chunked(
+        str(path), "label", chunksize=8, feature_columns=["b"],
+        memmap_dir=str(tmp_path / "mm"),
+    )
+
+    assert isinstance(X, np.memmap)
+    np.testing.assert_array_equal(np.asarray(X).ravel(), df["b"].to_numpy())
+
+
+def test_chunk_iteration_covers_every_row_once(tmp_path):
+    df = _frame()
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    chunks = list(iter_custom_chunks(str(path), "label", chunksize=15))
+
+    assert [start for start, _, _ in chunks] == [0, 15, 30]
+    whole = pd.read_csv(path)[["a", "b"]].to_numpy()
+    np.testing.assert_array_equal(np.vstack([X for _, X, _ in chunks]), whole)
+
+
+# -------------------------------------------------
+# Columnar And Array Formats
+# -------------------------------------------------
+def test_parquet_projection_leaves_out_the_pandas_index(tmp_path):
+    df = _frame().set_index(pd.RangeIndex(100, 140, name="row"))
+    path = tmp_path / "data.parquet"
+    df.to_parquet(path)
+
+    assert read_columns(str(path)) == ["a", "b", "label"]
+    X, y = load_custom_file(str(path), "label", feature_columns=["a"])
+
+    np.testing.assert_array_equal(np.asarray(X).ravel(), df["a"].to_numpy())
+    assert list(y) == list(df["label"])
+
+
+def test_npy_and_npz_use_positional_columns(tmp_path):
+    data = _frame().to_numpy()
+    np.save(tmp_path / "data.npy", data)
+    np.savez(tmp_path / "split.npz", X=data[:, :2], y=data[:, 2])
+
+    assert read_columns(str(tmp_path / "data.npy")) == ["0", "1", "2"]
+    X, y = load_custom_file(str(tmp_path / "data.npy"), "2", feature_columns=["1"])
+    np.testing.assert_array_equal(np.asarray(X).ravel(), data[:, 1])
+    assert list(y) == list(data[:, 2])
+
+    assert read_columns(str(tmp_path / "split.npz")) == ["0", "1", "y"]
+    X, y = load_custom_file(str(tmp_path / "split.npz"), "y")
+    np.testing.assert_array_equal(np.asarray(X), data[:, :2])
+
+
+# -------------------------------------------------
+# Feather Layouts
+# -------------------------------------------------
+@pytest.mark.parametrize("layout", ["v2", "v1", "stream"])
+def test_feather_layouts_list_and_load_columns(tmp_path, layout):
+    df = _frame()
+    path = tmp_path / f"data_{layout}.feather"
+    _write_feather(df, path, layout)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        assert read_columns(str(path)) == ["a", "b", "label"]
+        X, y = load_custom_file(str(path), "label", feature_columns=["b"])
+
+    np.testing.assert_array_equal(np.asarray(X).ravel(), df["b"].to_numpy())
+    assert list(y) == list(df["label"])
+
+
+# -------------------------------------------------
+# Feature Selection
+# -------------------------------------------------
+@pytest.mark.parametrize("suffix", [".csv", ".parquet", ".npy"])
+def test_target_only_file_asks_for_a_feature_column(tmp_path, suffix):
+    df = _frame()[["label"]]
+    path = tmp_path / f"target_only{suffix}"
+    if suffix == ".csv":
+        df.to_csv(path, index=False)
+    elif suffix == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        np.save(path, df.to_numpy())
+    target = "0" if suffix == ".npy" else "label"
+
+    with pytest.raises(ValueError, match="Select at least one feature column"):
+        load_custom_file(str(path), target)
+
+
+def test_explicit_empty_selection_is_rejected(tmp_path):
+    path = tmp_path / "data.csv"
+    _frame().to_csv(path, index=False)
+
+    with pytest.raises(ValueError, match="Select at least one feature column"):
+        load_custom_file(str(path), "label", feature_columns=[])
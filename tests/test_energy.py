@@ -0,0 +1,150 @@
+"""
+Tests for the energy sampler (pipeline/energy.py), driven by fake
+counter sources and a fake clock instead of real RAPL counters.
+"""
+
+import pytest
+
+from pipeline import energy
+from pipeline.energy import (
+    JOULES_PER_KWH,
+    CpuTimeCounterSource,
+    EnergySampler,
+    FakeCounterSource,
+    RaplCounterSource,
+    create_energy_backend,
+)
+
+
+class FakeClock:
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _write_domain(root, name, energy_uj, max_range_uj=None):
+    domain = root / name
+    domain.mkdir(exist_ok=True)
+    (domain / "energy_uj").write_text(f"{energy_uj}\n")
+    if max_range_uj is not None:
+        (domain / "max_energy_range_uj").write_text(f"{max_range_uj}\n")
+
+
+# -------------------------------------------------
+# Counter Wraparound
+# -------------------------------------------------
+def test_fake_counter_wraparound_is_unwrapped():
+    clock = FakeClock()
+    # 10 W wraps every 5 s
+    source = FakeCounterSource(watts=10.0, max_range_uj=50_000_000, clock=clock)
+    sampler = EnergySampler(source, interval=0)
+
+    for _ in range(6):
+        clock.advance(3.0)
+        sampler.sample()
+
+    assert sampler.sample() == pytest.approx(180.0)
+
+
+def test_rapl_counter_wraparound_uses_max_range(tmp_path):
+    _write_domain(tmp_path, "intel-rapl:0", 900, max_range_uj=1000)
+    _write_domain(tmp_path, "intel-rapl:0:0", 5)   # sub-domain, skipped
+    source = RaplCounterSource(root=str(tmp_path))
+    assert source.available()
+    assert list(source.read()) == [str(tmp_path / "intel-rapl:0")]
+
+    sampler = EnergySampler(source, interval=0)
+    _write_domain(tmp_path, "intel-rapl:0", 100)   # 900 -> 1000 -> 100
+
+    assert sampler.sample() == pytest.approx(200 / 1e6)
+
+
+def test_counter_reset_without_range_counts_new_value(tmp_path):
+    _write_domain(tmp_path, "intel-rapl:0", 900)
+    sampler = EnergySampler(RaplCounterSource(root=str(tmp_path)), interval=0)
+
+    _write_domain(tmp_path, "intel-rapl:0", 300)
+
+    assert sampler.sample() == pytest.approx(300 / 1e6)
+
+
+# -------------------------------------------------
+# Region Attribution
+# -------------------------------------------------
+def test_regions_get_the_energy_between_their_boundaries():
+    clock = FakeClock()
+    sampler = EnergySampler(
+        FakeCounterSource(watts=20.0, clock=clock),
+        interval=0,
+        carbon_intensity=500.0,
+    )
+
+    outer = sampler.start_region("outer")
+    clock.advance(2.0)
+    inner = sampler.start_region("inner")
+    clock.advance(3.0)
+    inner_emissions, inner_kwh = inner.stop()
+    clock.advance(1.0)
+    _, outer_kwh = outer.stop()
+
+    assert inner_kwh == pytest.approx(60.0 / JOULES_PER_KWH)
+    assert outer_kwh == pytest.approx(120.0 / JOULES_PER_KWH)
+    assert inner_emissions == pytest.approx(inner_kwh * 500.0 / 1000)
+    assert [region["label"] for region in sampler.regions] == ["inner", "outer"]
+
+
+def test_region_context_manager_records_measurement():
+    clock = FakeClock()
+    sampler = EnergySampler(FakeCounterSource(watts=36.0, clock=clock), interval=0)
+
+    with sampler.region("fit") as measurement:
+        clock.advance(100.0)
+
+    assert measurement["energy_kwh"] == pytest.approx(0.001)
+
+
+# -------------------------------------------------
+# Backend Selection
+# -------------------------------------------------
+def test_auto_falls_back_to_cpu_time_without_rapl(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        energy, "RaplCounterSource", lambda: RaplCounterSource(root=str(tmp_path))
+    )
+
+    backend = create_energy_backend("auto", interval=0)
+
+    assert backend.name == "cputime"
+    assert isinstance(backend.source, CpuTimeCounterSource)
+    with pytest.raises(RuntimeError):
+        create_energy_backend("rapl", interval=0)
+
+
+def test_auto_uses_readable_rapl(tmp_path, monkeypatch):
+    _write_domain(tmp_path, "intel-rapl:0", 0, max_range_uj=10 ** 9)
+    monkeypatch.setattr(
+        energy, "RaplCounterSource", lambda: RaplCounterSource(root=str(tmp_path))
+    )
+
+    assert create_energy_backend("auto", interval=0).name == "rapl"
+
+
+def test_cpu_time_source_counts_busy_time():
+    source = CpuTimeCounterSource(tdp_watts=8.0, cpu_count=4)
+    sampler = EnergySampler(source, interval=0)
+
+    with sampler.region("busy") as measurement:
+        sum(i * i for i in range(200_000))
+
+    assert measurement["energy_kwh"] > 0
+    assert source.max_range() == {"cpu": None}
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        create_energy_backend("joulemeter")
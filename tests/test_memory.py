@@ -0,0 +1,41 @@
+"""
+Tests for model sizing (pipeline/memory.py) on models whose arrays are
+large enough for pickle to hand them over as out-of-band buffers.
+"""
+
+import pickle
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from models.estimator import train_estimator
+from pipeline.memory import MEMORY_COLUMNS, model_size_bytes
+
+
+def _wide_dataset(n_features=9000, n_rows=60, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, n_features))
+    y = np.arange(n_rows) % 3
+    return X, y
+
+
+def test_model_size_counts_large_array_buffers():
+    X, y = _wide_dataset()
+    model = LogisticRegression(max_iter=50).fit(X, y)
+    assert model.coef_.nbytes >= 64 * 1024
+
+    size = model_size_bytes(model)
+
+    assert size == len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    assert size > model.coef_.nbytes
+
+
+def test_train_estimator_reports_size_of_wide_model():
+    X, y = _wide_dataset()
+
+    result = train_estimator(
+        LogisticRegression, "Wide", X[:45], y[:45], X[45:], y[45:], max_iter=50
+    )
+
+    assert set(MEMORY_COLUMNS) <= set(result)
+    assert result["Model Size (MB)"] > 9000 * 3 * 8 / 1024 ** 2
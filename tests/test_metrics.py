@@ -0,0 +1,120 @@
+"""
+Tests for results handling in utils/metrics.py.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.metrics import (
+    PARETO_COLUMN,
+    RESULTS_SINK_COLUMNS,
+    append_results_csv,
+    mark_pareto,
+    pareto_front_mask,
+)
+
+
+def _scored(**extra):
+    return pd.DataFrame([{
+        "Model": "A", "Accuracy": 0.9, "F1-score": 0.9, "Time (s)": 1.0,
+        "Energy (kWh)": 1e-6, "CO2 (kg)": 1e-7, "CO2 (tons)": 1e-10,
+        "Source": "measured", "GreenScore": 0.5, **extra,
+    }])
+
+
+# -------------------------------------------------
+# Results Sink
+# -------------------------------------------------
+def test_sink_keeps_values_under_their_header_across_column_sets(tmp_path):
+    path = str(tmp_path / "sink.csv")
+
+    append_results_csv(_scored(), path, run_id="plain")
+    append_results_csv(
+        _scored(**{"Latency p99 (ms)": 2.5, "Budget Limited": True}), path, run_id="extra"
+    )
+    # Benchmark medians come in another column order
+    benchmark = _scored(Repetitions=3)
+    append_results_csv(benchmark[benchmark.columns[::-1]], path, run_id="bench")
+
+    sink = pd.read_csv(path)
+
+    assert list(sink.columns) == RESULTS_SINK_COLUMNS
+    assert list(sink["Run ID"]) == ["plain", "extra", "bench"]
+    assert list(sink["GreenScore"]) == [0.5, 0.5, 0.5]
+    assert sink["Latency p99 (ms)"].tolist()[1] == 2.5
+    assert sink["Repetitions"].isna().tolist() == [True, True, False]
+
+
+def test_sink_refuses_a_file_with_other_columns(tmp_path):
+    path = tmp_path / "old.csv"
+    path.write_text("Model,GreenScore,Timestamp\nA,0.5,2024-01-01\n")
+
+    with pytest.raises(ValueError, match="different columns"):
+        append_results_csv(_scored(), str(path))
+
+    assert path.read_text().count("\n") == 2
+
+
+# -------------------------------------------------
+# Pareto Front
+# -------------------------------------------------
+def _brute_force_front(costs):
+    costs = np.where(np.isnan(costs), np.inf, costs)
+    return np.array([
+        not any(
+            (other <= row).all() and (other < row).any() for other in costs
+        )
+        for row in costs
+    ])
+
+
+def test_mark_pareto_flags_non_dominated_models():
+    df = pd.DataFrame({
+        "Model": ["fast", "accurate", "dominated", "balanced"],
+        "Accuracy": [0.80, 0.99, 0.79, 0.90],
+        "Energy (kWh)": [1.0, 5.0, 2.0, 2.0],
+        "CO2 (tons)": [1.0, 5.0, 2.0, 2.0],
+        "Time (s)": [1.0, 5.0, 2.0, 2.0],
+    })
+
+    marked = mark_pareto(df)
+
+    assert list(marked[PARETO_COLUMN]) == [True, True, False, True]
+    assert PARETO_COLUMN not in df
+
+
+def test_identical_rows_do_not_dominate_each_other():
+    costs = np.array([[1.0, 2.0], [1.0, 2.0], [2.0, 3.0]])
+
+    assert list(pareto_front_mask(costs)) == [True, True, False]
+
+
+def test_missing_measurements_count_as_worst():
+    costs = np.array([[1.0, np.nan], [2.0, 1.0], [2.0, 2.0]])
+
+    assert list(pareto_front_mask(costs)) == [True, True, False]
+
+
+@pytest.mark.parametrize("n_rows", [5, 200, 1000])
+def test_front_matches_brute_force_across_blocks(n_rows):
+    rng = np.random.default_rng(n_rows)
+    # Few distinct values, so ties and duplicates are common
+    costs = rng.integers(0, 6, size=(n_rows, 3)).astype(float)
+    costs[rng.random(n_rows) < 0.02, 1] = np.nan
+
+    np.testing.assert_array_equal(pareto_front_mask(costs), _brute_force_front(costs))
+
+
+def test_adding_a_dominated_model_leaves_the_front_unchanged():
+    df = pd.DataFrame({"Accuracy": [0.9, 0.8], "Energy (kWh)": [2.0, 1.0]})
+    objectives = {"Accuracy": True, "Energy (kWh)": False}
+    extended = pd.concat(
+        [df, pd.DataFrame({"Accuracy": [0.1], "Energy (kWh)": [100.0]})],
+        ignore_index=True,
+    )
+
+    before = mark_pareto(df, objectives)[PARETO_COLUMN]
+    after = mark_pareto(extended, objectives)[PARETO_COLUMN]
+
+    assert list(after) == list(before) + [False]
@@ -0,0 +1,58 @@
+"""
+Tests for lean preprocessing (pipeline/preprocess.py): same rows and
+values as the default mode, with less memory.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.controlled.wine_dataset import load_wine_dataset
+from pipeline import preprocess
+from pipeline.preprocess import preprocess_data
+
+
+@pytest.fixture
+def wine():
+    return load_wine_dataset()
+
+
+@pytest.mark.parametrize("block_bytes", [None, 256])
+def test_lean_mode_matches_default_split_and_scaling(wine, monkeypatch, block_bytes):
+    if block_bytes is not None:
+        # Force several gather / scale blocks on a small dataset
+        monkeypatch.setattr(preprocess, "LEAN_BLOCK_BYTES", block_bytes)
+    X, y = wine
+
+    default = preprocess_data(X, y)
+    lean = preprocess_data(X, y, lean=True)
+
+    for expected, actual in zip(default[:2], lean[:2]):
+        assert actual.dtype == np.float64
+        np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+    pd.testing.assert_series_equal(lean[2], default[2])
+    pd.testing.assert_series_equal(lean[3], default[3])
+
+
+def test_lean_mode_keeps_float32_input_float32(wine):
+    X, y = wine
+    X32 = X.to_numpy(dtype=np.float32)
+
+    X_train, X_test, _, _ = preprocess_data(X32, y.to_numpy(), lean=True)
+    X_train_ref, X_test_ref, _, _ = preprocess_data(X32.astype(np.float64), y.to_numpy())
+
+    assert X_train.dtype == X_test.dtype == np.float32
+    np.testing.assert_allclose(X_train, X_train_ref, rtol=1e-4, atol=1e-5)
+    np.testing.assert_allclose(X_test, X_test_ref, rtol=1e-4, atol=1e-5)
+
+
+def test_lean_mode_needs_less_peak_memory():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20_000, 50))
+    y = np.arange(len(X)) % 2
+
+    *_, default_info = preprocess_data(X, y, return_info=True)
+    *_, lean_info = preprocess_data(X, y, lean=True, return_info=True)
+
+    assert lean_info["lean"] and not default_info["lean"]
+    assert lean_info["peak_bytes"] < default_info["peak_bytes"]
@@ -0,0 +1,114 @@
+"""
+Tests for the model registry (models/registry.py): lazy built-in
+entries, selection resolution and hyperparameter overrides.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from models import registry
+from models.registry import (
+    LazyModel,
+    ModelSpec,
+    available_models,
+    get_model,
+    model_cost_class,
+    resolve_models,
+)
+from pipeline.run_pipeline import run_pipeline
+
+
+BUILTIN_MODELS = ["Logistic Regression", "Random Forest", "Neural Network (MLP)"]
+
+
+# -------------------------------------------------
+# Lazy Built-in Models
+# -------------------------------------------------
+def test_dashboard_imports_do_not_load_scikit_learn():
+    code = (
+        "import sys\n"
+        "import dashboard.ui_components, utils.metrics\n"
+        "from models.registry import available_models, model_cost_class\n"
+        "[model_cost_class(name) for name in available_models()]\n"
+        "loaded = [m for m in sys.modules if m.split('.')[0] == 'sklearn']\n"
+        "assert not loaded, loaded\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_builtin_models_are_listed_with_cost_class():
+    assert available_models()[:3] == BUILTIN_MODELS
+    assert [model_cost_class(name) for name in BUILTIN_MODELS] == ["low", "medium", "high"]
+
+
+def test_get_model_loads_lazy_entry_once(monkeypatch):
+    monkeypatch.setitem(
+        registry._REGISTRY, "Lazy LR",
+        LazyModel("Lazy LR", "models.logistic", "train_logistic_regression", "low"),
+    )
+
+    spec = get_model("Lazy LR")
+
+    assert isinstance(spec, ModelSpec)
+    assert spec.params["solver"] == "lbfgs"
+    assert spec.search_space == {"C": [0.01, 0.1, 1.0, 10.0]}
+    assert spec.streaming is not None
+    assert get_model("Lazy LR") is spec
+
+
+def test_unknown_model_is_rejected():
+    with pytest.raises(ValueError, match="Unknown model"):
+        get_model("Nope")
+    with pytest.raises(ValueError, match="Unknown model"):
+        model_cost_class("Nope")
+
+
+# -------------------------------------------------
+# Selection And Overrides
+# -------------------------------------------------
+def test_resolve_models_keeps_registry_order():
+    sidebar = {"Neural Network (MLP)": True, "Random Forest": False, "Logistic Regression": True}
+
+    assert [spec.name for spec in resolve_models(sidebar)] == [
+        "Logistic Regression", "Neural Network (MLP)"
+    ]
+    assert [spec.name for spec in resolve_models(["Random Forest", "Logistic Regression"])] == [
+        "Logistic Regression", "Random Forest"
+    ]
+    assert [spec.name for spec in resolve_models(None)][:3] == BUILTIN_MODELS
+
+
+def test_resolve_models_rejects_empty_selection():
+    with pytest.raises(ValueError, match="at least one model"):
+        resolve_models({"Random Forest": False})
+
+
+def test_with_params_overrides_without_touching_the_registry():
+    spec = get_model("Random Forest")
+    tuned = spec.with_params(n_estimators=5)
+
+    assert tuned.params["n_estimators"] == 5
+    assert tuned.params["random_state"] == spec.params["random_state"]
+    assert get_model("Random Forest").params["n_estimators"] != 5
+    assert tuned.runner(n_jobs=1).keywords == {**tuned.params, "n_jobs": 1}
+
+
+def test_model_params_override_registered_hyperparameters(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    weights = {"accuracy": 0.5, "energy": 0.5}
+    options = {"energy_backend": "cputime", "use_cache": False}
+
+    default = run_pipeline(
+        "Controlled Mode (Built-in)", ["Random Forest"], weights, **options
+    )
+    small = run_pipeline(
+        "Controlled Mode (Built-in)", ["Random Forest"], weights,
+        model_params={"Random Forest": {"n_estimators": 3}}, **options
+    )
+
+    assert small.metadata["model_params"]["Random Forest"]["n_estimators"] == 3
+    assert default.metadata["model_params"]["Random Forest"]["n_estimators"] != 3
+    assert small.run_key != default.run_key
+    assert not small.from_store
@@ -0,0 +1,88 @@
+"""
+Tests for replaying stored measurements (pipeline/result_store.py,
+pipeline/model_cache.py) through run_pipeline, and for what keys them.
+"""
+
+import pytest
+from sklearn.naive_bayes import BernoulliNB, GaussianNB
+
+from models import registry
+from models.registry import register_estimator
+from pipeline.run_pipeline import run_pipeline
+from utils.metrics import compute_greenscore
+
+
+BUILTIN = "Controlled Mode (Built-in)"
+MODELS = ["Logistic Regression", "Random Forest"]
+WEIGHTS = {"accuracy": 0.5, "energy": 0.3, "time": 0.2}
+OPTIONS = {"energy_backend": "cputime"}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Run stores, workspaces and sinks default to relative paths
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_REGISTRY", dict(registry._REGISTRY))
+
+
+# -------------------------------------------------
+# Replay And Re-scoring
+# -------------------------------------------------
+def test_repeated_run_replays_stored_measurements(workdir):
+    first = run_pipeline(BUILTIN, MODELS, WEIGHTS, **OPTIONS)
+    second = run_pipeline(BUILTIN, MODELS, WEIGHTS, **OPTIONS)
+
+    assert not first.from_store and second.from_store
+    assert second.run_key == first.run_key
+    assert set(second.results["Source"]) == {"cached"}
+    assert list(second.results["Time (s)"]) == pytest.approx(list(first.results["Time (s)"]))
+
+
+def test_rescore_only_reapplies_weights(workdir):
+    result = run_pipeline(BUILTIN, MODELS, WEIGHTS, **OPTIONS)
+    accuracy_only = {"accuracy": 1.0, "energy": 0.0, "time": 0.0}
+
+    rescored = result.rescore(accuracy_only)
+
+    assert rescored.run_key == result.run_key
+    assert list(rescored.raw["Time (s)"]) == list(result.raw["Time (s)"])
+    expected = compute_greenscore(result.raw, accuracy_only)["GreenScore"]
+    assert list(rescored.results["GreenScore"]) == list(expected)
+
+
+def test_model_cache_replays_models_when_store_is_off(workdir):
+    run_pipeline(BUILTIN, MODELS, WEIGHTS, use_store=False, **OPTIONS)
+    cached = run_pipeline(BUILTIN, MODELS, WEIGHTS, use_store=False, **OPTIONS)
+
+    assert not cached.from_store
+    assert set(cached.results["Source"]) == {"cached"}
+
+
+# -------------------------------------------------
+# Run Keys
+# -------------------------------------------------
+def test_executor_is_part_of_the_run_key(workdir):
+    serial = run_pipeline(BUILTIN, MODELS, WEIGHTS, **OPTIONS)
+    process = run_pipeline(
+        BUILTIN, MODELS, WEIGHTS, executor="process", max_workers=2, **OPTIONS
+    )
+
+    assert process.run_key != serial.run_key
+    assert not process.from_store
+    assert set(process.results["Source"]) == {"measured"}
+
+
+def test_registered_estimator_class_is_part_of_the_run_key(workdir, isolated_registry):
+    register_estimator("Naive Bayes", GaussianNB, cost_class="low")
+    gaussian = run_pipeline(BUILTIN, ["Naive Bayes"], WEIGHTS, **OPTIONS)
+
+    register_estimator("Naive Bayes", BernoulliNB, cost_class="low", replace=True)
+    bernoulli = run_pipeline(BUILTIN, ["Naive Bayes"], WEIGHTS, **OPTIONS)
+
+    assert bernoulli.run_key != gaussian.run_key
+    assert set(bernoulli.results["Source"]) == {"measured"}
@@ -0,0 +1,39 @@
+"""
+End-to-end tests for hyperparameter search (pipeline/search.py) through
+run_pipeline on the built-in dataset.
+"""
+
+import pytest
+
+from pipeline.run_pipeline import run_pipeline
+from pipeline.search import best_configs
+
+
+BUILTIN = "Controlled Mode (Built-in)"
+MODELS = ["Logistic Regression", "Neural Network (MLP)"]
+WEIGHTS = {"accuracy": 0.5, "energy": 0.3, "time": 0.2}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # Run stores, workspaces and sinks default to relative paths
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("method", ["halving", "hyperband"])
+def test_search_returns_one_best_configuration_per_model(workdir, method):
+    result = run_pipeline(
+        BUILTIN, MODELS, WEIGHTS,
+        search=method, energy_backend="cputime",
+        use_store=False, use_cache=False,
+    )
+
+    assert list(result.results["Model"]) == MODELS
+    assert set(result.search["Model"]) == set(MODELS)
+
+    best = best_configs(result.search, WEIGHTS)
+    tuned = result.metadata["model_params"]
+    assert set(tuned) == set(MODELS)
+    for model in MODELS:
+        assert {**tuned[model], **best[model]} == tuned[model]
@@ -0,0 +1,133 @@
+"""
+Tests for out-of-core training (pipeline/streaming.py): the row-hash
+split and the incremental scaler, whatever the chunk size.
+"""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from pipeline.streaming import (
+    IncrementalScaler,
+    fit_stream,
+    predict_stream,
+    scan_stream,
+    split_mask,
+)
+
+
+def _data(n_rows=1000, n_features=4):
+    rng = np.random.default_rng(0)
+    X = rng.normal(loc=[0.0, 5.0, -3.0, 100.0][:n_features], size=(n_rows, n_features))
+    y = (X[:, 0] > 0).astype(int)
+    return X, y
+
+
+def _chunks(X, y, size):
+    return lambda: (
+        (start, X[start:start + size], y[start:start + size])
+        for start in range(0, len(y), size)
+    )
+
+
+# -------------------------------------------------
+# Hash Split
+# -------------------------------------------------
+@pytest.mark.parametrize("size", [1, 7, 256])
+def test_split_does_not_depend_on_the_chunk_size(size):
+    whole = split_mask(0, 1000, 0.2, 42)
+
+    chunked = np.concatenate([
+        split_mask(start, min(size, 1000 - start), 0.2, 42)
+        for start in range(0, 1000, size)
+    ])
+
+    np.testing.assert_array_equal(chunked, whole)
+
+
+def test_split_fraction_follows_test_size_and_seed():
+    mask = split_mask(0, 100_000, 0.2, 42)
+
+    assert mask.mean() == pytest.approx(0.2, abs=0.01)
+    assert not split_mask(0, 1000, 0.0, 42).any()
+    assert split_mask(0, 1000, 1.0, 42).all()
+    assert (split_mask(0, 1000, 0.2, 7) != mask[:1000]).any()
+
+
+# -------------------------------------------------
+# Incremental Scaling
+# -------------------------------------------------
+def test_scaler_matches_standard_scaler_over_uneven_blocks():
+    X, _ = _data()
+    scaler = IncrementalScaler()
+    for start, stop in [(0, 1), (1, 1), (1, 300), (300, 301), (301, 1000)]:
+        scaler.update(X[start:stop])
+
+    reference = StandardScaler().fit(X)
+
+    assert scaler.n_samples == len(X)
+    np.testing.assert_allclose(scaler.mean, reference.mean_, rtol=1e-12)
+    np.testing.assert_allclose(scaler.scale, reference.scale_, rtol=1e-12)
+    np.testing.assert_allclose(scaler.transform(X), reference.transform(X), atol=1e-12)
+
+
+def test_scaler_leaves_constant_features_unscaled():
+    X = np.column_stack([np.full(10, 3.0), np.arange(10.0)])
+
+    scaler = IncrementalScaler().update(X[:4]).update(X[4:])
+
+    assert scaler.scale[0] == 1.0
+    np.testing.assert_array_equal(scaler.transform(X)[:, 0], 0.0)
+
+
+# -------------------------------------------------
+# Statistics Pass
+# -------------------------------------------------
+@pytest.mark.parametrize("size", [13, 1000])
+def test_scan_fits_the_scaler_on_train_rows_only(size):
+    X, y = _data()
+    test = split_mask(0, len(y), 0.2, 42)
+
+    stats = scan_stream(_chunks(X, y, size), 0.2, 42)
+
+    assert (stats.n_train, stats.n_test) == ((~test).sum(), test.sum())
+    assert stats.n_features == 4 and list(stats.classes) == [0, 1]
+    np.testing.assert_allclose(stats.scaler.mean, X[~test].mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(stats.scaler.scale, X[~test].std(axis=0), rtol=1e-12)
+
+
+def test_fingerprint_depends_on_content_and_split_not_chunking():
+    X, y = _data()
+    fingerprint = scan_stream(_chunks(X, y, 1000)).fingerprint
+
+    assert scan_stream(_chunks(X, y, 13)).fingerprint == fingerprint
+    assert scan_stream(_chunks(X, y, 13), random_state=0).fingerprint != fingerprint
+    assert scan_stream(_chunks(X, 1 - y, 13)).fingerprint != fingerprint
+
+
+@pytest.mark.parametrize("y, test_size, message", [
+    (np.array([], dtype=int), 0.2, "empty"),
+    (np.zeros(50, dtype=int), 0.2, "at least 2 classes"),
+    (np.arange(50) % 2, 0.0, "too small"),
+])
+def test_scan_rejects_unusable_data(y, test_size, message):
+    X = np.zeros((len(y), 2))
+
+    with pytest.raises(ValueError, match=message):
+        scan_stream(_chunks(X, y, 10), test_size, 42)
+
+
+# -------------------------------------------------
+# Chunked Training
+# -------------------------------------------------
+def test_predict_stream_covers_exactly_the_test_rows():
+    X, y = _data()
+    chunks = _chunks(X, y, 64)
+    stats = scan_stream(chunks)
+
+    model = fit_stream(SGDClassifier(random_state=0), chunks, stats, epochs=2)
+    y_true, y_pred = predict_stream(model, chunks, stats)
+
+    np.testing.assert_array_equal(y_true, y[split_mask(0, len(y), 0.2, 42)])
+    assert (y_pred == y_true).mean() > 0.9
@@ -0,0 +1,187 @@
+"""
+baselines.py
+------------
+Reference baselines for comparable GreenScores across runs.
+
+Responsibilities:
+1. Keep the per-run min / max of every scored metric for one dataset
+2. Turn that history into normalization anchors:
+   * rolling: min / max over the last `window` runs
+   * log: like rolling, with cost metrics (energy, CO2, time, latency,
+     memory)
+     compared on a log10 scale
+   * fixed: user-given anchors, falling back to rolling for the rest
+3. Persist baselines as JSON under evaluation/baselines/
+
+NOTE:
+- Without a baseline, GreenScore min-max scales within one run, so a
+  score of 0.8 in one run is not comparable to 0.8 in another
+- A run only appends its own min / max, so scoring a new run never
+  re-reads or recomputes earlier runs
+- Values outside the anchors are clipped to [0, 1]; if low == high
+  (e.g. one model in the first run) the metric scores 0.5
+- Baselines are written atomically; concurrent updates of the same
+  dataset keep the last writer's history
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+import numpy as np
+
+from utils.metrics import (
+    GREENSCORE_TERMS,
+    INFERENCE_WEIGHT_COLUMNS,
+    MEMORY_WEIGHT_COLUMNS,
+)
+from utils.storage import atomic_write_json
+
+
+BASELINE_MODES = ("rolling", "log", "fixed")
+DEFAULT_BASELINE_DIR = "evaluation/baselines"
+DEFAULT_WINDOW = 20
+
+# Metrics tracked by a baseline (every GreenScore term)
+BASELINE_COLUMNS = (
+    list(GREENSCORE_TERMS.values())
+    + list(INFERENCE_WEIGHT_COLUMNS.values())
+    + list(MEMORY_WEIGHT_COLUMNS.values())
+)
+
+# Smallest value used on the log scale (costs can be reported as zero)
+_LOG_FLOOR = 1e-12
+
+
+@dataclass
+class ReferenceBaseline:
+    """
+    Normalization history of one dataset.
+
+    Attributes
+    ----------
+    dataset : str
+        Dataset fingerprint (see pipeline/result_store.py)
+    mode : str
+        "rolling", "log" or "fixed"
+    window : int or None
+        Runs kept and used for the anchors (None = every run)
+    anchors : dict
+        Fixed anchors {column: [low, high]} (raw units, fixed mode)
+    runs : list of dict
+        {"run_id", "timestamp", "min": {column: value}, "max": {...}}
+    """
+    dataset: str
+    mode: str = "rolling"
+    window: int = DEFAULT_WINDOW
+    anchors: dict = field(default_factory=dict)
+    runs: list = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.mode not in BASELINE_MODES:
+            raise ValueError(f"Baseline mode must be one of {BASELINE_MODES}.")
+
+    def update(self, raw_df, run_id: str = None) -> "ReferenceBaseline":
+        """
+        Appends one run's min / max of every tracked metric.
+        """
+        columns = [
+            column for column in BASELINE_COLUMNS
+            if column in raw_df.columns and raw_df[column].notna().any()
+        ]
+        if not columns:
+            return self
+
+        self.runs.append({
+            "run_id": run_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "min": {column: float(raw_df[column].min()) for column in columns},
+            "max": {column: float(raw_df[column].max()) for column in columns},
+        })
+        if self.window is not None:
+            self.runs = self.runs[-self.window:]
+        return self
+
+    def bounds(self) -> dict:
+        """
+        Raw-unit anchors {column: (low, high)} of the current mode.
+        """
+        runs = self.runs[-self.window:] if self.window is not None else self.runs
+        bounds = {}
+
+        for run in runs:
+            for column, low in run["min"].items():
+                high = run["max"][column]
+                if column in bounds:
+                    low = min(low, bounds[column][0])
+                    high = max(high, bounds[column][1])
+                bounds[column] = (low, high)
+
+        if self.mode == "fixed":
+            bounds.update({column: tuple(pair) for column, pair in self.anchors.items()})
+
+        return bounds
+
+    def normalize(self, column: str, values) -> np.ndarray:
+        """
+        Anchored [0, 1] normalization of one metric (higher value -> 1).
+        NaN if the baseline has no anchors for the column.
+        """
+        values = np.asarray(values, dtype=float)
+        bounds = self.bounds()
+        if column not in bounds:
+            return np.full(len(values), np.nan)
+
+        low, high = bounds[column]
+        if self.mode == "log" and column != GREENSCORE_TERMS["accuracy"]:
+            values, low, high = (
+                np.log10(np.maximum(v, _LOG_FLOOR)) for v in (values, low, high)
+            )
+
+        if high == low:
+            return np.where(np.isnan(values), np.nan, 0.5)
+        return np.clip((values - low) / (high - low), 0.0, 1.0)
+
+
+# -------------------------------------------------
+# Persistence
+# -------------------------------------------------
+def baseline_path(dataset: str, store_dir: str = DEFAULT_BASELINE_DIR) -> str:
+    return os.path.join(store_dir, f"{dataset}.json")
+
+
+def load_baseline(
+    dataset: str,
+    mode: str = "rolling",
+    window: int = DEFAULT_WINDOW,
+    anchors: dict = None,
+    store_dir: str = DEFAULT_BASELINE_DIR
+) -> ReferenceBaseline:
+    """
+    Loads the stored baseline of a dataset (or starts an empty one).
+
+    mode and window choose how the history is used; anchors, if given,
+    replace the stored fixed anchors of those columns.
+    """
+    path = baseline_path(dataset, store_dir)
+    stored = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            stored = json.load(f)
+
+    return ReferenceBaseline(
+        dataset=dataset,
+        mode=mode,
+        window=window,
+        anchors={**stored.get("anchors", {}), **(anchors or {})},
+        runs=stored.get("runs", []),
+    )
+
+
+def save_baseline(baseline: ReferenceBaseline, store_dir: str = DEFAULT_BASELINE_DIR) -> str:
+    """
+    Writes a baseline atomically; returns its path.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    return atomic_write_json(asdict(baseline), baseline_path(baseline.dataset, store_dir))
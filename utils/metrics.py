@@ -1,5 +1,85 @@
+import itertools
+import json
+import os
+import platform
+import sqlite3
+import warnings
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import numpy as np
 import pandas as pd
-from sklearn.metrics import accuracy_score, f1_score
+
+from utils.storage import locked_append
+
+
+# Raw measurement columns produced by the pipeline.
+# GreenScore is derived from these and the user weights only.
+RAW_RESULT_COLUMNS = [
+    "Model",
+    "Accuracy",
+    "F1-score",
+    "Energy (kWh)",
+    "CO2 (kg)",
+    "CO2 (tons)",
+    "Time (s)",
+    "Train Memory (MB)",
+    "Model Size (MB)",
+    "Inference Memory (MB)",
+    "Memory Footprint (MB)",
+]
+
+# Weighted GreenScore terms: weight key -> results column.
+# Accuracy comes first and is the only "higher is better" term.
+GREENSCORE_TERMS = {
+    "accuracy": "Accuracy",
+    "energy": "Energy (kWh)",
+    "carbon": "CO2 (tons)",
+    "time": "Time (s)",
+}
+GREENSCORE_WEIGHT_KEYS = tuple(GREENSCORE_TERMS)
+
+# Pareto objectives: results column -> True if higher is better
+PARETO_OBJECTIVES = {
+    "Accuracy": True,
+    "Energy (kWh)": False,
+    "CO2 (tons)": False,
+    "Time (s)": False,
+}
+PARETO_COLUMN = "Pareto Optimal"
+
+# Rows moved to the Pareto front per vectorized step
+_PARETO_BLOCK = 64
+
+# Optional inference terms: weight key -> results column (lower is better).
+# Only used when the inference stage ran (see pipeline/inference.py).
+INFERENCE_WEIGHT_COLUMNS = {
+    "latency": "Latency p99 (ms)",
+    "inference_energy": "Energy / 1k preds (kWh)",
+}
+
+# Optional memory term: weight key -> results column (lower is better).
+# The footprint is model size + inference working set (pipeline/memory.py).
+MEMORY_WEIGHT_COLUMNS = {
+    "memory": "Memory Footprint (MB)",
+}
+
+# Columns of the results sink CSV, in file order. Runs only fill the
+# columns they produce (benchmark medians, budgets, inference stage), so
+# every appended run is reindexed to this list and stays under its header.
+RESULTS_SINK_COLUMNS = [
+    *RAW_RESULT_COLUMNS,
+    "Repetitions",
+    "Budget Limited",
+    "Latency p50 (ms)",
+    "Latency p99 (ms)",
+    "Throughput (rows/s)",
+    "Energy / 1k preds (kWh)",
+    "Source",
+    "GreenScore",
+    "Run ID",
+    "Timestamp",
+]
 
 
 # -------------------------------------------------
@@ -25,6 +105,336 @@ def load_results_csv(path: str = "evaluation/results.csv") -> pd.DataFrame:
         return pd.DataFrame()
 
 
+# -------------------------------------------------
+# Append Results CSV (optional sink)
+# -------------------------------------------------
+def append_results_csv(
+    df: pd.DataFrame,
+    path: str = "evaluation/results.csv",
+    run_id: str = None
+) -> str:
+    """
+    Appends scored results to a CSV file, never overwriting earlier runs.
+
+    A "Timestamp" column (UTC, ISO 8601) and, if given, a "Run ID" column
+    are added so rows of different runs can be told apart. Rows are
+    reindexed to RESULTS_SINK_COLUMNS (columns a run did not produce stay
+    empty, others are dropped), so runs with different options line up
+    under the same header. The append is locked, so concurrent sessions
+    never interleave rows. The header is only written for a new file.
+
+    Returns
+    -------
+    str
+        Path of the CSV file.
+
+    Raises
+    ------
+    ValueError
+        If the existing file has a different header (e.g. a sink written
+        by an earlier version); appending would shift values.
+    """
+    rows = df.copy()
+    if run_id is not None:
+        rows["Run ID"] = run_id
+    rows["Timestamp"] = datetime.now(timezone.utc).isoformat()
+    rows = rows.reindex(columns=RESULTS_SINK_COLUMNS)
+
+    with locked_append(path) as (f, is_new):
+        if not is_new and list(pd.read_csv(path, nrows=0).columns) != RESULTS_SINK_COLUMNS:
+            raise ValueError(
+                f"Results sink '{path}' has different columns; append to a new file."
+            )
+        rows.to_csv(f, header=is_new, index=False)
+
+    return path
+
+
+# -------------------------------------------------
+# Run History (SQLite)
+# -------------------------------------------------
+DEFAULT_HISTORY_DB = "evaluation/history.sqlite"
+
+# Results column -> measurements table column; anything else is kept
+# in the JSON "extra" column
+HISTORY_COLUMNS = {
+    "Model": "model",
+    "Accuracy": "accuracy",
+    "F1-score": "f1_score",
+    "Energy (kWh)": "energy_kwh",
+    "CO2 (kg)": "co2_kg",
+    "Time (s)": "time_s",
+    "GreenScore": "greenscore",
+    "Source": "source",
+}
+
+_HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    dataset_mode TEXT,
+    weights TEXT,
+    metadata TEXT,
+    environment TEXT
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL REFERENCES runs(run_id),
+    timestamp TEXT NOT NULL,
+    dataset TEXT NOT NULL,
+    model TEXT NOT NULL,
+    accuracy REAL,
+    f1_score REAL,
+    energy_kwh REAL,
+    co2_kg REAL,
+    time_s REAL,
+    greenscore REAL,
+    source TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_dataset_time ON runs(dataset, timestamp);
+CREATE INDEX IF NOT EXISTS runs_time ON runs(timestamp);
+CREATE INDEX IF NOT EXISTS measurements_dataset_time ON measurements(dataset, timestamp);
+CREATE INDEX IF NOT EXISTS measurements_model_time ON measurements(model, timestamp);
+CREATE INDEX IF NOT EXISTS measurements_time ON measurements(timestamp);
+CREATE INDEX IF NOT EXISTS measurements_run ON measurements(run_id);
+"""
+
+
+@contextmanager
+def _history_db(path: str):
+    """
+    Opens the history database (created on first use), commits on success.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        # WAL: readers (dashboard sessions) never block the writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_HISTORY_SCHEMA)
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def environment_info() -> dict:
+    """
+    Host details recorded with every run.
+    """
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _history_filters(dataset=None, model=None, since=None, until=None):
+    clauses, params = [], []
+    for clause, value in (
+        ("dataset = ?", dataset),
+        ("model = ?", model),
+        ("timestamp >= ?", since),
+        ("timestamp < ?", until),
+    ):
+        if value is not None:
+            clauses.append(clause)
+            params.append(value)
+    return clauses, params
+
+
+def record_run(
+    results_df: pd.DataFrame,
+    run_id: str,
+    dataset: str,
+    weights: dict = None,
+    metadata: dict = None,
+    path: str = DEFAULT_HISTORY_DB
+) -> str:
+    """
+    Records one run (one row per model) in the run-history database.
+
+    Parameters
+    ----------
+    results_df : pd.DataFrame
+        Scored results of the run
+    run_id : str
+        Unique run ID (see pipeline/workspace.py)
+    dataset : str
+        Dataset fingerprint (see pipeline/result_store.py)
+    weights, metadata : dict, optional
+        Stored as JSON with the run, together with environment_info()
+
+    Returns
+    -------
+    str
+        Path of the database.
+    """
+    metadata = metadata or {}
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    rows = []
+    for record in results_df.to_dict("records"):
+        extra = {k: v for k, v in record.items() if k not in HISTORY_COLUMNS}
+        rows.append(
+            [run_id, timestamp, dataset]
+            + [record.get(column) for column in HISTORY_COLUMNS]
+            + [json.dumps(extra, default=str)]
+        )
+
+    with _history_db(path) as conn:
+        conn.execute(
+            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, timestamp, dataset, metadata.get("dataset_mode"),
+                json.dumps(weights, default=str),
+                json.dumps(metadata, default=str),
+                json.dumps(environment_info()),
+            ),
+        )
+        conn.executemany(
+            f"INSERT INTO measurements (run_id, timestamp, dataset, "
+            f"{', '.join(HISTORY_COLUMNS.values())}, extra) "
+            f"VALUES ({', '.join('?' * (len(HISTORY_COLUMNS) + 4))})",
+            rows,
+        )
+
+    return path
+
+
+def load_history_page(
+    path: str = DEFAULT_HISTORY_DB,
+    dataset: str = None,
+    model: str = None,
+    since: str = None,
+    until: str = None,
+    page_size: int = 100,
+    cursor=None
+):
+    """
+    One page of recorded measurements, newest first.
+
+    Pages are keyset-paginated on (timestamp, id), so every page is an
+    index range scan no matter how many runs are stored.
+
+    Parameters
+    ----------
+    dataset, model : str, optional
+        Filters (dataset fingerprint, model name)
+    since, until : str, optional
+        ISO 8601 UTC timestamp range [since, until)
+    cursor : tuple, optional
+        next_cursor of the previous page (None = newest page)
+
+    Returns
+    -------
+    (pd.DataFrame, tuple or None)
+        The page (results columns plus "Run ID", "Timestamp" and
+        "Dataset") and the cursor of the next page (None if last)
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(), None
+
+    clauses, params = _history_filters(dataset, model, since, until)
+    if cursor is not None:
+        clauses.append("(timestamp, id) < (?, ?)")
+        params.extend(cursor)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    with _history_db(path) as conn:
+        page = pd.read_sql_query(
+            f"SELECT id, run_id, timestamp, dataset, "
+            f"{', '.join(HISTORY_COLUMNS.values())} FROM measurements {where} "
+            f"ORDER BY timestamp DESC, id DESC LIMIT ?",
+            conn,
+            params=params + [page_size],
+        )
+
+    next_cursor = None
+    if len(page) == page_size:
+        last = page.iloc[-1]
+        next_cursor = (last["timestamp"], int(last["id"]))
+
+    page = page.drop(columns="id").rename(columns={
+        "run_id": "Run ID",
+        "timestamp": "Timestamp",
+        "dataset": "Dataset",
+        **{v: k for k, v in HISTORY_COLUMNS.items()},
+    })
+    return page, next_cursor
+
+
+def summarize_history(
+    path: str = DEFAULT_HISTORY_DB,
+    dataset: str = None,
+    model: str = None,
+    since: str = None,
+    until: str = None
+) -> pd.DataFrame:
+    """
+    Per dataset and model aggregates over the recorded runs
+    (computed in SQLite, nothing but the summary is loaded).
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataset, Model, Runs, mean / best accuracy, mean / min energy,
+        mean time and the last run's timestamp
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    clauses, params = _history_filters(dataset, model, since, until)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    with _history_db(path) as conn:
+        return pd.read_sql_query(
+            f"""
+            SELECT dataset AS "Dataset",
+                   model AS "Model",
+                   COUNT(DISTINCT run_id) AS "Runs",
+                   AVG(accuracy) AS "Accuracy mean",
+                   MAX(accuracy) AS "Accuracy best",
+                   AVG(energy_kwh) AS "Energy (kWh) mean",
+                   MIN(energy_kwh) AS "Energy (kWh) min",
+                   AVG(time_s) AS "Time (s) mean",
+                   MAX(timestamp) AS "Last Run"
+            FROM measurements {where}
+            GROUP BY dataset, model
+            ORDER BY "Last Run" DESC
+            """,
+            conn,
+            params=params,
+        )
+
+
+def list_history_datasets(path: str = DEFAULT_HISTORY_DB) -> pd.DataFrame:
+    """
+    Datasets with recorded runs, most recently used first.
+    """
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=["Dataset", "Dataset Mode", "Runs", "Last Run"])
+
+    with _history_db(path) as conn:
+        return pd.read_sql_query(
+            """
+            SELECT dataset AS "Dataset",
+                   MAX(dataset_mode) AS "Dataset Mode",
+                   COUNT(*) AS "Runs",
+                   MAX(timestamp) AS "Last Run"
+            FROM runs
+            GROUP BY dataset
+            ORDER BY "Last Run" DESC
+            """,
+            conn,
+        )
+
+
 # -------------------------------------------------
 # Classification Metrics
 # -------------------------------------------------
@@ -37,6 +447,10 @@ def compute_classification_metrics(y_true, y_pred) -> dict:
     dict
         Accuracy and F1-score.
     """
+    # Already loaded with the trainers (scikit-learn estimators import it);
+    # deferred so the dashboard and scoring start without scikit-learn
+    from sklearn.metrics import accuracy_score, f1_score
+
     return {
         "accuracy": accuracy_score(y_true, y_pred),
         "f1_score": f1_score(y_true, y_pred, average="weighted"),
@@ -50,17 +464,125 @@ def normalize_series(series: pd.Series) -> pd.Series:
     """
     Normalizes a pandas Series to range [0, 1].
 
-    Handles edge case where all values are equal.
+    Handles edge case where all values are equal (every value becomes
+    1.0). The result keeps the index of the input.
     """
     if series.max() == series.min():
-        return pd.Series([1.0] * len(series))
+        return pd.Series(1.0, index=series.index)
     return (series - series.min()) / (series.max() - series.min())
 
 
+def _normalize_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Column-wise normalize_series of an (N x K) array in one pass.
+    All-NaN columns stay NaN.
+    """
+    with warnings.catch_warnings():
+        # All-NaN columns (e.g. no inference measurement)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        low = np.nanmin(values, axis=0)
+        high = np.nanmax(values, axis=0)
+
+    span = high - low
+    constant = span == 0
+    normalized = (values - low) / np.where(constant, 1.0, span)
+    normalized[:, constant] = 1.0
+    return normalized
+
+
 # -------------------------------------------------
 # GreenScore Calculation
 # -------------------------------------------------
-def compute_greenscore(df: pd.DataFrame, weights: dict) -> pd.DataFrame:
+def greenscore_terms(df: pd.DataFrame, baseline=None) -> pd.DataFrame:
+    """
+    Normalized per-model GreenScore terms, one column per weight key
+    (GREENSCORE_WEIGHT_KEYS plus any INFERENCE_WEIGHT_COLUMNS and
+    MEMORY_WEIGHT_COLUMNS present).
+
+    Higher is better for every term: accuracy is normalized, cost
+    metrics are 1 - normalized. Missing measurements count as 0.
+    Normalization is min-max within df, or against the anchors of a
+    ReferenceBaseline (see utils/baselines.py) if one is given.
+    """
+    columns = dict(GREENSCORE_TERMS)
+    columns.update({
+        key: column
+        for key, column in {**INFERENCE_WEIGHT_COLUMNS, **MEMORY_WEIGHT_COLUMNS}.items()
+        if column in df.columns
+    })
+
+    values = df[list(columns.values())].to_numpy(dtype=float)
+    if baseline is None:
+        normalized = _normalize_columns(values)
+    else:
+        normalized = np.column_stack([
+            baseline.normalize(column, values[:, i])
+            for i, column in enumerate(columns.values())
+        ])
+
+    # Only accuracy is "higher is better"; costs are inverted
+    normalized[:, 1:] = 1 - normalized[:, 1:]
+
+    return pd.DataFrame(
+        np.nan_to_num(normalized, nan=0.0),
+        index=df.index,
+        columns=list(columns),
+    )
+
+
+def weight_matrix(weight_profiles, keys) -> np.ndarray:
+    """
+    (M x K) weight array for the given term keys.
+
+    weight_profiles may be a single weights dict, a list of dicts
+    (missing keys count as 0) or an array whose columns follow
+    GREENSCORE_WEIGHT_KEYS (extra keys then count as 0).
+    """
+    if isinstance(weight_profiles, dict):
+        weight_profiles = [weight_profiles]
+
+    if len(weight_profiles) and isinstance(weight_profiles[0], dict):
+        return np.array(
+            [[profile.get(key, 0) for key in keys] for profile in weight_profiles],
+            dtype=float,
+        ).reshape(-1, len(keys))
+
+    profiles = np.atleast_2d(np.asarray(weight_profiles, dtype=float))
+    if profiles.shape[1] != len(GREENSCORE_WEIGHT_KEYS):
+        raise ValueError(
+            f"Weight arrays need one column per key in {GREENSCORE_WEIGHT_KEYS}."
+        )
+
+    weights = np.zeros((len(profiles), len(keys)))
+    weights[:, :profiles.shape[1]] = profiles
+    return weights
+
+
+def compute_greenscore_matrix(df: pd.DataFrame, weight_profiles, baseline=None) -> np.ndarray:
+    """
+    GreenScore of every model under many weight profiles at once.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw results (one row per model)
+    weight_profiles : array-like or list of dict
+        (M x 4) array with columns GREENSCORE_WEIGHT_KEYS, or M weight
+        dicts (which may also weight the inference terms)
+    baseline : ReferenceBaseline, optional
+        Normalize against stored anchors instead of within df
+
+    Returns
+    -------
+    np.ndarray
+        (M x N) scores, row m for profile m, column n for df row n
+    """
+    terms = greenscore_terms(df, baseline)
+    weights = weight_matrix(weight_profiles, list(terms.columns))
+    return weights @ terms.to_numpy().T
+
+
+def compute_greenscore(df: pd.DataFrame, weights: dict, baseline=None) -> pd.DataFrame:
     """
     Computes GreenScore using weighted sustainability & performance metrics.
 
@@ -75,31 +597,151 @@ def compute_greenscore(df: pd.DataFrame, weights: dict) -> pd.DataFrame:
     w_energy * (1 - Energy_norm) +
     w_carbon * (1 - Carbon_norm) +
     w_time * (1 - Time_norm)
+
+    Optional inference terms (weights "latency" and "inference_energy",
+    see INFERENCE_WEIGHT_COLUMNS) are added the same way when the column
+    exists. Models without an inference measurement get 0 for that term.
+    The optional "memory" weight scores the memory footprint (model size
+    plus inference working set, see MEMORY_WEIGHT_COLUMNS) likewise.
+
+    By default the metrics are min-max normalized within df. With a
+    ReferenceBaseline (see utils/baselines.py) they are normalized
+    against the dataset's stored anchors instead, so scores of
+    different runs are comparable.
+
+    Returns a copy of df with a "GreenScore" column; df is not modified.
     """
+    scored = df.copy()
+    scored["GreenScore"] = compute_greenscore_matrix(df, weights, baseline)[0]
+    return scored
 
-    # Normalize metrics
-    df["accuracy_norm"] = normalize_series(df["Accuracy"])
-    df["energy_norm"] = normalize_series(df["Energy (kWh)"])
-    df["carbon_norm"] = normalize_series(df["CO2 (tons)"])
-    df["time_norm"] = normalize_series(df["Time (s)"])
 
-    # Compute GreenScore
-    df["GreenScore"] = (
-        weights["accuracy"] * df["accuracy_norm"]
-        + weights["energy"] * (1 - df["energy_norm"])
-        + weights["carbon"] * (1 - df["carbon_norm"])
-        + weights["time"] * (1 - df["time_norm"])
+# -------------------------------------------------
+# Weight Sensitivity
+# -------------------------------------------------
+def weight_simplex(keys=("accuracy", "energy", "carbon"), step: float = 0.05) -> pd.DataFrame:
+    """
+    Grid of weight profiles over the simplex of the given keys
+    (non-negative weights summing to 1, in increments of step).
+    """
+    n = int(round(1 / step))
+    grid = [
+        combo for combo in itertools.product(range(n + 1), repeat=len(keys) - 1)
+        if sum(combo) <= n
+    ]
+    points = np.array([combo + (n - sum(combo),) for combo in grid], dtype=float) / n
+    return pd.DataFrame(points, columns=list(keys))
+
+
+def winner_map(
+    df: pd.DataFrame,
+    keys=("accuracy", "energy", "carbon"),
+    step: float = 0.05,
+    baseline=None
+) -> pd.DataFrame:
+    """
+    Best model at every point of the weight simplex of the given keys
+    (all other weights 0), optionally normalized against a baseline.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per weight profile with the weights, "Winner" and
+        "Margin" (GreenScore lead over the runner-up)
+    """
+    profiles = weight_simplex(keys, step)
+    scores = compute_greenscore_matrix(
+        df, profiles.to_dict("records"), baseline
     )
 
-    # Clean up intermediate columns
-    df.drop(
-        columns=[
-            "accuracy_norm",
-            "energy_norm",
-            "carbon_norm",
-            "time_norm",
-        ],
-        inplace=True,
+    order = np.argsort(-scores, axis=1, kind="stable")
+    best = scores[np.arange(len(scores)), order[:, 0]]
+    runner_up = (
+        scores[np.arange(len(scores)), order[:, 1]] if scores.shape[1] > 1 else best
     )
 
-    return df
+    profiles["Winner"] = df["Model"].to_numpy()[order[:, 0]]
+    profiles["Margin"] = best - runner_up
+    return profiles
+
+
+# -------------------------------------------------
+# Pareto Front
+# -------------------------------------------------
+def _dominates(a, b):
+    """
+    (len(a) x len(b)) mask: row i of a dominates row j of b.
+    """
+    # One objective at a time: much faster than reducing over a short
+    # last axis of a 3-D comparison
+    no_worse = np.ones((len(a), len(b)), dtype=bool)
+    better = np.zeros((len(a), len(b)), dtype=bool)
+    for k in range(a.shape[1]):
+        no_worse &= a[:, k, None] <= b[None, :, k]
+        better |= a[:, k, None] < b[None, :, k]
+    return no_worse & better
+
+
+def pareto_front_mask(costs) -> np.ndarray:
+    """
+    Non-dominated rows of an (N x K) cost array (lower is better).
+
+    A row is dominated if another row is no worse in every objective and
+    strictly better in at least one; identical rows never dominate each
+    other. Candidates are filtered in blocks, so the cost grows with
+    N x front size rather than N^2 when most rows are dominated.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask, True for rows on the Pareto front
+    """
+    costs = np.asarray(costs, dtype=float)
+    # Missing measurements count as the worst possible value
+    costs = np.where(np.isnan(costs), np.inf, costs)
+
+    # Ascending cost sum, ties broken column by column: a row can only be
+    # dominated by one that comes before it
+    candidates = np.lexsort(tuple(costs[:, ::-1].T) + (costs.sum(axis=1),))
+    front = []
+
+    while len(candidates):
+        # The next block's non-dominated rows are on the front (every
+        # earlier row is on the front and already filtered them) ...
+        head, rest = candidates[:_PARETO_BLOCK], candidates[_PARETO_BLOCK:]
+        head_costs = costs[head]
+        keep = ~_dominates(head_costs, head_costs).any(axis=0)
+        front.extend(head[keep])
+
+        # ... and remove everything they dominate from the rest
+        dominated = _dominates(head_costs[keep], costs[rest]).any(axis=0)
+        candidates = rest[~dominated]
+
+    mask = np.zeros(len(costs), dtype=bool)
+    mask[front] = True
+    return mask
+
+
+def mark_pareto(df: pd.DataFrame, objectives: dict = None) -> pd.DataFrame:
+    """
+    Returns a copy of df with a "Pareto Optimal" column.
+
+    Unlike GreenScore, this does not depend on the weights or on min-max
+    scaling, so adding an unrelated model never changes whether another
+    model is on the front.
+
+    Parameters
+    ----------
+    objectives : dict, optional
+        {column: higher_is_better} (default PARETO_OBJECTIVES)
+    """
+    objectives = objectives or PARETO_OBJECTIVES
+
+    costs = np.column_stack([
+        -df[column].to_numpy(dtype=float) if higher else df[column].to_numpy(dtype=float)
+        for column, higher in objectives.items()
+    ])
+
+    marked = df.copy()
+    marked[PARETO_COLUMN] = pareto_front_mask(costs)
+    return marked
@@ -0,0 +1,107 @@
+"""
+storage.py
+----------
+Concurrency-safe file writes for GreenScore.
+
+Responsibilities:
+1. Atomically replace files (write to a temp file, then rename)
+2. Serialize appends to shared files across threads and processes
+
+NOTE:
+- Several Streamlit sessions may run the pipeline at the same time,
+  readers must never observe a half-written file
+- Cross-process locking uses fcntl where available (POSIX),
+  otherwise only threads of the same process are serialized
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+_APPEND_LOCK = threading.Lock()
+
+
+# -------------------------------------------------
+# Atomic Writes
+# -------------------------------------------------
+@contextmanager
+def atomic_path(path: str):
+    """
+    Yields a temporary path next to `path` and renames it over `path`
+    once the block completes. On error the temporary file is removed
+    and `path` is left untouched.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=".tmp-", suffix=os.path.basename(path)
+    )
+    os.close(fd)
+
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_csv(df, path: str, **to_csv_kwargs) -> str:
+    """
+    Writes a DataFrame to CSV atomically.
+    """
+    to_csv_kwargs.setdefault("index", False)
+    with atomic_path(path) as tmp_path:
+        df.to_csv(tmp_path, **to_csv_kwargs)
+    return path
+
+
+def atomic_write_json(data, path: str) -> str:
+    """
+    Writes JSON-serializable data atomically.
+    """
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2, default=str)
+    return path
+
+
+# -------------------------------------------------
+# Locked Appends
+# -------------------------------------------------
+@contextmanager
+def locked_append(path: str):
+    """
+    Opens `path` for appending while holding an exclusive lock.
+
+    Yields
+    ------
+    (file object, bool)
+        The open file and whether it was empty before the append
+        (i.e. whether a header still has to be written).
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with _APPEND_LOCK:
+        with open(path, "a", newline="") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0, os.SEEK_END)
+                yield f, f.tell() == 0
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)